@@ -17,12 +17,28 @@ Compliance:
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
 
-from app.db.database import get_db
+from app.api.filters import text_search
+from app.api.pagination import Page, build_page, paginate
+from app.api.response_cache import (
+    ResponseCache,
+    compute_etag,
+    is_conditional,
+    not_modified,
+    response_select,
+    row_not_modified,
+    row_validators,
+    stream_page,
+)
+from app.db.database import get_db, get_read_db
+from app.services.cache import QueryCache, get_query_cache
 from app.db.models.capability import Capability, RiskLevel
 
 
@@ -30,7 +46,7 @@ router = APIRouter(tags=["capabilities"])
 
 
 # Pydantic Schemas
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 
 class CapabilityBase(BaseModel):
@@ -43,7 +59,12 @@ class CapabilityBase(BaseModel):
     timeout_seconds: Optional[int] = Field(None, ge=1)
     allowed_environments: List[str] = Field(default_factory=lambda: ["dev", "staging", "prod"])
     constraints: dict = Field(default_factory=dict)
-    metadata: dict = Field(default_factory=dict)
+    # "metadata" in JSON (see app.api.response_cache)
+    capability_metadata: dict = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("capability_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
 
 
 class CapabilityCreate(CapabilityBase):
@@ -61,7 +82,11 @@ class CapabilityUpdate(BaseModel):
     timeout_seconds: Optional[int] = Field(None, ge=1)
     allowed_environments: Optional[List[str]] = None
     constraints: Optional[dict] = None
-    metadata: Optional[dict] = None
+    capability_metadata: Optional[dict] = Field(
+        None,
+        validation_alias=AliasChoices("capability_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
 
 
 class CapabilityResponse(CapabilityBase):
@@ -73,12 +98,27 @@ class CapabilityResponse(CapabilityBase):
         from_attributes = True
 
 
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(Capability).options(raiseload("*"))
+
+# By-ID reads skip ORM hydration and select only the response columns
+_DETAIL_QUERY = response_select(Capability, CapabilityResponse)
+
+# Redis namespace for rendered list pages (invalidated on every write)
+_CACHE_NAMESPACE = "cap:list"
+
+# Serialized responses keyed by (id, updated_at)
+_response_cache = ResponseCache(CapabilityResponse)
+
+
 # API Endpoints
 
-@router.get("/capabilities", response_model=List[CapabilityResponse])
+@router.get("/capabilities", response_model=Page[CapabilityResponse])
 async def list_capabilities(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    cache: QueryCache = Depends(get_query_cache),
+    cursor: Optional[str] = None,
     limit: int = Query(100, ge=1, le=500),
     risk_level: Optional[RiskLevel] = None,
     requires_approval: Optional[bool] = None,
@@ -90,17 +130,36 @@ async def list_capabilities(
     List all capabilities with optional filtering.
     
     Query Parameters:
-    - skip: Number of records to skip (pagination)
+    - cursor: Opaque cursor from a previous page's next_cursor
     - limit: Maximum records to return
     - risk_level: Filter by risk level (LOW, MEDIUM, HIGH, CRITICAL)
     - requires_approval: Filter by approval requirement
     - environment: Filter by allowed environment
-    - search: Search in name/description
+    - search: Search in name/description ("term*" for a name prefix match)
     - is_active: Include only active capabilities (default: true)
     
-    Returns list of capabilities matching filters.
+    Returns a page of capabilities matching filters, newest first.
     """
-    query = select(Capability).where(Capability.is_active == is_active)
+    cache_key = cache.make_key(_CACHE_NAMESPACE, {
+        "cursor": cursor,
+        "limit": limit,
+        "risk_level": risk_level,
+        "requires_approval": requires_approval,
+        "environment": environment,
+        "search": search,
+        "is_active": is_active,
+    })
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+    
+    # Taken before the read: set() drops the page if a write invalidates meanwhile
+    generation = await cache.generation(_CACHE_NAMESPACE)
+    query = _LIST_QUERY.where(Capability.is_active == is_active)
     
     # Apply filters
     if risk_level:
@@ -114,25 +173,28 @@ async def list_capabilities(
         query = query.where(Capability.allowed_environments.contains([environment]))
     
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Capability.name.ilike(search_pattern),
-                Capability.description.ilike(search_pattern),
-            )
-        )
+        query = query.where(text_search(Capability, search))
     
-    query = query.offset(skip).limit(limit)
+    query = paginate(query, Capability, cursor, limit)
     result = await db.execute(query)
-    capabilities = result.scalars().all()
+    page = build_page(result.scalars().all(), limit)
+    
+    etag = compute_etag(page["items"], page["next_cursor"])
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    
+    async def store(body: bytes) -> None:
+        await cache.set(cache_key, etag, body, generation=generation)
     
-    return capabilities
+    return stream_page(_response_cache, page["items"], page["next_cursor"], etag, on_complete=store)
 
 
 @router.post("/capabilities", response_model=CapabilityResponse, status_code=status.HTTP_201_CREATED)
 async def create_capability(
     capability_data: CapabilityCreate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Create a new capability.
@@ -144,24 +206,27 @@ async def create_capability(
     
     Returns the created capability.
     """
-    # Check for duplicate name
-    existing = await db.execute(
-        select(Capability).where(
-            Capability.name == capability_data.name,
-            Capability.is_active == True,
+    # Single round-trip: the partial unique index on active names rejects
+    # duplicates atomically, so there is no SELECT-then-INSERT race
+    result = await db.execute(
+        insert(Capability)
+        .values(**capability_data.model_dump())
+        .on_conflict_do_nothing(
+            index_elements=[Capability.name],
+            index_where=Capability.is_active,
         )
+        .returning(Capability)
     )
-    if existing.scalars().first():
+    capability = result.scalar_one_or_none()
+    
+    if capability is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Capability '{capability_data.name}' already exists",
         )
     
-    # Create capability
-    capability = Capability(**capability_data.model_dump())
-    db.add(capability)
     await db.commit()
-    await db.refresh(capability)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return capability
 
@@ -169,17 +234,28 @@ async def create_capability(
 @router.get("/capabilities/{capability_id}", response_model=CapabilityResponse)
 async def get_capability(
     capability_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Retrieve a specific capability by ID.
     
     Returns capability details including constraints and metadata.
     """
+    # Conditional GET: compare validators against updated_at alone first
+    if is_conditional(request):
+        updated_at = await db.scalar(
+            select(Capability.updated_at).where(Capability.id == capability_id)
+        )
+        if updated_at is not None:
+            unchanged = row_not_modified(request, updated_at)
+            if unchanged is not None:
+                return unchanged
+    
     result = await db.execute(
-        select(Capability).where(Capability.id == capability_id)
+        _DETAIL_QUERY.where(Capability.id == capability_id)
     )
-    capability = result.scalars().first()
+    capability = result.first()
     
     if not capability:
         raise HTTPException(
@@ -187,7 +263,10 @@ async def get_capability(
             detail=f"Capability {capability_id} not found",
         )
     
-    return capability
+    return ORJSONResponse(
+        content=_response_cache.serialize(capability),
+        headers=row_validators(capability.updated_at),
+    )
 
 
 @router.put("/capabilities/{capability_id}", response_model=CapabilityResponse)
@@ -195,6 +274,7 @@ async def update_capability(
     capability_id: UUID,
     capability_data: CapabilityUpdate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Update an existing capability.
@@ -204,10 +284,16 @@ async def update_capability(
     
     Returns the updated capability.
     """
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no session flush
+    update_data = capability_data.model_dump(exclude_unset=True)
     result = await db.execute(
-        select(Capability).where(Capability.id == capability_id)
+        update(Capability)
+        .where(Capability.id == capability_id)
+        .values(**update_data)
+        .returning(Capability)
+        .execution_options(synchronize_session=False)
     )
-    capability = result.scalars().first()
+    capability = result.scalar_one_or_none()
     
     if not capability:
         raise HTTPException(
@@ -215,13 +301,8 @@ async def update_capability(
             detail=f"Capability {capability_id} not found",
         )
     
-    # Update only provided fields
-    update_data = capability_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(capability, field, value)
-    
     await db.commit()
-    await db.refresh(capability)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return capability
 
@@ -230,6 +311,7 @@ async def update_capability(
 async def deactivate_capability(
     capability_id: UUID,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Deactivate a capability (soft delete).
@@ -240,10 +322,7 @@ async def deactivate_capability(
     CRITICAL: Verify no active workflows depend on this capability
     before deactivation.
     """
-    result = await db.execute(
-        select(Capability).where(Capability.id == capability_id)
-    )
-    capability = result.scalars().first()
+    capability = await db.get(Capability, capability_id)
     
     if not capability:
         raise HTTPException(
@@ -253,5 +332,6 @@ async def deactivate_capability(
     
     capability.is_active = False
     await db.commit()
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return None
@@ -21,24 +21,240 @@ Compliance:
 """
 
 from uuid import UUID
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional, List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, func, insert, select, update
 from datetime import datetime
+from pydantic import AliasChoices, BaseModel, Field, ValidationInfo, field_validator
 
-from ..db.database import get_db
-from ..db.models.change_request import ChangeRequest, ChangeRequestStatus, ChangeRequestRisk
+from .pagination import Page, build_page, paginate
+from .response_cache import (
+    is_conditional,
+    json_page_body,
+    json_projection,
+    response_select,
+    row_not_modified,
+    row_validators,
+)
+from ..db.database import get_db, get_read_db
+from ..db.models.change_request import (
+    OPEN_CHANGE_STATUSES,
+    ChangeRequest,
+    ChangeRiskLevel,
+    ChangeStatus,
+    ChangeType,
+    check_document,
+)
 
 
 router = APIRouter(prefix="/change-requests", tags=["change-requests"])
 
 
-@router.get("/", response_model=List)
+class ChangeRequestCreate(BaseModel):
+    """Schema for creating change requests (fields mirror ChangeRequest columns)."""
+    change_key: str = Field(..., min_length=1, max_length=100)
+    change_type: ChangeType
+    risk_level: ChangeRiskLevel
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str = Field(..., min_length=1)
+    rationale: str = Field(..., min_length=1)
+    workflow_id: Optional[UUID] = None
+    capability_id: Optional[UUID] = None
+    control_policy_id: Optional[UUID] = None
+    requested_by: UUID
+    requested_by_email: str = Field(..., min_length=1, max_length=255)
+    scheduled_start: Optional[datetime] = None
+    scheduled_end: Optional[datetime] = None
+    change_details: dict = Field(default_factory=dict)
+    impact_assessment: dict = Field(default_factory=dict)
+    testing_evidence: dict = Field(default_factory=dict)
+    verification_required: bool = True
+    verification_criteria: List[dict] = Field(default_factory=list)
+    rollback_procedure: dict = Field(default_factory=dict)
+    # "metadata" in JSON (see app.api.response_cache)
+    change_metadata: dict = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("change_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
+
+    @field_validator("impact_assessment", "verification_criteria")
+    @classmethod
+    def _check_document(cls, value, info: ValidationInfo):
+        """Schema-check the document; the Core INSERT bypasses ChangeRequest's @validates."""
+        return check_document(info.field_name, value)
+
+
+class ChangeRequestUpdate(BaseModel):
+    """Schema for updating DRAFT change requests (all fields optional).
+    
+    change_key and the requester are fixed at creation.
+    """
+    change_type: Optional[ChangeType] = None
+    risk_level: Optional[ChangeRiskLevel] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = Field(None, min_length=1)
+    rationale: Optional[str] = Field(None, min_length=1)
+    workflow_id: Optional[UUID] = None
+    capability_id: Optional[UUID] = None
+    control_policy_id: Optional[UUID] = None
+    scheduled_start: Optional[datetime] = None
+    scheduled_end: Optional[datetime] = None
+    change_details: Optional[dict] = None
+    impact_assessment: Optional[dict] = None
+    testing_evidence: Optional[dict] = None
+    verification_required: Optional[bool] = None
+    verification_criteria: Optional[List[dict]] = None
+    rollback_procedure: Optional[dict] = None
+    change_metadata: Optional[dict] = Field(
+        None,
+        validation_alias=AliasChoices("change_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
+
+    @field_validator("impact_assessment", "verification_criteria")
+    @classmethod
+    def _check_document(cls, value, info: ValidationInfo):
+        """Schema-check the document; the Core UPDATE bypasses ChangeRequest's @validates."""
+        return check_document(info.field_name, value)
+
+
+class ChangeRequestApproval(BaseModel):
+    """Schema for approving a change request."""
+    approver_id: UUID
+    approver_email: Optional[str] = Field(None, max_length=255)
+    approval_notes: str = Field(..., min_length=1)
+
+
+class ChangeRequestRejection(BaseModel):
+    """Schema for rejecting a change request."""
+    rejection_reason: str = Field(..., min_length=1)
+    rejected_by: UUID
+
+
+class ChangeRequestValidation(BaseModel):
+    """Schema for recording post-change verification."""
+    verification_passed: bool
+    verification_results: dict = Field(default_factory=dict)
+
+
+class ChangeRequestResponse(BaseModel):
+    """Schema for change request responses.
+    
+    Only scalar columns are declared, so serialization never touches the
+    workflow/capability/control_policy relationships.
+    """
+    id: UUID
+    change_key: str
+    change_type: ChangeType
+    risk_level: ChangeRiskLevel
+    status: ChangeStatus
+    title: str
+    description: str
+    rationale: str
+    workflow_id: Optional[UUID] = None
+    capability_id: Optional[UUID] = None
+    control_policy_id: Optional[UUID] = None
+    requested_by: UUID
+    requested_by_email: str
+    requested_at: datetime
+    reviewer_id: Optional[UUID] = None
+    reviewed_at: Optional[datetime] = None
+    approver_id: Optional[UUID] = None
+    approved_at: Optional[datetime] = None
+    rejected_by: Optional[UUID] = None
+    rejected_at: Optional[datetime] = None
+    scheduled_start: Optional[datetime] = None
+    scheduled_end: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# List base statement, built once at import (see app.api.pagination).
+# List pages are serialized by PostgreSQL: each row comes back as one JSON
+# text document plus the keyset columns needed for the next cursor, so no
+# ORM object or Python dict is built per row.
+_LIST_JSON_QUERY = select(
+    ChangeRequest.created_at,
+    ChangeRequest.id,
+    json_projection(ChangeRequest, ChangeRequestResponse).label("document"),
+)
+
+# By-ID reads skip ORM hydration and select only the response columns
+_DETAIL_QUERY = response_select(ChangeRequest, ChangeRequestResponse)
+
+# Writes return the same columns: RETURNING ChangeRequest would also ship
+# the large (often TOASTed) JSONB documents - change_details,
+# impact_assessment, testing_evidence, verification_*, metadata - that
+# the response never reads
+_RETURNING_COLUMNS = tuple(_DETAIL_QUERY.selected_columns)
+
+# Database clock for the naive (UTC) timestamp columns; the timezone-aware
+# decision columns (approved_at, rejected_at) take func.now() directly
+_UTC_NOW = func.timezone('UTC', func.now())
+
+
+async def _guarded_update(
+    db: AsyncSession,
+    request_id: UUID,
+    expected_status: ChangeStatus,
+    status_detail: str,
+    values: dict,
+    guards: Tuple[ColumnElement, ...] = (),
+) -> Row:
+    """Apply an update as a single guarded UPDATE ... RETURNING.
+    
+    The expected current status (and any further guards) lives in the
+    WHERE clause, so the check and the write happen atomically in one
+    round-trip and two concurrent approvers cannot both move the same
+    request.
+    
+    On a miss, the row is looked up once to report 404 vs. 400.
+    """
+    result = await db.execute(
+        update(ChangeRequest)
+        .where(
+            ChangeRequest.id == request_id,
+            ChangeRequest.status == expected_status,
+            *guards,
+        )
+        .values(**values)
+        .returning(*_RETURNING_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    change_request = result.first()
+    
+    if change_request is None:
+        await db.rollback()
+        current_status = await db.scalar(
+            select(ChangeRequest.status).where(ChangeRequest.id == request_id)
+        )
+        if current_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Change request {request_id} not found",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=status_detail,
+        )
+    
+    await db.commit()
+    return change_request
+
+
+@router.get("/", response_model=Page[ChangeRequestResponse])
 async def list_change_requests(
-    status_filter: Optional[ChangeRequestStatus] = None,
-    risk_filter: Optional[ChangeRequestRisk] = None,
-    db: AsyncSession = Depends(get_db),
+    status_filter: Optional[ChangeStatus] = None,
+    risk_filter: Optional[ChangeRiskLevel] = None,
+    open_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List all change requests with filtering.
@@ -46,10 +262,19 @@ async def list_change_requests(
     FLAGSHIP: Change requests implement multi-stage approval for
     production modifications.
     
-    Status flow: DRAFT → PENDING_APPROVAL → APPROVED → IMPLEMENTED → VALIDATED
+    Status flow: DRAFT → PENDING_APPROVAL → APPROVED → COMPLETED (or REJECTED / FAILED)
     Risk levels: LOW, MEDIUM, HIGH, CRITICAL
+    
+    open_only restricts results to changes not yet in a terminal state
+    (served by the partial idx_change_open index).
+    
+    Results are returned newest first; pass next_cursor back as
+    cursor to fetch the following page.
     """
-    query = select(ChangeRequest).where(ChangeRequest.is_active == True)
+    query = _LIST_JSON_QUERY
+    
+    if open_only:
+        query = query.where(ChangeRequest.status.in_(OPEN_CHANGE_STATUSES))
     
     if status_filter:
         query = query.where(ChangeRequest.status == status_filter)
@@ -57,14 +282,16 @@ async def list_change_requests(
     if risk_filter:
         query = query.where(ChangeRequest.risk_level == risk_filter)
     
-    query = query.order_by(ChangeRequest.created_at.desc())
+    query = paginate(query, ChangeRequest, cursor, limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    page = build_page(result.all(), limit)
+    body = json_page_body((row.document for row in page["items"]), page["next_cursor"])
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=ChangeRequestResponse, status_code=status.HTTP_201_CREATED)
 async def create_change_request(
-    request_data: dict,
+    request_data: ChangeRequestCreate,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -73,35 +300,57 @@ async def create_change_request(
     FLAGSHIP: All production changes MUST go through this workflow.
     
     Required fields:
-    - description: What is changing
-    - justification: Why this change is needed
+    - change_key: Unique identifier of the change
+    - change_type: What kind of change (see ChangeType)
     - risk_level: Impact assessment (LOW/MEDIUM/HIGH/CRITICAL)
-    - rollback_plan: How to undo if issues arise
-    - affected_workflows: Which workflows are impacted
+    - title, description: What is changing
+    - rationale: Why this change is needed
+    - requested_by, requested_by_email: Who is asking
+    
+    The workflow, capability or control policy it touches, the execution
+    window, impact assessment and rollback_procedure are optional here
+    and can be completed while the request is a DRAFT.
     
     CRITICAL: HIGH/CRITICAL risk requires senior approval.
     """
-    change_request = ChangeRequest(**request_data)
-    change_request.status = ChangeRequestStatus.DRAFT
+    # INSERT ... RETURNING hydrates server defaults without a refresh SELECT
+    result = await db.execute(
+        insert(ChangeRequest)
+        .values(**request_data.model_dump(), status=ChangeStatus.DRAFT)
+        .returning(*_RETURNING_COLUMNS)
+    )
+    change_request = result.one()
     
-    db.add(change_request)
     await db.commit()
-    await db.refresh(change_request)
     return change_request
 
 
-@router.get("/{request_id}")
+@router.get("/{request_id}", response_model=ChangeRequestResponse)
 async def get_change_request(
     request_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a specific change request by ID.
+    
+    Supports conditional GET (If-None-Match / If-Modified-Since).
     """
+    # Conditional GET: compare validators against updated_at alone first
+    if is_conditional(request):
+        updated_at = await db.scalar(
+            select(ChangeRequest.updated_at).where(ChangeRequest.id == request_id)
+        )
+        if updated_at is not None:
+            unchanged = row_not_modified(request, updated_at)
+            if unchanged is not None:
+                return unchanged
+    
     result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+        _DETAIL_QUERY.where(ChangeRequest.id == request_id)
     )
-    change_request = result.scalars().first()
+    change_request = result.first()
     
     if not change_request:
         raise HTTPException(
@@ -109,13 +358,14 @@ async def get_change_request(
             detail=f"Change request {request_id} not found",
         )
     
+    response.headers.update(row_validators(change_request.updated_at))
     return change_request
 
 
-@router.put("/{request_id}")
+@router.put("/{request_id}", response_model=ChangeRequestResponse)
 async def update_change_request(
     request_id: UUID,
-    update_data: dict,
+    update_data: ChangeRequestUpdate,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -124,34 +374,17 @@ async def update_change_request(
     Only DRAFT requests can be modified.
     Use approval/rejection endpoints for status changes.
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.DRAFT,
+        status_detail="Can only modify DRAFT change requests",
+        # Explicit nulls are ignored so a DRAFT can never lose required fields
+        values=update_data.model_dump(exclude_unset=True, exclude_none=True),
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.DRAFT:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only modify DRAFT change requests",
-        )
-    
-    # Update fields
-    for field, value in update_data.items():
-        setattr(change_request, field, value)
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
 
 
-@router.post("/{request_id}/submit", status_code=status.HTTP_200_OK)
+@router.post("/{request_id}/submit", response_model=ChangeRequestResponse, status_code=status.HTTP_200_OK)
 async def submit_for_approval(
     request_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -162,47 +395,23 @@ async def submit_for_approval(
     FLAGSHIP: Moves from DRAFT → PENDING_APPROVAL.
     
     Validation:
-    - Must have description, justification, risk_level, rollback_plan
+    - title, description, rationale, risk_level are enforced by
+      ChangeRequestCreate/ChangeRequestUpdate, so DRAFTs are complete
     - HIGH/CRITICAL risk triggers senior approval workflow
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.DRAFT,
+        status_detail="Can only submit DRAFT requests",
+        values={"status": ChangeStatus.PENDING_APPROVAL},
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.DRAFT:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only submit DRAFT requests",
-        )
-    
-    # Validate required fields
-    if not all([change_request.description, change_request.justification, 
-                change_request.risk_level, change_request.rollback_plan]):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required fields for submission",
-        )
-    
-    change_request.status = ChangeRequestStatus.PENDING_APPROVAL
-    change_request.submitted_at = datetime.utcnow()
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
 
 
-@router.post("/{request_id}/approve", status_code=status.HTTP_200_OK)
+@router.post("/{request_id}/approve", response_model=ChangeRequestResponse, status_code=status.HTTP_200_OK)
 async def approve_change_request(
     request_id: UUID,
-    approval_data: dict,
+    approval_data: ChangeRequestApproval,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -211,43 +420,30 @@ async def approve_change_request(
     FLAGSHIP: Moves from PENDING_APPROVAL → APPROVED.
     
     Required:
-    - approver_id: Who approved
+    - approver_id: Who approved (approver_email is optional)
     - approval_notes: Justification for approval
     
     CRITICAL: HIGH/CRITICAL changes require senior/C-level approval.
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.PENDING_APPROVAL,
+        status_detail="Can only approve PENDING_APPROVAL requests",
+        values={
+            "status": ChangeStatus.APPROVED,
+            "approved_at": func.now(),
+            "approver_id": approval_data.approver_id,
+            "approver_email": approval_data.approver_email,
+            "approval_notes": approval_data.approval_notes,
+        },
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only approve PENDING_APPROVAL requests",
-        )
-    
-    change_request.status = ChangeRequestStatus.APPROVED
-    change_request.approved_at = datetime.utcnow()
-    change_request.approved_by = approval_data.get("approver_id")
-    change_request.approval_notes = approval_data.get("approval_notes")
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
 
 
-@router.post("/{request_id}/reject", status_code=status.HTTP_200_OK)
+@router.post("/{request_id}/reject", response_model=ChangeRequestResponse, status_code=status.HTTP_200_OK)
 async def reject_change_request(
     request_id: UUID,
-    rejection_data: dict,
+    rejection_data: ChangeRequestRejection,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -261,118 +457,74 @@ async def reject_change_request(
     
     Rejected requests can be revised and resubmitted.
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.PENDING_APPROVAL,
+        status_detail="Can only reject PENDING_APPROVAL requests",
+        values={
+            "status": ChangeStatus.REJECTED,
+            "rejected_at": func.now(),
+            "rejection_reason": rejection_data.rejection_reason,
+            "rejected_by": rejection_data.rejected_by,
+        },
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only reject PENDING_APPROVAL requests",
-        )
-    
-    change_request.status = ChangeRequestStatus.REJECTED
-    change_request.rejection_reason = rejection_data.get("rejection_reason")
-    change_request.rejected_by = rejection_data.get("rejected_by")
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
 
 
-@router.post("/{request_id}/implement", status_code=status.HTTP_200_OK)
+@router.post("/{request_id}/implement", response_model=ChangeRequestResponse, status_code=status.HTTP_200_OK)
 async def mark_implemented(
     request_id: UUID,
-    implementation_data: dict,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Mark change request as implemented.
     
-    FLAGSHIP: Moves from APPROVED → IMPLEMENTED.
-    
-    Required:
-    - implemented_by: Who executed the change
-    - implementation_notes: What was done
+    FLAGSHIP: Moves from APPROVED → COMPLETED.
     
-    Next step: Validation testing required.
+    Next step: Post-change verification (validate).
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.APPROVED,
+        status_detail="Can only implement APPROVED requests",
+        values={
+            "status": ChangeStatus.COMPLETED,
+            # The execution columns are naive UTC (see is_within_execution_window)
+            "execution_started_at": func.coalesce(ChangeRequest.execution_started_at, _UTC_NOW),
+            "execution_completed_at": _UTC_NOW,
+        },
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.APPROVED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only implement APPROVED requests",
-        )
-    
-    change_request.status = ChangeRequestStatus.IMPLEMENTED
-    change_request.implemented_at = datetime.utcnow()
-    change_request.implemented_by = implementation_data.get("implemented_by")
-    change_request.implementation_notes = implementation_data.get("implementation_notes")
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
 
 
-@router.post("/{request_id}/validate", status_code=status.HTTP_200_OK)
+@router.post("/{request_id}/validate", response_model=ChangeRequestResponse, status_code=status.HTTP_200_OK)
 async def mark_validated(
     request_id: UUID,
-    validation_data: dict,
+    validation_data: ChangeRequestValidation,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Mark change request as validated.
+    Record post-change verification.
     
-    FLAGSHIP: Moves from IMPLEMENTED → VALIDATED.
+    FLAGSHIP: Only COMPLETED changes not yet verified. A failed
+    verification moves the change to FAILED.
     
     Final step: Confirms change worked as expected.
     
     Required:
-    - validated_by: Who tested
-    - validation_notes: Test results
+    - verification_passed: Outcome of the checks
+    - verification_results: Test results (optional)
     """
-    result = await db.execute(
-        select(ChangeRequest).where(ChangeRequest.id == request_id)
+    return await _guarded_update(
+        db,
+        request_id,
+        expected_status=ChangeStatus.COMPLETED,
+        status_detail="Can only validate COMPLETED, unverified requests",
+        values={
+            "status": ChangeStatus.COMPLETED if validation_data.verification_passed else ChangeStatus.FAILED,
+            "verification_completed": True,
+            "verification_passed": validation_data.verification_passed,
+            "verification_results": validation_data.verification_results,
+        },
+        guards=(ChangeRequest.verification_completed.is_(False),),
     )
-    change_request = result.scalars().first()
-    
-    if not change_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Change request {request_id} not found",
-        )
-    
-    if change_request.status != ChangeRequestStatus.IMPLEMENTED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only validate IMPLEMENTED requests",
-        )
-    
-    change_request.status = ChangeRequestStatus.VALIDATED
-    change_request.validated_at = datetime.utcnow()
-    change_request.validated_by = validation_data.get("validated_by")
-    change_request.validation_notes = validation_data.get("validation_notes")
-    
-    await db.commit()
-    await db.refresh(change_request)
-    
-    return change_request
@@ -17,12 +17,28 @@ Compliance:
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
 
-from app.db.database import get_db
+from app.api.filters import text_search
+from app.api.pagination import Page, build_page, paginate
+from app.api.response_cache import (
+    ResponseCache,
+    compute_etag,
+    is_conditional,
+    not_modified,
+    response_select,
+    row_not_modified,
+    row_validators,
+    stream_page,
+)
+from app.db.database import get_db, get_read_db
+from app.services.cache import QueryCache, get_query_cache
 from app.db.models.connector import Connector, ConnectorType
 from pydantic import BaseModel, Field
 
@@ -68,10 +84,25 @@ class ConnectorResponse(ConnectorBase):
         from_attributes = True
 
 
-@router.get("/connectors", response_model=List[ConnectorResponse])
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(Connector).options(raiseload("*"))
+
+# By-ID reads skip ORM hydration and select only the response columns
+_DETAIL_QUERY = response_select(Connector, ConnectorResponse)
+
+# Redis namespace for rendered list pages (invalidated on every write)
+_CACHE_NAMESPACE = "conn:list"
+
+# Serialized responses keyed by (id, updated_at)
+_response_cache = ResponseCache(ConnectorResponse)
+
+
+@router.get("/connectors", response_model=Page[ConnectorResponse])
 async def list_connectors(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    cache: QueryCache = Depends(get_query_cache),
+    cursor: Optional[str] = None,
     limit: int = Query(100, ge=1, le=500),
     connector_type: Optional[ConnectorType] = None,
     requires_auth: Optional[bool] = None,
@@ -81,9 +112,30 @@ async def list_connectors(
     """
     List all connectors with filtering.
     
+    Results are returned newest first; pass next_cursor back as
+    cursor to fetch the following page.
+    
     SECURITY: Credentials are never returned in list/get responses.
     """
-    query = select(Connector).where(Connector.is_active == is_active)
+    cache_key = cache.make_key(_CACHE_NAMESPACE, {
+        "cursor": cursor,
+        "limit": limit,
+        "connector_type": connector_type,
+        "requires_auth": requires_auth,
+        "search": search,
+        "is_active": is_active,
+    })
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+    
+    # Taken before the read: set() drops the page if a write invalidates meanwhile
+    generation = await cache.generation(_CACHE_NAMESPACE)
+    query = _LIST_QUERY.where(Connector.is_active == is_active)
     
     if connector_type:
         query = query.where(Connector.connector_type == connector_type)
@@ -92,25 +144,28 @@ async def list_connectors(
         query = query.where(Connector.requires_auth == requires_auth)
     
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Connector.name.ilike(search_pattern),
-                Connector.description.ilike(search_pattern),
-            )
-        )
+        query = query.where(text_search(Connector, search))
     
-    query = query.offset(skip).limit(limit)
+    query = paginate(query, Connector, cursor, limit)
     result = await db.execute(query)
-    connectors = result.scalars().all()
+    page = build_page(result.scalars().all(), limit)
     
-    return connectors
+    etag = compute_etag(page["items"], page["next_cursor"])
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    
+    async def store(body: bytes) -> None:
+        await cache.set(cache_key, etag, body, generation=generation)
+    
+    return stream_page(_response_cache, page["items"], page["next_cursor"], etag, on_complete=store)
 
 
 @router.post("/connectors", response_model=ConnectorResponse, status_code=status.HTTP_201_CREATED)
 async def create_connector(
     connector_data: ConnectorCreate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Create a new connector.
@@ -118,23 +173,27 @@ async def create_connector(
     SECURITY: Credentials are encrypted before storage.
     Never logged or exposed in responses.
     """
-    # Check duplicate name
-    existing = await db.execute(
-        select(Connector).where(
-            Connector.name == connector_data.name,
-            Connector.is_active == True,
+    # Single round-trip: the partial unique index on active names rejects
+    # duplicates atomically, so there is no SELECT-then-INSERT race
+    result = await db.execute(
+        insert(Connector)
+        .values(**connector_data.model_dump())
+        .on_conflict_do_nothing(
+            index_elements=[Connector.name],
+            index_where=Connector.is_active,
         )
+        .returning(Connector)
     )
-    if existing.scalars().first():
+    connector = result.scalar_one_or_none()
+    
+    if connector is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Connector '{connector_data.name}' already exists",
         )
     
-    connector = Connector(**connector_data.model_dump())
-    db.add(connector)
     await db.commit()
-    await db.refresh(connector)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return connector
 
@@ -142,13 +201,24 @@ async def create_connector(
 @router.get("/connectors/{connector_id}", response_model=ConnectorResponse)
 async def get_connector(
     connector_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Retrieve connector details (credentials excluded)."""
+    # Conditional GET: compare validators against updated_at alone first
+    if is_conditional(request):
+        updated_at = await db.scalar(
+            select(Connector.updated_at).where(Connector.id == connector_id)
+        )
+        if updated_at is not None:
+            unchanged = row_not_modified(request, updated_at)
+            if unchanged is not None:
+                return unchanged
+    
     result = await db.execute(
-        select(Connector).where(Connector.id == connector_id)
+        _DETAIL_QUERY.where(Connector.id == connector_id)
     )
-    connector = result.scalars().first()
+    connector = result.first()
     
     if not connector:
         raise HTTPException(
@@ -156,7 +226,10 @@ async def get_connector(
             detail=f"Connector {connector_id} not found",
         )
     
-    return connector
+    return ORJSONResponse(
+        content=_response_cache.serialize(connector),
+        headers=row_validators(connector.updated_at),
+    )
 
 
 @router.put("/connectors/{connector_id}", response_model=ConnectorResponse)
@@ -164,12 +237,19 @@ async def update_connector(
     connector_id: UUID,
     connector_data: ConnectorUpdate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """Update connector configuration."""
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no session flush
+    update_data = connector_data.model_dump(exclude_unset=True)
     result = await db.execute(
-        select(Connector).where(Connector.id == connector_id)
+        update(Connector)
+        .where(Connector.id == connector_id)
+        .values(**update_data)
+        .returning(Connector)
+        .execution_options(synchronize_session=False)
     )
-    connector = result.scalars().first()
+    connector = result.scalar_one_or_none()
     
     if not connector:
         raise HTTPException(
@@ -177,12 +257,8 @@ async def update_connector(
             detail=f"Connector {connector_id} not found",
         )
     
-    update_data = connector_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(connector, field, value)
-    
     await db.commit()
-    await db.refresh(connector)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return connector
 
@@ -191,6 +267,7 @@ async def update_connector(
 async def deactivate_connector(
     connector_id: UUID,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Deactivate a connector (soft delete).
@@ -198,10 +275,7 @@ async def deactivate_connector(
     CRITICAL: Verify no active workflows depend on this connector.
     Credentials remain encrypted in DB for audit trail.
     """
-    result = await db.execute(
-        select(Connector).where(Connector.id == connector_id)
-    )
-    connector = result.scalars().first()
+    connector = await db.get(Connector, connector_id)
     
     if not connector:
         raise HTTPException(
@@ -211,5 +285,6 @@ async def deactivate_connector(
     
     connector.is_active = False
     await db.commit()
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return None
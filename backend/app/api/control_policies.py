@@ -33,17 +33,25 @@ Compliance: SOC 2 CC3.1, ISO 27001rcement
 - ISO 27001: Security policy management
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
 
-from app.db.database import get_db
-from app.db.models.control_policy import ControlPolicy, PolicyOutcome
-from pydantic import BaseModel, Field
+from app.api.filters import text_search
+from app.api.pagination import Page, build_page, paginate
+from app.api.response_cache import ResponseCache, compute_etag, not_modified
+from app.db.database import async_session_maker, get_db, get_read_db
+from app.services.cache import QueryCache, get_query_cache
+from app.db.models.control_policy import ControlPolicy, PolicyAction
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
 
 
 router = APIRouter(tags=["control-policies"])
@@ -53,10 +61,20 @@ class ControlPolicyBase(BaseModel):
     """Base control policy schema."""
     name: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = None
-    outcome: PolicyOutcome
+    # "outcome" in JSON (see app.api.response_cache)
+    policy_action: PolicyAction = Field(
+        ...,
+        validation_alias=AliasChoices("policy_action", "outcome"),
+        serialization_alias="outcome",
+    )
     conditions: dict = Field(..., description="JSON conditions for policy evaluation")
     priority: int = Field(default=100, ge=0, le=1000)
-    metadata: dict = Field(default_factory=dict)
+    # "metadata" in JSON (see app.api.response_cache)
+    policy_metadata: dict = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("policy_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
 
 
 class ControlPolicyCreate(ControlPolicyBase):
@@ -68,10 +86,18 @@ class ControlPolicyUpdate(BaseModel):
     """Schema for updating control policies."""
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = None
-    outcome: Optional[PolicyOutcome] = None
+    policy_action: Optional[PolicyAction] = Field(
+        None,
+        validation_alias=AliasChoices("policy_action", "outcome"),
+        serialization_alias="outcome",
+    )
     conditions: Optional[dict] = None
     priority: Optional[int] = Field(None, ge=0, le=1000)
-    metadata: Optional[dict] = None
+    policy_metadata: Optional[dict] = Field(
+        None,
+        validation_alias=AliasChoices("policy_metadata", "metadata"),
+        serialization_alias="metadata",
+    )
 
 
 class ControlPolicyResponse(ControlPolicyBase):
@@ -83,12 +109,33 @@ class ControlPolicyResponse(ControlPolicyBase):
         from_attributes = True
 
 
-@router.get("/control-policies", response_model=List[ControlPolicyResponse])
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(ControlPolicy).options(raiseload("*"))
+
+# Redis namespace for rendered list responses (invalidated on every write).
+# Policies are read on every gate check but change rarely.
+_CACHE_NAMESPACE = "policy:list"
+_CACHE_TTL_SECONDS = 30
+
+# Serialized responses keyed by (id, updated_at)
+_response_cache = ResponseCache(ControlPolicyResponse)
+
+# Exports bypass the response cache so a full dump does not evict hot entries
+_export_adapter = TypeAdapter(List[ControlPolicyResponse])
+
+# Rows fetched from the server-side cursor (and encoded) per batch
+EXPORT_BATCH_SIZE = 64
+
+
+@router.get("/control-policies", response_model=Page[ControlPolicyResponse])
 async def list_control_policies(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    cache: QueryCache = Depends(get_query_cache),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(100, ge=1, le=500),
-    outcome: Optional[PolicyOutcome] = None,
+    outcome: Optional[PolicyAction] = None,
     search: Optional[str] = None,
     is_active: bool = True,
 ):
@@ -98,38 +145,65 @@ async def list_control_policies(
     Policies are evaluated in priority order (lower number = higher priority).
     
     Query Parameters:
-    - skip: Pagination offset
+    - cursor: Opaque cursor from a previous page's next_cursor
+    - skip: Deprecated offset, ignored when cursor is given
     - limit: Maximum records to return
     - outcome: Filter by ALLOW/DENY/REVIEW
-    - search: Search in name/description
+    - search: Search in name/description ("term*" for a name prefix match)
     - is_active: Include only active policies
     """
-    query = select(ControlPolicy).where(ControlPolicy.is_active == is_active)
+    cache_key = cache.make_key(_CACHE_NAMESPACE, {
+        "cursor": cursor,
+        "skip": skip,
+        "limit": limit,
+        "outcome": outcome,
+        "search": search,
+        "is_active": is_active,
+    })
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+    
+    # Taken before the read: set() drops the page if a write invalidates meanwhile
+    generation = await cache.generation(_CACHE_NAMESPACE)
+    query = _LIST_QUERY.where(ControlPolicy.is_active == is_active)
     
     if outcome:
-        query = query.where(ControlPolicy.outcome == outcome)
+        query = query.where(ControlPolicy.policy_action == outcome)
     
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                ControlPolicy.name.ilike(search_pattern),
-                ControlPolicy.description.ilike(search_pattern),
-            )
-        )
+        query = query.where(text_search(ControlPolicy, search))
     
-    # Order by priority (lower = higher priority)
-    query = query.order_by(ControlPolicy.priority.asc()).offset(skip).limit(limit)
+    # Order by priority (lower = higher priority), keyset on (priority, id)
+    query = paginate(query, ControlPolicy, cursor, limit, sort_column=ControlPolicy.priority, descending=False)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    policies = result.scalars().all()
+    page = build_page(result.scalars().all(), limit, sort_attr="priority")
+    
+    etag = compute_etag(page["items"], page["next_cursor"])
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     
-    return policies
+    body = orjson.dumps({
+        "items": _response_cache.serialize_many(page["items"]),
+        "next_cursor": page["next_cursor"],
+    })
+    await cache.set(cache_key, etag, body, ttl_seconds=_CACHE_TTL_SECONDS, generation=generation)
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/control-policies", response_model=ControlPolicyResponse, status_code=status.HTTP_201_CREATED)
 async def create_control_policy(
     policy_data: ControlPolicyCreate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Create a new control policy.
@@ -141,37 +215,78 @@ async def create_control_policy(
     
     Conditions are evaluated against operation context.
     """
-    # Check duplicate name
-    existing = await db.execute(
-        select(ControlPolicy).where(
-            ControlPolicy.name == policy_data.name,
-            ControlPolicy.is_active == True,
+    # Single round-trip: the partial unique index on active names rejects
+    # duplicates atomically, so there is no SELECT-then-INSERT race
+    result = await db.execute(
+        insert(ControlPolicy)
+        .values(**policy_data.model_dump())
+        .on_conflict_do_nothing(
+            index_elements=[ControlPolicy.name],
+            index_where=ControlPolicy.is_active,
         )
+        .returning(ControlPolicy)
     )
-    if existing.scalars().first():
+    policy = result.scalar_one_or_none()
+    
+    if policy is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Control policy '{policy_data.name}' already exists",
         )
     
-    policy = ControlPolicy(**policy_data.model_dump())
-    db.add(policy)
     await db.commit()
-    await db.refresh(policy)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return policy
 
 
+@router.get("/control-policies/export")
+async def export_control_policies(
+    outcome: Optional[PolicyAction] = None,
+    is_active: bool = True,
+):
+    """
+    Export all matching control policies as newline-delimited JSON.
+    
+    Rows are read from a server-side cursor in batches and streamed as
+    they arrive, so memory is bounded by the batch size, not the table.
+    Use this instead of paging through the list endpoint for bulk reads.
+    
+    Query Parameters:
+    - outcome: Filter by ALLOW/DENY/REVIEW
+    - is_active: Include only active policies
+    """
+    query = _LIST_QUERY.where(ControlPolicy.is_active == is_active)
+    if outcome:
+        query = query.where(ControlPolicy.policy_action == outcome)
+    query = query.order_by(ControlPolicy.priority.asc(), ControlPolicy.id.asc())
+    
+    async def lines() -> AsyncIterator[bytes]:
+        # The session is opened inside the generator: dependency teardown
+        # runs before a streamed body is sent. Server-side cursors need a
+        # transaction, so this uses the regular (non-autocommit) factory.
+        async with async_session_maker() as db:
+            result = await db.stream_scalars(
+                query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                rows = _export_adapter.dump_python(
+                    _export_adapter.validate_python(batch, from_attributes=True),
+                    mode="json",
+                    by_alias=True,
+                )
+                yield b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/control-policies/{policy_id}", response_model=ControlPolicyResponse)
 async def get_control_policy(
     policy_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Retrieve specific control policy details."""
-    result = await db.execute(
-        select(ControlPolicy).where(ControlPolicy.id == policy_id)
-    )
-    policy = result.scalars().first()
+    policy = await db.get(ControlPolicy, policy_id)
     
     if not policy:
         raise HTTPException(
@@ -187,6 +302,7 @@ async def update_control_policy(
     policy_id: UUID,
     policy_data: ControlPolicyUpdate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Update control policy configuration.
@@ -194,10 +310,15 @@ async def update_control_policy(
     CAUTION: Changing policy outcomes or conditions affects
     all operations evaluated against this policy.
     """
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no refresh round trip
     result = await db.execute(
-        select(ControlPolicy).where(ControlPolicy.id == policy_id)
+        update(ControlPolicy)
+        .where(ControlPolicy.id == policy_id)
+        .values(**policy_data.model_dump(exclude_unset=True))
+        .returning(ControlPolicy)
+        .execution_options(synchronize_session=False)
     )
-    policy = result.scalars().first()
+    policy = result.scalar_one_or_none()
     
     if not policy:
         raise HTTPException(
@@ -205,12 +326,8 @@ async def update_control_policy(
             detail=f"Control policy {policy_id} not found",
         )
     
-    update_data = policy_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(policy, field, value)
-    
     await db.commit()
-    await db.refresh(policy)
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return policy
 
@@ -219,6 +336,7 @@ async def update_control_policy(
 async def deactivate_control_policy(
     policy_id: UUID,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Deactivate a control policy (soft delete).
@@ -228,10 +346,7 @@ async def deactivate_control_policy(
     
     CRITICAL: Test impact before deactivating production policies.
     """
-    result = await db.execute(
-        select(ControlPolicy).where(ControlPolicy.id == policy_id)
-    )
-    policy = result.scalars().first()
+    policy = await db.get(ControlPolicy, policy_id)
     
     if not policy:
         raise HTTPException(
@@ -241,5 +356,6 @@ async def deactivate_control_policy(
     
     policy.is_active = False
     await db.commit()
+    await cache.invalidate(_CACHE_NAMESPACE)
     
     return None
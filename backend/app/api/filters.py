@@ -0,0 +1,36 @@
+"""Shared Query Filters
+
+Text search used by the registry list endpoints. Two shapes, each backed
+by its own index:
+
+- "term*" (trailing asterisk): prefix match on name only,
+  `lower(name) LIKE 'term%'`, served by a B-tree
+  `lower(name) text_pattern_ops` index.
+- "term": substring match on name or description,
+  `lower(col) LIKE '%term%'`, served by pg_trgm GIN expression indexes.
+
+User-supplied LIKE wildcards are escaped so they match literally.
+"""
+
+from typing import Any
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE metacharacters so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def text_search(model: Any, search: str) -> ColumnElement:
+    """Build the WHERE clause for a name/description search."""
+    if search.endswith("*"):
+        prefix = _escape_like(search.rstrip("*").lower())
+        return func.lower(model.name).like(f"{prefix}%", escape="\\")
+
+    pattern = f"%{_escape_like(search.lower())}%"
+    return or_(
+        func.lower(model.name).like(pattern, escape="\\"),
+        func.lower(model.description).like(pattern, escape="\\"),
+    )
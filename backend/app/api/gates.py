@@ -0,0 +1,95 @@
+"""Enforcement Gates API Router
+
+Provides the runtime endpoint that fires an enforcement gate: the gate's
+kill switches and control policies are evaluated in one round trip
+(evaluate_gate), and the execution is recorded through the batched
+GateExecutionBuffer rather than an INSERT on the request path.
+
+NIST AI RMF Mapping:
+- GOVERN-4.1: AI system operation constraints
+- MANAGE-2.1: Risk-based decision making
+
+Compliance:
+- SOC 2 CC7.2: System monitoring and control
+"""
+
+import time
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.database import get_read_db
+from ..db.models.enforcement_gate import GateExecutionRow, GateOutcome
+from ..services.gate_evaluation import evaluate_gate
+from ..services.gate_execution_buffer import GateExecutionBuffer, get_gate_execution_buffer
+
+
+router = APIRouter(prefix="/gates", tags=["gates"])
+
+
+class GateEvaluationRequest(BaseModel):
+    """Schema for firing a gate."""
+    execution_id: UUID
+    actor_id: UUID
+    actor_type: str = Field(..., min_length=1, max_length=50)
+    request_id: Optional[str] = Field(None, max_length=100)
+    context: dict = Field(default_factory=dict)
+
+
+class GateEvaluationResponse(BaseModel):
+    """Schema for a gate evaluation result."""
+    gate_id: UUID
+    gate_key: str
+    outcome: GateOutcome
+    kill_switch_id: Optional[UUID] = None
+    applicable_policy_ids: List[UUID]
+    failed_policy_ids: List[UUID]
+
+
+@router.post("/{gate_id}/evaluate", response_model=GateEvaluationResponse, status_code=status.HTTP_200_OK)
+async def evaluate(
+    gate_id: UUID,
+    request_data: GateEvaluationRequest,
+    db: AsyncSession = Depends(get_read_db),
+    buffer: GateExecutionBuffer = Depends(get_gate_execution_buffer),
+):
+    """
+    Fire an enforcement gate against a request context.
+
+    Kill switches are checked first (HARD_STOP, then DEGRADE), then the
+    gate's active control policies. The execution is queued for the
+    batched history write; the response does not wait for it.
+    """
+    executed_at = datetime.utcnow()
+    started = time.perf_counter()
+    evaluation = await evaluate_gate(db, gate_id, request_data.context)
+    if evaluation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Enforcement gate {gate_id} not found or inactive",
+        )
+
+    await buffer.enqueue(GateExecutionRow(
+        gate_id=gate_id,
+        gate_key=evaluation.gate_key,
+        execution_id=request_data.execution_id,
+        actor_id=request_data.actor_id,
+        actor_type=request_data.actor_type,
+        outcome=evaluation.outcome,
+        executed_at=executed_at,
+        request_id=request_data.request_id,
+        controls_evaluated=[
+            {"policy_id": str(policy_id), "result": "FAIL" if policy_id in evaluation.failed_policy_ids else "PASS"}
+            for policy_id in evaluation.applicable_policy_ids
+        ],
+        kill_switches_checked=(
+            [{"kill_switch_id": str(evaluation.kill_switch_id)}] if evaluation.kill_switch_id else []
+        ),
+        duration_ms=int((time.perf_counter() - started) * 1000),
+    ))
+
+    return GateEvaluationResponse(gate_id=gate_id, **evaluation._asdict())
@@ -15,23 +15,134 @@ Compliance:
 - ISO 27001: Incident response procedures
 """
 
+from datetime import datetime
 from uuid import UUID
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional, List, Tuple
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import raiseload
 
-from ..db.database import get_db
-from ..db.models.kill_switch import KillSwitch, KillSwitchMode
+from .response_cache import ResponseCache, compute_etag, not_modified
+from ..db.database import get_db, get_read_db
+from ..db.models.kill_switch import KillSwitch, KillSwitchMode, KillSwitchTrigger
+from ..services.cache import LocalTTLCache, QueryCache, get_query_cache
 
 
 router = APIRouter(prefix="/kill-switches", tags=["kill-switches"])
 
 
-@router.get("/", response_model=List)
+class KillSwitchCreate(BaseModel):
+    """Schema for creating kill switches (created disengaged; use /activate)."""
+    switch_key: str = Field(..., min_length=1, max_length=255)
+    workflow_id: Optional[UUID] = None  # None = global switch
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    mode: KillSwitchMode
+    trigger: KillSwitchTrigger
+    reason: str = Field(..., min_length=1)
+    incident_id: Optional[str] = Field(None, max_length=255)
+    auto_deactivate_at: Optional[datetime] = None
+
+
+class KillSwitchUpdate(BaseModel):
+    """Schema for updating kill switches (all fields optional).
+
+    Activation state is changed only through /activate and DELETE.
+    """
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    mode: Optional[KillSwitchMode] = None
+    trigger: Optional[KillSwitchTrigger] = None
+    reason: Optional[str] = Field(None, min_length=1)
+    resolution_notes: Optional[str] = None
+    incident_id: Optional[str] = Field(None, max_length=255)
+    auto_deactivate_at: Optional[datetime] = None
+
+
+class KillSwitchResponse(BaseModel):
+    """Schema for kill switch responses."""
+    id: UUID
+    switch_key: str
+    workflow_id: Optional[UUID] = None
+    name: str
+    description: Optional[str] = None
+    mode: KillSwitchMode
+    trigger: KillSwitchTrigger
+    is_active: bool
+    activated_at: Optional[datetime] = None
+    deactivated_at: Optional[datetime] = None
+    auto_deactivate_at: Optional[datetime] = None
+    activated_by: Optional[str] = None
+    deactivated_by: Optional[str] = None
+    reason: str
+    resolution_notes: Optional[str] = None
+    incident_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(KillSwitch).options(raiseload("*")).where(KillSwitch.is_active == True)
+
+# Redis namespace for rendered list responses (invalidated on every write).
+# Kill switches are safety-critical, so entries live only a few seconds.
+_CACHE_NAMESPACE = "ks:list"
+_CACHE_TTL_SECONDS = 5
+
+# Serialized responses keyed by (id, updated_at)
+_response_cache = ResponseCache(KillSwitchResponse)
+
+# Per-process layer in front of Redis: the active set is tiny and read on
+# every gate check, and up to 1s of staleness is acceptable
+_local_cache = LocalTTLCache(ttl_seconds=1.0)
+
+
+async def invalidate_list_caches(cache: QueryCache) -> None:
+    """Drop rendered active-switch lists (Redis, and this process's layer)."""
+    await cache.invalidate(_CACHE_NAMESPACE)
+    _local_cache.invalidate()
+
+
+async def _render_active_switches(
+    db: AsyncSession,
+    cache: QueryCache,
+    cache_key: str,
+    mode: Optional[KillSwitchMode],
+) -> Tuple[str, bytes]:
+    """Return (etag, body) for the active switch list, from Redis or the database."""
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Taken before the read: set() drops the body if a write invalidates meanwhile
+    generation = await cache.generation(_CACHE_NAMESPACE)
+    query = _LIST_QUERY
+    
+    if mode:
+        query = query.where(KillSwitch.mode == mode)
+    
+    query = query.order_by(KillSwitch.created_at.desc())
+    result = await db.execute(query)
+    switches = result.scalars().all()
+    
+    etag = compute_etag(switches)
+    body = orjson.dumps(_response_cache.serialize_many(switches))
+    await cache.set(cache_key, etag, body, ttl_seconds=_CACHE_TTL_SECONDS, generation=generation)
+    return etag, body
+
+
+@router.get("/", response_model=List[KillSwitchResponse])
 async def list_kill_switches(
+    request: Request,
     mode: Optional[KillSwitchMode] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     List all kill switches with optional mode filtering.
@@ -41,20 +152,28 @@ async def list_kill_switches(
     
     CRITICAL: Test impact before activating production switches.
     """
-    query = select(KillSwitch).where(KillSwitch.is_active == True)
+    cache_key = cache.make_key(_CACHE_NAMESPACE, {"mode": mode})
+    rendered = _local_cache.get(cache_key)
+    if rendered is None:
+        async with _local_cache.lock:
+            rendered = _local_cache.get(cache_key)
+            if rendered is None:
+                rendered = await _render_active_switches(db, cache, cache_key, mode)
+                _local_cache.set(cache_key, rendered)
     
-    if mode:
-        query = query.where(KillSwitch.mode == mode)
+    etag, body = rendered
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     
-    query = query.order_by(KillSwitch.created_at.desc())
-    result = await db.execute(query)
-    return result.scalars().all()
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=KillSwitchResponse, status_code=status.HTTP_201_CREATED)
 async def create_kill_switch(
-    switch_data: dict,
+    switch_data: KillSwitchCreate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Create a new kill switch.
@@ -62,25 +181,25 @@ async def create_kill_switch(
     CRITICAL: Document justification for new switches.
     Requires approval for production environments.
     """
-    switch = KillSwitch(**switch_data)
-    db.add(switch)
+    # INSERT ... RETURNING hydrates server defaults without a refresh SELECT
+    result = await db.execute(
+        insert(KillSwitch).values(**switch_data.model_dump()).returning(KillSwitch)
+    )
+    switch = result.scalar_one()
     await db.commit()
-    await db.refresh(switch)
+    await invalidate_list_caches(cache)
     return switch
 
 
-@router.get("/{switch_id}")
+@router.get("/{switch_id}", response_model=KillSwitchResponse)
 async def get_kill_switch(
     switch_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get a specific kill switch by ID.
     """
-    result = await db.execute(
-        select(KillSwitch).where(KillSwitch.id == switch_id)
-    )
-    switch = result.scalars().first()
+    switch = await db.get(KillSwitch, switch_id)
     
     if not switch:
         raise HTTPException(
@@ -91,21 +210,28 @@ async def get_kill_switch(
     return switch
 
 
-@router.put("/{switch_id}")
+@router.put("/{switch_id}", response_model=KillSwitchResponse)
 async def update_kill_switch(
     switch_id: UUID,
-    update_data: dict,
+    update_data: KillSwitchUpdate,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Update kill switch configuration.
     
     Mode changes (HARD_STOP/DEGRADE) require testing.
     """
+    # Update only the fields the client sent, in a single UPDATE ... RETURNING
+    # (no preliminary SELECT, no refresh round trip)
     result = await db.execute(
-        select(KillSwitch).where(KillSwitch.id == switch_id)
+        update(KillSwitch)
+        .where(KillSwitch.id == switch_id)
+        .values(**update_data.model_dump(exclude_unset=True))
+        .returning(KillSwitch)
+        .execution_options(synchronize_session=False)
     )
-    switch = result.scalars().first()
+    switch = result.scalar_one_or_none()
     
     if not switch:
         raise HTTPException(
@@ -113,12 +239,8 @@ async def update_kill_switch(
             detail=f"Kill switch {switch_id} not found",
         )
     
-    # Update fields
-    for field, value in update_data.items():
-        setattr(switch, field, value)
-    
     await db.commit()
-    await db.refresh(switch)
+    await invalidate_list_caches(cache)
     
     return switch
 
@@ -127,6 +249,7 @@ async def update_kill_switch(
 async def deactivate_kill_switch(
     switch_id: UUID,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Deactivate a kill switch (soft delete).
@@ -136,10 +259,7 @@ async def deactivate_kill_switch(
     
     CRITICAL: Document reason for deactivation.
     """
-    result = await db.execute(
-        select(KillSwitch).where(KillSwitch.id == switch_id)
-    )
-    switch = result.scalars().first()
+    switch = await db.get(KillSwitch, switch_id)
     
     if not switch:
         raise HTTPException(
@@ -149,14 +269,16 @@ async def deactivate_kill_switch(
     
     switch.is_active = False
     await db.commit()
+    await invalidate_list_caches(cache)
     
     return None
 
 
-@router.post("/{switch_id}/activate", status_code=status.HTTP_200_OK)
+@router.post("/{switch_id}/activate", response_model=KillSwitchResponse, status_code=status.HTTP_200_OK)
 async def activate_kill_switch(
     switch_id: UUID,
     db: AsyncSession = Depends(get_db),
+    cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Activate a kill switch.
@@ -164,10 +286,15 @@ async def activate_kill_switch(
     CRITICAL: Activating a HARD_STOP switch will block ALL operations.
     Ensure proper communication before activation.
     """
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no refresh round trip
     result = await db.execute(
-        select(KillSwitch).where(KillSwitch.id == switch_id)
+        update(KillSwitch)
+        .where(KillSwitch.id == switch_id)
+        .values(is_active=True)
+        .returning(KillSwitch)
+        .execution_options(synchronize_session=False)
     )
-    switch = result.scalars().first()
+    switch = result.scalar_one_or_none()
     
     if not switch:
         raise HTTPException(
@@ -175,8 +302,7 @@ async def activate_kill_switch(
             detail=f"Kill switch {switch_id} not found",
         )
     
-    switch.is_active = True
     await db.commit()
-    await db.refresh(switch)
+    await invalidate_list_caches(cache)
     
     return switch
@@ -6,7 +6,7 @@ Exposes POST /v1/chat/completions for internal agents and external clients
 
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.services.model_provider import get_model_provider, ModelProvider
 
@@ -19,6 +19,10 @@ class Message(BaseModel):
     content: str
 
 
+# Dumps a whole message list in one pydantic-core pass
+_messages_adapter = TypeAdapter(List[Message])
+
+
 class ChatCompletionRequest(BaseModel):
     messages: List[Message]
     model: Optional[str] = None
@@ -51,7 +55,7 @@ async def create_chat_completion(
     """
     try:
         # Convert pydantic models to dicts for ModelProvider
-        messages_dict = [msg.dict() for msg in request.messages]
+        messages_dict = _messages_adapter.dump_python(request.messages)
 
         result = await provider.generate_chat(
             messages=messages_dict,
@@ -0,0 +1,123 @@
+"""Keyset Pagination Helpers
+
+Shared cursor pagination for list endpoints. Pages are ordered by
+(sort column, id) - (created_at DESC, id DESC) unless an endpoint has a
+natural order of its own, e.g. policy priority - and the next page is
+selected with a row comparison against the last row returned, so
+PostgreSQL seeks straight into the composite index instead of reading
+and discarding OFFSET rows.
+
+Cursors are opaque to clients: urlsafe base64 of "<sort value>|<id>".
+
+Each router builds its list base statement once at import (_LIST_QUERY
+and the like); handlers only add bound filters and the keyset condition,
+so the compiled SQL (and the asyncpg prepared statement) is reused
+across requests. Response schemas declare no relationships, and the
+base statements carry raiseload("*"): touching one fails loudly instead
+of issuing a lazy SELECT per row.
+"""
+
+import base64
+import binascii
+from datetime import datetime, timezone
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Schema for a page of results plus the cursor for the next page."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(sort_value: Any, row_id: UUID) -> str:
+    """Encode the keyset position of a row as an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = f"{sort_value}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str, parse: Callable[[str], Any] = datetime.fromisoformat) -> Tuple[Any, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+        parse: Converts the encoded sort value back to its column type
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        sort_value, row_id = raw.split("|", 1)
+        return parse(sort_value), UUID(row_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def _parse_utc(value: str) -> datetime:
+    """Parse a cursor timestamp for a timezone-aware column.
+
+    Cursors issued before the column became TIMESTAMPTZ carry naive UTC.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def paginate(
+    query: Select,
+    model: Any,
+    cursor: Optional[str],
+    limit: int,
+    sort_column: Any = None,
+    descending: bool = True,
+) -> Select:
+    """Apply keyset ordering, cursor predicate and limit to a query.
+
+    sort_column defaults to model.created_at; id is always the tiebreaker.
+    One extra row is requested so build_page can tell whether another
+    page exists without issuing a COUNT.
+    """
+    if sort_column is None:
+        sort_column = model.created_at
+    key = tuple_(sort_column, model.id)
+
+    if cursor:
+        python_type = sort_column.type.python_type
+        if python_type is not datetime:
+            parse = python_type
+        elif getattr(sort_column.type, "timezone", False):
+            parse = _parse_utc
+        else:
+            parse = datetime.fromisoformat
+        position = decode_cursor(cursor, parse)
+        query = query.where(key < position if descending else key > position)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), model.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), model.id.asc())
+    return query.limit(limit + 1)
+
+
+def build_page(rows: Sequence[Any], limit: int, sort_attr: str = "created_at") -> dict:
+    """Trim the look-ahead row and compute next_cursor."""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_attr), last.id)
+
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,237 @@
+"""Response Serialization Cache
+
+Registry rows (capabilities, connectors) are read far more often than
+they are written. ResponseCache keeps the already-serialized JSON dict
+for each row keyed by (id, updated_at), so repeat reads skip Pydantic
+validation and encoding entirely. An UPDATE bumps updated_at, which
+changes the key - stale entries are never served and simply age out.
+
+The cache is per-process and bounded (LRU eviction).
+
+List pages are streamed as a JSON array in batches (stream_page), so the
+full response body is never built in memory in one piece.
+
+By-ID reads carry ETag/Last-Modified validators derived from updated_at;
+a conditional GET can be answered with 304 after fetching only that one
+column (row_not_modified).
+
+By-ID reads use response_select, a Core SELECT of just the response
+columns: rows come back as plain Row tuples with no ORM identity-map or
+attribute instrumentation cost.
+
+json_projection goes one step further for list pages: PostgreSQL builds
+each row's JSON object (json_build_object), so the handler only joins
+the returned strings into the page body (json_page_body).
+
+Model attributes renamed away from their JSON names ("metadata" is
+reserved by the declarative Base, hence capability_metadata and the
+like) keep the JSON name in the schemas: the field is named after the
+attribute, accepts either name (validation_alias) and serializes under
+the JSON one (serialization_alias). json_projection keys its JSON
+objects by that alias too.
+"""
+
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Type
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Text, cast, func, inspect, literal_column, select
+from sqlalchemy.sql import ColumnElement, Select
+
+
+# Rows encoded per streamed chunk
+STREAM_BATCH_SIZE = 64
+
+
+class ResponseCache:
+    """Bounded LRU of serialized response dicts keyed by (id, updated_at)."""
+
+    def __init__(self, schema: Type[BaseModel], maxsize: int = 4096):
+        self._schema = schema
+        # Built once at import: validates/dumps a whole list of rows in one core pass
+        self._list_adapter = TypeAdapter(List[schema])
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, Any], dict]" = OrderedDict()
+
+    def serialize(self, obj: Any) -> dict:
+        """Return the JSON-ready dict for an ORM row, using the cache when fresh."""
+        return self.serialize_many([obj])[0]
+
+    def serialize_many(self, rows: Sequence[Any]) -> List[dict]:
+        """Return JSON-ready dicts for ORM rows; cache misses are serialized together."""
+        keys = [(row.id, row.updated_at) for row in rows]
+        results: List[Optional[dict]] = []
+        misses = []
+        for index, key in enumerate(keys):
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+            else:
+                misses.append(index)
+            results.append(cached)
+
+        if misses:
+            models = self._list_adapter.validate_python(
+                [rows[index] for index in misses], from_attributes=True
+            )
+            dumped = self._list_adapter.dump_python(models, mode="json", by_alias=True)
+            for index, data in zip(misses, dumped):
+                results[index] = data
+                self._entries[keys[index]] = data
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return results
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def _schema_columns(model: Any, schema: Type[BaseModel], extra: Iterable[str] = ()) -> Iterable[Tuple[str, Any, Any]]:
+    """(attribute key, column, schema field or None) for each mapped column the schema declares.
+
+    Walks the mapper's column attributes, not table.c: a column stored
+    as "metadata" is mapped to e.g. capability_metadata, and only the
+    attribute key matches the schema field.
+    """
+    fields = schema.model_fields
+    wanted = set(fields) | set(extra)
+    for attr in inspect(model).column_attrs:
+        if attr.key in wanted:
+            yield attr.key, attr.columns[0], fields.get(attr.key)
+
+
+def response_select(model: Any, schema: Type[BaseModel]) -> Select:
+    """Core SELECT of the mapped columns a response schema needs (plus updated_at).
+
+    Each column is labelled with its attribute key, which the schema
+    reads with from_attributes. Schema fields with no backing column are
+    left to their schema defaults.
+    """
+    return select(*[
+        column.label(key)
+        for key, column, _ in _schema_columns(model, schema, ("id", "updated_at"))
+    ])
+
+
+def json_projection(model: Any, schema: Type[BaseModel]) -> ColumnElement:
+    """Server-built JSON object (as text) of the mapped columns a response schema declares.
+
+    Keys are the fields' serialization aliases (or attribute keys), as
+    the schema would dump them. json_build_object keeps key order and
+    renders timestamps/UUIDs/enums as ISO-8601 and plain strings.
+    """
+    args = []
+    for key, column, field in _schema_columns(model, schema):
+        name = (field.serialization_alias if field is not None else None) or key
+        args.extend((literal_column(f"'{name}'"), column))
+    return cast(func.json_build_object(*args), Text)
+
+
+def json_page_body(documents: Iterable[str], next_cursor: Optional[str]) -> bytes:
+    """Assemble a Page-shaped JSON body from per-row JSON documents."""
+    return b"".join((
+        b'{"items":[',
+        ",".join(documents).encode("utf-8"),
+        b'],"next_cursor":',
+        orjson.dumps(next_cursor),
+        b"}",
+    ))
+
+
+def compute_etag(rows: Iterable[Any], *extra: Optional[str]) -> str:
+    """Weak ETag over the (id, updated_at) of every row in a response."""
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(f"{row.id}:{row.updated_at.isoformat() if row.updated_at else ''};".encode("utf-8"))
+    for value in extra:
+        digest.update(f"{value or ''};".encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match matches etag."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def is_conditional(request: Request) -> bool:
+    """True if the request carries a validator worth checking before a full fetch."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def row_validators(updated_at: datetime) -> Dict[str, str]:
+    """ETag and Last-Modified headers for a single row version."""
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)  # Naive columns store UTC
+    return {
+        "ETag": f'W/"{updated_at.timestamp()}"',
+        "Last-Modified": format_datetime(updated_at, usegmt=True),
+    }
+
+
+def row_not_modified(request: Request, updated_at: datetime) -> Optional[Response]:
+    """Return a 304 response if the client's cached copy of a row is current.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    headers = row_validators(updated_at)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = if_none_match == headers["ETag"]
+    else:
+        try:
+            since = parsedate_to_datetime(request.headers.get("if-modified-since", ""))
+        except (TypeError, ValueError):
+            return None
+        fresh = parsedate_to_datetime(headers["Last-Modified"]) <= since
+
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def stream_page(
+    cache: ResponseCache,
+    items: Sequence[Any],
+    next_cursor: Optional[str],
+    etag: str,
+    on_complete: Optional[Callable[[bytes], Awaitable[None]]] = None,
+) -> StreamingResponse:
+    """Stream a Page-shaped JSON body, encoding rows in batches with orjson.
+
+    Rows are resolved through the cache up front (one batched validation
+    for misses); the generator then only encodes. If on_complete is given,
+    it is awaited with the full body once the last chunk has been sent
+    (used to populate the Redis query cache).
+    """
+    rows = cache.serialize_many(items)
+
+    async def body() -> AsyncIterator[bytes]:
+        sent = []
+        chunk = [b'{"items":[']
+        for index, row in enumerate(rows):
+            if index:
+                chunk.append(b",")
+            chunk.append(orjson.dumps(row))
+            if len(chunk) >= STREAM_BATCH_SIZE * 2:
+                data = b"".join(chunk)
+                sent.append(data)
+                yield data
+                chunk = []
+        chunk.append(b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}")
+        data = b"".join(chunk)
+        sent.append(data)
+        yield data
+        if on_complete is not None:
+            await on_complete(b"".join(sent))
+
+    return StreamingResponse(body(), media_type="application/json", headers={"ETag": etag})
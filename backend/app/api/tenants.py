@@ -4,11 +4,15 @@ Provides REST API endpoints for tenant management in the S.S.O. Control Plane.
 Tenants represent organizational units with isolated data and resources.
 """
 
-from typing import List
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from app.api.pagination import Page, build_page, paginate
+from app.db.database import get_db, get_read_db
 from app.db.models.tenant import Tenant
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -40,44 +44,55 @@ class TenantResponse(TenantBase):
     class Config:
         from_attributes = True
 
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(Tenant).options(raiseload("*"))
+
 # API Endpoints
 @router.post("/", response_model=TenantResponse, status_code=status.HTTP_201_CREATED)
 async def create_tenant(
     tenant: TenantCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new tenant organization."""
-    # Check if domain already exists
-    existing = db.query(Tenant).filter(Tenant.domain == tenant.domain).first()
-    if existing:
+    # Single round-trip: the unique constraint on domain rejects duplicates
+    # atomically, so there is no SELECT-then-INSERT race
+    result = await db.execute(
+        insert(Tenant)
+        .values(**tenant.model_dump())
+        .on_conflict_do_nothing(index_elements=[Tenant.domain])
+        .returning(Tenant)
+    )
+    db_tenant = result.scalar_one_or_none()
+    if db_tenant is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tenant with domain '{tenant.domain}' already exists"
         )
     
-    db_tenant = Tenant(**tenant.dict())
-    db.add(db_tenant)
-    db.commit()
-    db.refresh(db_tenant)
+    await db.commit()
     return db_tenant
 
-@router.get("/", response_model=List[TenantResponse])
+@router.get("/", response_model=Page[TenantResponse])
 async def list_tenants(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List all tenant organizations."""
-    tenants = db.query(Tenant).offset(skip).limit(limit).all()
-    return tenants
+    """List tenant organizations, newest first, one keyset page at a time."""
+    query = paginate(_LIST_QUERY, Tenant, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
+    result = await db.execute(query)
+    return build_page(result.scalars().all(), limit)
 
 @router.get("/{tenant_id}", response_model=TenantResponse)
 async def get_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific tenant by ID."""
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = await db.get(Tenant, tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,37 +104,40 @@ async def get_tenant(
 async def update_tenant(
     tenant_id: UUID,
     tenant_update: TenantUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a tenant organization."""
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no refresh round trip
+    result = await db.execute(
+        update(Tenant)
+        .where(Tenant.id == tenant_id)
+        .values(**tenant_update.model_dump(exclude_unset=True))
+        .returning(Tenant)
+        .execution_options(synchronize_session=False)
+    )
+    tenant = result.scalar_one_or_none()
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant {tenant_id} not found"
         )
     
-    update_data = tenant_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(tenant, field, value)
-    
-    db.commit()
-    db.refresh(tenant)
+    await db.commit()
     return tenant
 
 @router.delete("/{tenant_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a tenant organization."""
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = await db.get(Tenant, tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant {tenant_id} not found"
         )
     
-    db.delete(tenant)
-    db.commit()
+    await db.delete(tenant)
+    await db.commit()
     return None
@@ -2,14 +2,19 @@
 CRUD operations for Workflow management (NIST MAP)
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from app.db.database import get_db
-from app.db.models.workflow import Workflow
+from app.api.pagination import Page, build_page, paginate
+from app.db.database import get_db, get_read_db
+from app.db.models.workflow import RiskLevel, Workflow, WorkflowStatus
 
 # Create router
 router = APIRouter(
@@ -18,96 +23,134 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[dict])
+class WorkflowResponse(BaseModel):
+    """Schema for workflow responses."""
+    id: UUID
+    workflow_key: str
+    name: str
+    description: Optional[str] = None
+    risk_level: RiskLevel
+    status: WorkflowStatus
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    created_by: str
+
+    class Config:
+        from_attributes = True
+
+
+# List base statement, built once at import (see app.api.pagination)
+_LIST_QUERY = select(Workflow).options(raiseload("*"))
+
+
+@router.get("/", response_model=Page[WorkflowResponse])
 async def list_workflows(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500),
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List all workflows with optional filtering."""
-    query = db.query(Workflow)
+    query = _LIST_QUERY
     
-    if is_active is not None:
-        query = query.filter(Workflow.is_active == is_active)
+    # is_active is a Python property over status; filter on the column so
+    # the partial idx_workflows_active index applies
+    if is_active is True:
+        query = query.where(Workflow.status == WorkflowStatus.ACTIVE)
+    elif is_active is False:
+        query = query.where(Workflow.status != WorkflowStatus.ACTIVE)
     
-    workflows = query.offset(skip).limit(limit).all()
-    return [wf.to_dict() for wf in workflows]
+    query = paginate(query, Workflow, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
+    result = await db.execute(query)
+    return build_page(result.scalars().all(), limit)
 
 
-@router.post("/", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
 async def create_workflow(
     name: str,
     description: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new workflow."""
-    workflow = Workflow(
-        name=name,
-        description=description,
+    # INSERT ... RETURNING hydrates server defaults without a refresh SELECT
+    result = await db.execute(
+        insert(Workflow)
+        .values(name=name, description=description)
+        .returning(Workflow)
     )
-    db.add(workflow)
-    db.commit()
-    db.refresh(workflow)
-    return workflow.to_dict()
+    workflow = result.scalar_one()
+    await db.commit()
+    return workflow
 
 
-@router.get("/{workflow_id}", response_model=dict)
+@router.get("/{workflow_id}", response_model=WorkflowResponse)
 async def get_workflow(
     workflow_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific workflow by ID."""
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    workflow = await db.get(Workflow, workflow_id)
     if not workflow:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
-    return workflow.to_dict()
+    return workflow
 
 
-@router.put("/{workflow_id}", response_model=dict)
+@router.put("/{workflow_id}", response_model=WorkflowResponse)
 async def update_workflow(
     workflow_id: UUID,
     name: Optional[str] = None,
     description: Optional[str] = None,
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a workflow."""
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    values = {}
+    if name is not None:
+        values["name"] = name
+    if description is not None:
+        values["description"] = description
+    if is_active is not None:
+        values["status"] = WorkflowStatus.ACTIVE if is_active else WorkflowStatus.DEACTIVATED
+    
+    # Single UPDATE ... RETURNING: no preliminary SELECT, no refresh round trip
+    result = await db.execute(
+        update(Workflow)
+        .where(Workflow.id == workflow_id)
+        .values(**values)
+        .returning(Workflow)
+        .execution_options(synchronize_session=False)
+    )
+    workflow = result.scalar_one_or_none()
     if not workflow:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
     
-    if name is not None:
-        workflow.name = name
-    if description is not None:
-        workflow.description = description
-    if is_active is not None:
-        workflow.is_active = is_active
-    
-    db.commit()
-    db.refresh(workflow)
-    return workflow.to_dict()
+    await db.commit()
+    return workflow
 
 
 @router.delete("/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def deactivate_workflow(
     workflow_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Deactivate a workflow (soft delete)."""
-    workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    workflow = await db.get(Workflow, workflow_id)
     if not workflow:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
     
-    workflow.is_active = False
-    db.commit()
+    workflow.status = WorkflowStatus.DEACTIVATED
+    await db.commit()
     return None
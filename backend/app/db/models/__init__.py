@@ -14,9 +14,11 @@ Phase 2: Controls (MANAGE)
 
 Phase 3: Enforcement Integration
 - AuditEvent: Immutable audit log with hash chaining
+- AuditChainVerification: Incremental chain verification checkpoints
 - EnforcementGate: Policy evaluation checkpoints
 - GateExecution: Gate execution history
 - ChangeRequest: Governed production change workflow (FLAGSHIP)
+- ChangeRequestAuditEvent: Audit events linked to a change request
 
 Usage:
     from app.db.models import Workflow, Capability, ControlPolicy
@@ -25,25 +27,23 @@ Usage:
 """
 
 # Base class for all models
-from .base import Base
+from app.db.base import Base
 
 # Phase 1: Registry Backbone (MAP)
-from .workflow import Workflow, WorkflowStatus, WorkflowRiskLevel
-from .capability import Capability, CapabilityCategory, CapabilityRiskLevel
-from .connector import Connector, ConnectorType, ConnectorStatus
+from .workflow import Workflow, WorkflowStatus, RiskLevel
+from .capability import Capability
+from .connector import Connector, ConnectorType
 
 # Phase 2: Controls (MANAGE)
 from .control_policy import (
     ControlPolicy,
-    ControlType,
-    EnforcementLevel,
-    PolicyStatus
+    PolicyAction,
+    ApprovalType
 )
 from .kill_switch import (
     KillSwitch,
-    KillSwitchScope,
-    KillSwitchSeverity,
-    KillSwitchStatus
+    KillSwitchMode,
+    KillSwitchTrigger
 )
 from .break_glass import (
     BreakGlass,
@@ -52,7 +52,7 @@ from .break_glass import (
 )
 
 # Phase 3: Enforcement Integration
-from .audit_event import AuditEvent
+from .audit_event import AuditEvent, AuditChainVerification
 from .enforcement_gate import (
     EnforcementGate,
     GateExecution,
@@ -61,6 +61,7 @@ from .enforcement_gate import (
 )
 from .change_request import (
     ChangeRequest,
+    ChangeRequestAuditEvent,
     ChangeType,
     ChangeStatus,
     ChangeRiskLevel
@@ -74,34 +75,31 @@ __all__ = [
     # Phase 1: Registry
     "Workflow",
     "WorkflowStatus",
-    "WorkflowRiskLevel",
+    "RiskLevel",
     "Capability",
-    "CapabilityCategory",
-    "CapabilityRiskLevel",
     "Connector",
     "ConnectorType",
-    "ConnectorStatus",
     
     # Phase 2: Controls
     "ControlPolicy",
-    "ControlType",
-    "EnforcementLevel",
-    "PolicyStatus",
+    "PolicyAction",
+    "ApprovalType",
     "KillSwitch",
-    "KillSwitchScope",
-    "KillSwitchSeverity",
-    "KillSwitchStatus",
+    "KillSwitchMode",
+    "KillSwitchTrigger",
     "BreakGlass",
     "BreakGlassReason",
     "BreakGlassStatus",
     
     # Phase 3: Enforcement
     "AuditEvent",
+    "AuditChainVerification",
     "EnforcementGate",
     "GateExecution",
     "GateType",
     "GateOutcome",
     "ChangeRequest",
+    "ChangeRequestAuditEvent",
     "ChangeType",
     "ChangeStatus",
     "ChangeRiskLevel",
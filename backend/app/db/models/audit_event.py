@@ -16,15 +16,131 @@ Key Features:
 - Searchable actor/action/resource indexing
 """
 from datetime import datetime
-from typing import Dict, Any, Optional
-from sqlalchemy import Column, String, Text, DateTime, Index, Integer, CheckConstraint
+from typing import Dict, Any, NamedTuple, Optional, Sequence
+from sqlalchemy import Column, String, Text, DateTime, Index, Integer, CheckConstraint, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 import uuid
 import hashlib
 import json
 
-from .base import Base
+import orjson
+
+from app.db.base import Base
+
+
+# hashlib.sha256 is the OpenSSL implementation, which already dispatches to
+# SHA-NI / ARMv8 SHA instructions at runtime; bind it once at import
+_sha256 = hashlib.sha256
+
+# json.dumps() with keyword arguments builds a fresh JSONEncoder per call;
+# reuse one. Output is byte-identical, so existing chains still verify.
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+# Canonicalization formats for event_hash:
+# - v1: stdlib json.dumps of a sorted-key dict (events written before v2)
+# - v2: b"v2" + orjson array of the fields in a fixed order, context keys
+#   sorted. The prefix can never start a v1 payload ("{"), so the two
+#   formats cannot collide and verification can try v2, then v1.
+HASH_VERSION = 2
+# Hasher with the prefix already absorbed; copy() it per event instead of
+# concatenating prefix + payload into a new bytes object
+_HASH_V2_SEED = _sha256(b"v2")
+
+# Values allowed by the valid_outcome / valid_actor_type CHECK constraints;
+# create_row rejects anything else before it reaches the batch INSERT
+AUDIT_OUTCOMES = ('SUCCESS', 'FAILURE', 'BLOCKED', 'WARNING', 'ERROR')
+AUDIT_ACTOR_TYPES = ('USER', 'AGENT', 'SYSTEM', 'API_KEY', 'SERVICE_ACCOUNT')
+
+
+def row_hash_matches(row: Any) -> bool:
+    """Check a row's event_hash against the current format, then the legacy one."""
+    return (
+        row.event_hash == compute_hash_for_row(row)
+        or row.event_hash == compute_hash_for_row(row, version=1)
+    )
+
+
+class AuditEventRow(NamedTuple):
+    """Plain audit event row for the bulk write path.
+
+    Constructing an ORM AuditEvent sets up instance state and
+    unit-of-work hooks the buffered INSERT never uses; a tuple converts
+    straight to Core insert parameters via insert_params(). There is no
+    id field: the database assigns a time-ordered uuid_generate_v7().
+    """
+    event_type: str
+    action: str
+    actor_id: uuid.UUID
+    actor_type: str
+    outcome: str
+    context: Dict[str, Any]
+    created_at: datetime
+    resource_type: Optional[str] = None
+    resource_id: Optional[uuid.UUID] = None
+    resource_name: Optional[str] = None
+    actor_email: Optional[str] = None
+    event_metadata: Dict[str, Any] = {}
+    sequence_number: Optional[int] = None
+    previous_hash: Optional[str] = None
+    event_hash: Optional[str] = None
+
+    def insert_params(self) -> Dict[str, Any]:
+        """Core INSERT parameters, keyed by table column key.
+
+        event_metadata maps to the 'metadata' column; executemany would
+        otherwise drop the unknown key and store the server default.
+        """
+        params = self._asdict()
+        params["metadata"] = params.pop("event_metadata")
+        return params
+
+
+def compute_hash_for_row(row: Any, previous_hash: Optional[str] = None, version: int = HASH_VERSION) -> str:
+    """Compute an event's SHA-256 chain hash (see AuditEvent.compute_hash).
+
+    Accepts anything with the event's attributes: an AuditEvent or an
+    AuditEventRow.
+    """
+    if version == 2:
+        payload = orjson.dumps(
+            (
+                row.sequence_number,
+                row.event_type,
+                row.action,
+                row.actor_id,
+                row.actor_type,
+                row.resource_type,
+                row.resource_id,
+                row.outcome,
+                row.context,
+                previous_hash or row.previous_hash,
+                row.created_at,
+            ),
+            default=str,
+            option=orjson.OPT_SORT_KEYS,
+        )
+        hasher = _HASH_V2_SEED.copy()
+        hasher.update(payload)
+        return hasher.hexdigest()
+
+    hash_data = {
+        "sequence": row.sequence_number,
+        "event_type": row.event_type,
+        "action": row.action,
+        "actor_id": str(row.actor_id),
+        "actor_type": row.actor_type,
+        "resource_type": row.resource_type,
+        "resource_id": str(row.resource_id) if row.resource_id else None,
+        "outcome": row.outcome,
+        "context": row.context,
+        "previous_hash": previous_hash or row.previous_hash,
+        "created_at": row.created_at.isoformat() if row.created_at else None
+    }
+
+    # Deterministic JSON serialization
+    hash_string = _HASH_ENCODER.encode(hash_data)
+    return _sha256(hash_string.encode('utf-8')).hexdigest()
 
 
 class AuditEvent(Base):
@@ -44,23 +160,25 @@ class AuditEvent(Base):
     __tablename__ = "audit_events"
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Time-ordered UUIDv7 from the database: appends land on the rightmost
+    # btree page instead of splitting random pages
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('uuid_generate_v7()'))
     
     # Sequence number for ordering and hash chain integrity
-    sequence_number = Column(Integer, nullable=False, unique=True, autoincrement=True)
+    sequence_number = Column(Integer, nullable=False, autoincrement=True)
     
     # Event Identification
-    event_type = Column(String(100), nullable=False, index=True)
+    event_type = Column(String(100), nullable=False)
     action = Column(String(255), nullable=False)  # Human-readable action
     
     # Actor Information
-    actor_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    actor_id = Column(UUID(as_uuid=True), nullable=False)
     actor_type = Column(String(50), nullable=False)  # USER, AGENT, SYSTEM, API_KEY
     actor_email = Column(String(255), nullable=True)
     
     # Resource Identification
-    resource_type = Column(String(100), nullable=True, index=True)  # WORKFLOW, CONTROL, GATE, etc.
-    resource_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    resource_type = Column(String(100), nullable=True)  # WORKFLOW, CONTROL, GATE, etc.
+    resource_id = Column(UUID(as_uuid=True), nullable=True)
     resource_name = Column(String(255), nullable=True)
     
     # Context and Evidence
@@ -79,13 +197,14 @@ class AuditEvent(Base):
     
     # Hash Chain for Tamper Detection
     previous_hash = Column(String(64), nullable=True)  # SHA-256 of previous event
-    event_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 of this event
+    event_hash = Column(String(64), nullable=False)  # SHA-256 of this event
     
-    # Timestamps
-    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    # Timestamps (also the monthly partition key, hence part of the primary key)
+    created_at = Column(DateTime, primary_key=True, nullable=False, server_default=func.now())
     
-    # Metadata
-    metadata = Column(JSONB, nullable=False, default=dict)
+    # Metadata (attribute renamed: "metadata" is reserved by declarative Base;
+    # the database column keeps its name)
+    event_metadata = Column('metadata', JSONB, nullable=False, default=dict)
     """Additional metadata:
     - compliance_tags: Relevant frameworks (HIPAA, SOC2, etc.)
     - risk_level: Event severity (LOW, MEDIUM, HIGH, CRITICAL)
@@ -93,20 +212,38 @@ class AuditEvent(Base):
     - exported: Whether event has been exported to external SIEM
     """
 
+    # Indexes are kept to the composites below: every one is maintained on
+    # each INSERT, and single-column indexes on their leading columns add
+    # write cost without serving any query the composites cannot
     __table_args__ = (
+        # Unique constraints on a partitioned table must include the partition key
+        UniqueConstraint('sequence_number', 'created_at', name='uq_audit_events_sequence'),
         Index('idx_audit_actor_time', 'actor_id', 'created_at'),
         Index('idx_audit_resource', 'resource_type', 'resource_id', 'created_at'),
         Index('idx_audit_event_type_time', 'event_type', 'created_at'),
         Index('idx_audit_outcome', 'outcome', 'created_at'),
+        # Containment (@>) lookups on context/metadata keys
+        Index('idx_audit_context_gin', 'context', postgresql_using='gin',
+              postgresql_ops={'context': 'jsonb_path_ops'}),
+        # Column name, not the attribute: the table column is keyed 'metadata'
+        Index('idx_audit_metadata_gin', 'metadata', postgresql_using='gin',
+              postgresql_ops={'metadata': 'jsonb_path_ops'}),
+        # Append-only: created_at tracks physical order, so BRIN prunes ranges cheaply
+        Index('idx_audit_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
         CheckConstraint(
-            "outcome IN ('SUCCESS', 'FAILURE', 'BLOCKED', 'WARNING', 'ERROR')",
+            f"outcome IN {AUDIT_OUTCOMES}",
             name='valid_outcome'
         ),
         CheckConstraint(
-            "actor_type IN ('USER', 'AGENT', 'SYSTEM', 'API_KEY', 'SERVICE_ACCOUNT')",
+            f"actor_type IN {AUDIT_ACTOR_TYPES}",
             name='valid_actor_type'
         ),
-        {'comment': 'Immutable audit log with cryptographic hash chaining (Phase 3: Enforcement)'}
+        {
+            'comment': 'Immutable audit log with cryptographic hash chaining (Phase 3: Enforcement)',
+            # One child table per month (migration 016); retention drops whole partitions
+            'postgresql_partition_by': 'RANGE (created_at)',
+        }
     )
 
     def __repr__(self) -> str:
@@ -118,7 +255,7 @@ class AuditEvent(Base):
             f"outcome='{self.outcome}')>"
         )
 
-    def compute_hash(self, previous_hash: Optional[str] = None) -> str:
+    def compute_hash(self, previous_hash: Optional[str] = None, version: int = HASH_VERSION) -> str:
         """Compute SHA-256 hash of event for chain integrity.
         
         Hash includes:
@@ -133,27 +270,12 @@ class AuditEvent(Base):
         
         Args:
             previous_hash: Hash of previous event in chain
+            version: Canonicalization format (see HASH_VERSION)
             
         Returns:
             64-character hex SHA-256 hash
         """
-        hash_data = {
-            "sequence": self.sequence_number,
-            "event_type": self.event_type,
-            "action": self.action,
-            "actor_id": str(self.actor_id),
-            "actor_type": self.actor_type,
-            "resource_type": self.resource_type,
-            "resource_id": str(self.resource_id) if self.resource_id else None,
-            "outcome": self.outcome,
-            "context": self.context,
-            "previous_hash": previous_hash or self.previous_hash,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
-        
-        # Deterministic JSON serialization
-        hash_string = json.dumps(hash_data, sort_keys=True, default=str)
-        return hashlib.sha256(hash_string.encode('utf-8')).hexdigest()
+        return compute_hash_for_row(self, previous_hash, version)
 
     def verify_chain(self, previous_event: Optional['AuditEvent'] = None) -> bool:
         """Verify hash chain integrity.
@@ -174,11 +296,44 @@ class AuditEvent(Base):
                 return False
         
         # Verify this event's hash is correct
-        expected_hash = self.compute_hash()
-        return self.event_hash == expected_hash
+        return self.hash_matches()
+
+    def hash_matches(self) -> bool:
+        """Check event_hash against the current format, then the legacy one."""
+        return row_hash_matches(self)
 
     @classmethod
-    def create_event(
+    def verify_chain_batch(cls, events: Sequence['AuditEvent']) -> bool:
+        """Verify a contiguous run of events in one pass.
+        
+        Each event's hash depends only on its own fields, so all hashes
+        are checked first; the previous_hash links
+        are then checked in a separate tight loop.
+        
+        Args:
+            events: Events ordered by sequence_number. The first event's
+                link to its predecessor is not checked unless it is the
+                genesis event.
+            
+        Returns:
+            True if every hash and link is valid, False if tampered
+        """
+        if not events:
+            return True
+        
+        if events[0].sequence_number == 1 and events[0].previous_hash is not None:
+            return False
+        
+        if not all(event.hash_matches() for event in events):
+            return False
+        
+        return all(
+            current.previous_hash == previous.event_hash
+            for previous, current in zip(events, events[1:])
+        )
+
+    @classmethod
+    def create_row(
         cls,
         event_type: str,
         action: str,
@@ -191,9 +346,10 @@ class AuditEvent(Base):
         resource_name: Optional[str] = None,
         actor_email: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        previous_hash: Optional[str] = None
-    ) -> 'AuditEvent':
-        """Factory method to create properly hashed audit event.
+        previous_hash: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ) -> AuditEventRow:
+        """Build an unhashed audit event row without an ORM instance.
         
         Args:
             event_type: Event category (e.g., WORKFLOW_CREATED)
@@ -208,52 +364,112 @@ class AuditEvent(Base):
             actor_email: Optional actor email
             metadata: Optional metadata
             previous_hash: Hash of previous event (for chaining)
+            created_at: When the action happened (defaults to now, UTC).
+                Part of the hash, so it is fixed here rather than left to
+                the server default
             
         Returns:
-            New AuditEvent instance with computed hash
+            AuditEventRow stamped with created_at; sequence_number
+            and event_hash are assigned when it is chained
+            
+        Raises:
+            ValueError: If the row would fail the table's CHECK constraints
+                or context cannot be hashed. Rejected here, it never
+                reaches (and fails) a whole buffered batch.
         """
-        event = cls(
+        if outcome not in AUDIT_OUTCOMES:
+            raise ValueError(f"Invalid audit outcome: {outcome!r}")
+        if actor_type not in AUDIT_ACTOR_TYPES:
+            raise ValueError(f"Invalid audit actor_type: {actor_type!r}")
+        try:
+            # Same encoding as the v2 hash, which rejects non-string keys
+            orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS)
+        except TypeError as e:
+            raise ValueError(f"Audit context is not hashable as JSON: {e}") from e
+        return AuditEventRow(
             event_type=event_type,
             action=action,
             actor_id=actor_id,
             actor_type=actor_type,
             outcome=outcome,
             context=context or {},
+            created_at=created_at or datetime.utcnow(),
             resource_type=resource_type,
             resource_id=resource_id,
             resource_name=resource_name,
             actor_email=actor_email,
-            metadata=metadata or {},
-            previous_hash=previous_hash
+            event_metadata=metadata or {},
+            previous_hash=previous_hash,
         )
+
+    @classmethod
+    def create_event(cls, *args: Any, **kwargs: Any) -> 'AuditEvent':
+        """Factory method to create an audit event ORM instance.
+        
+        Takes the same arguments as create_row(). Prefer create_row() with
+        AuditEventBuffer, which assigns sequence_number and event_hash
+        before the INSERT so no follow-up UPDATE is needed.
         
-        # Compute hash after all fields are set
-        # Note: sequence_number will be set by DB, hash must be recomputed after insert
-        return event
+        Returns:
+            New AuditEvent instance (unchained: no sequence_number or hash)
+        """
+        return cls(**cls.create_row(*args, **kwargs)._asdict())
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary for API responses."""
+        """Serialize to dictionary for API responses.
+        
+        UUIDs and datetimes are left native for orjson to encode
+        (ORJSONResponse, or to_json). The hash inputs above keep their
+        own str()/isoformat() forms, which the stored hashes depend on.
+        """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "sequence_number": self.sequence_number,
             "event_type": self.event_type,
             "action": self.action,
             "actor": {
-                "id": str(self.actor_id),
+                "id": self.actor_id,
                 "type": self.actor_type,
                 "email": self.actor_email
             },
             "resource": {
                 "type": self.resource_type,
-                "id": str(self.resource_id) if self.resource_id else None,
+                "id": self.resource_id,
                 "name": self.resource_name
             } if self.resource_type else None,
             "outcome": self.outcome,
             "context": self.context,
-            "metadata": self.metadata,
+            "metadata": self.event_metadata,
             "hash": {
                 "previous": self.previous_hash,
                 "current": self.event_hash
             },
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
+
+    def to_json(self) -> bytes:
+        """Encode to_dict() as JSON bytes, e.g. for Response(content=...)."""
+        return orjson.dumps(self.to_dict())
+
+
+class AuditChainVerification(Base):
+    """High-water mark of a completed chain verification run.
+
+    One row per run that verified new events. Every event up to
+    verified_through_sequence has had its hash recomputed and its link
+    checked, so the next run only has to start after it.
+    """
+    __tablename__ = "audit_chain_verifications"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    verified_through_sequence = Column(Integer, nullable=False)
+    verified_hash = Column(String(64), nullable=False)  # event_hash at the high-water mark
+    events_verified = Column(Integer, nullable=False)
+    verified_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index('idx_audit_chain_verified_through', 'verified_through_sequence'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AuditChainVerification(through={self.verified_through_sequence}, at={self.verified_at})>"
@@ -3,14 +3,15 @@
 Emergency override for critical situations
 Bypass policies EXCEPT kill switches
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from datetime import datetime, timedelta
-import uuid
+from typing import NamedTuple, Optional
 import enum
 
-from backend.app.db.base import Base
+from app.db.base import Base
 
 
 class BreakGlassReason(enum.Enum):
@@ -32,6 +33,13 @@ class BreakGlassStatus(enum.Enum):
     REVOKED = "revoked"      # Manually revoked
 
 
+class BreakGlassWindowState(NamedTuple):
+    """Window flags evaluated against a single point in time."""
+    is_active: bool
+    is_expired: bool
+    needs_post_incident_review: bool
+
+
 class BreakGlass(Base):
     """Emergency override mechanism
     
@@ -68,7 +76,7 @@ class BreakGlass(Base):
     __tablename__ = "break_glass"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     break_glass_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Scope (optional - can be global)
@@ -76,14 +84,15 @@ class BreakGlass(Base):
     
     # Request details
     name = Column(String(255), nullable=False)
-    reason = Column(SQLEnum(BreakGlassReason), nullable=False)
+    # Native Postgres ENUMs (4-byte ordinal on disk; migration 020)
+    reason = Column(SQLEnum(BreakGlassReason, name='breakglassreason', native_enum=True), nullable=False)
     justification = Column(Text, nullable=False)  # Detailed explanation
     
     # Status and approval
-    status = Column(SQLEnum(BreakGlassStatus), nullable=False, default=BreakGlassStatus.PENDING)
+    status = Column(SQLEnum(BreakGlassStatus, name='breakglassstatus', native_enum=True), nullable=False, default=BreakGlassStatus.PENDING)
     
     # Time bounds (CRITICAL: Always time-limited)
-    requested_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    requested_at = Column(DateTime, nullable=False, server_default=func.now())
     valid_from = Column(DateTime, nullable=True)  # When approved
     valid_until = Column(DateTime, nullable=True)  # Auto-expire
     duration_hours = Column(Integer, nullable=False, default=2)  # Default 2-hour window
@@ -105,11 +114,13 @@ class BreakGlass(Base):
     
     # Related incident tracking
     incident_id = Column(String(255), nullable=True, index=True)
-    metadata = Column(JSONB, nullable=True, default=dict)
+    # Attribute renamed ("metadata" is reserved by declarative Base); column keeps its name
+    break_glass_metadata = Column('metadata', JSONB, nullable=True, server_default=text("'{}'::jsonb"))
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Database clock (NOW() rendered into the INSERT/UPDATE), not the app host's
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     workflow = relationship("Workflow", backref="break_glass_requests")
@@ -117,29 +128,43 @@ class BreakGlass(Base):
     def __repr__(self):
         return f"<BreakGlass({self.status.value}, reason={self.reason.value}, requested_by={self.requested_by})>"
 
+    def window_state(self, now: Optional[datetime] = None) -> BreakGlassWindowState:
+        """Evaluate all window flags at once.
+        
+        Args:
+            now: Point in time to evaluate at (default: utcnow). Listings
+                pass one shared value so every row is judged against the
+                same instant and the clock is read once.
+        """
+        now = now or datetime.utcnow()
+        approved = self.status == BreakGlassStatus.APPROVED
+        is_expired = self.valid_until is not None and now > self.valid_until
+        is_active = (
+            approved
+            and self.valid_from is not None
+            and self.valid_until is not None
+            and self.valid_from <= now <= self.valid_until
+        )
+        return BreakGlassWindowState(
+            is_active=is_active,
+            is_expired=is_expired,
+            needs_post_incident_review=approved and is_expired and not self.post_incident_review_completed,
+        )
+
     @property
     def is_active(self) -> bool:
         """Check if break glass window is currently active"""
-        if self.status != BreakGlassStatus.APPROVED:
-            return False
-        if not self.valid_from or not self.valid_until:
-            return False
-        now = datetime.utcnow()
-        return self.valid_from <= now <= self.valid_until
+        return self.window_state().is_active
 
     @property
     def is_expired(self) -> bool:
         """Check if break glass window has expired"""
-        if not self.valid_until:
-            return False
-        return datetime.utcnow() > self.valid_until
+        return self.window_state().is_expired
 
     @property
     def needs_post_incident_review(self) -> bool:
         """Check if post-incident review is required"""
-        return (self.status == BreakGlassStatus.APPROVED and 
-                self.is_expired and 
-                not self.post_incident_review_completed)
+        return self.window_state().needs_post_incident_review
 
     def approve(self, approved_by: str, approval_notes: str = None):
         """Approve break glass request
@@ -3,13 +3,13 @@
 NIST AI RMF MAP function: Define operational capabilities per workflow
 Links workflows to specific AI operations (model serving, data processing, etc.)
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Index, Enum as SQLEnum, FetchedValue, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
 
-from backend.app.db.base import Base
+from app.db.base import Base
+from app.db.models.workflow import RiskLevel
 
 
 class Capability(Base):
@@ -25,30 +25,53 @@ class Capability(Base):
     __tablename__ = "capabilities"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     capability_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Workflow association
     workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Denormalized copy of workflows.workflow_key (immutable), filled by the
+    # capabilities_set_workflow_key trigger so full_key never lazy-loads
+    workflow_key = Column(String(255), nullable=False, server_default=FetchedValue())
     
     # Descriptive metadata
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     
+    # NIST AI RMF classification (native Postgres ENUM, shared with workflows)
+    risk_level = Column(SQLEnum(RiskLevel), nullable=False, default=RiskLevel.MEDIUM)
+    requires_approval = Column(Boolean, nullable=False, default=False)
+    
+    # Environments this capability may run in (GIN-indexed for @> filters)
+    allowed_environments = Column(ARRAY(String(50)), nullable=False, server_default=text("'{}'"))
+    
     # Lifecycle
     is_active = Column(Boolean, nullable=False, default=True)
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Database clock (NOW() rendered into the INSERT/UPDATE), not the app host's
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(String(255), nullable=False)
     
     # Configuration and constraints
-    metadata = Column(JSONB, nullable=True, default=dict)
+    # Attribute renamed ("metadata" is reserved by declarative Base); column keeps its name
+    capability_metadata = Column('metadata', JSONB, nullable=True, server_default=text("'{}'::jsonb"))
     
     # Relationships
     workflow = relationship("Workflow", back_populates="capabilities")
     connectors = relationship("Connector", back_populates="capability", cascade="all, delete-orphan")
+    # Load explicitly (selectinload) when needed; lazy loads raise
+    enforcement_gates = relationship("EnforcementGate", back_populates="capability", lazy="raise")
+    change_requests = relationship("ChangeRequest", back_populates="capability")
+
+    __table_args__ = (
+        Index('idx_capability_active_created', 'is_active', 'created_at', 'id'),  # Keyset pagination
+        Index('ux_capability_active_name', 'name', unique=True, postgresql_where=text('is_active')),
+        Index('idx_capability_active_risk', 'is_active', 'risk_level'),
+        Index('idx_capability_active_approval', 'is_active', 'requires_approval'),
+        Index('idx_capability_allowed_envs', 'allowed_environments', postgresql_using='gin'),
+    )
 
     def __repr__(self):
         return f"<Capability(key='{self.capability_key}', workflow_id={self.workflow_id}, active={self.is_active})>"
@@ -56,4 +79,4 @@ class Capability(Base):
     @property
     def full_key(self) -> str:
         """Composite key: workflow_key.capability_key for audit trails"""
-        return f"{self.workflow.workflow_key}.{self.capability_key}"
+        return f"{self.workflow_key}.{self.capability_key}"
@@ -25,14 +25,22 @@ Compliance:
 """
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, Index, Integer
-from sqlalchemy.dialects.postgresql import JSONB, UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DateTime, Boolean, CheckConstraint, Computed, Enum as SQLEnum, ForeignKey, Index, Integer, Select, SmallInteger, and_, select, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import relationship, selectinload, validates
 from sqlalchemy.sql import func
-import uuid
 import enum
 
-from .base import Base
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.db.base import Base
+
+
+def _enum_values(enum_class):
+    """Native ENUM labels from member values (identical to the names here)."""
+    return [member.value for member in enum_class]
 
 
 class ChangeType(str, enum.Enum):
@@ -63,6 +71,24 @@ class ChangeStatus(str, enum.Enum):
     CANCELLED = "CANCELLED"  # Cancelled by requester
 
 
+# Not yet in a terminal state: the working set for review and approval
+# queues. Filter with status.in_(OPEN_CHANGE_STATUSES), not with
+# "status != <terminal>", so the planner can match idx_change_open.
+OPEN_CHANGE_STATUSES = (
+    ChangeStatus.DRAFT,
+    ChangeStatus.SUBMITTED,
+    ChangeStatus.UNDER_REVIEW,
+    ChangeStatus.PENDING_APPROVAL,
+    ChangeStatus.APPROVED,
+    ChangeStatus.SCHEDULED,
+    ChangeStatus.IN_PROGRESS,
+)
+
+_OPEN_STATUS_PREDICATE = "status IN ({})".format(
+    ", ".join(f"'{status.value}'" for status in OPEN_CHANGE_STATUSES)
+)
+
+
 class ChangeRiskLevel(str, enum.Enum):
     """Risk level of change (determines approval requirements)."""
     LOW = "LOW"  # Single approval, short window
@@ -71,6 +97,67 @@ class ChangeRiskLevel(str, enum.Enum):
     CRITICAL = "CRITICAL"  # Board approval, maximum scrutiny
 
 
+# Approval stage per risk level: 0 = auto, 1 = single, 2 = dual, 3 = committee
+APPROVAL_STAGES = {
+    ChangeRiskLevel.LOW: 0,
+    ChangeRiskLevel.MEDIUM: 1,
+    ChangeRiskLevel.HIGH: 2,
+    ChangeRiskLevel.CRITICAL: 3,
+}
+
+_APPROVAL_STAGE_EXPRESSION = "CASE risk_level {} END".format(
+    " ".join(f"WHEN '{level.value}' THEN {stage}" for level, stage in APPROVAL_STAGES.items())
+)
+
+
+class ImpactAssessment(BaseModel):
+    """Documented shape of ChangeRequest.impact_assessment (extra keys allowed)."""
+    model_config = ConfigDict(extra="allow")
+
+    affected_systems: List[str]
+    downtime_required: bool
+    estimated_duration: int = Field(ge=0)  # Minutes
+    rollback_time: int = Field(ge=0)  # Minutes
+    data_impact: str
+    compliance_impact: str
+
+
+class VerificationCriterion(BaseModel):
+    """One entry of ChangeRequest.verification_criteria (extra keys allowed)."""
+    model_config = ConfigDict(extra="allow")
+
+    criterion: str
+    check_type: str
+    threshold: Optional[str] = None
+
+
+# Validators are built once at import (pydantic-core compiles the schema);
+# each check is then a single call with no per-request schema work
+_impact_assessment_adapter = TypeAdapter(ImpactAssessment)
+_verification_criteria_adapter = TypeAdapter(List[VerificationCriterion])
+
+_DOCUMENT_ADAPTERS = {
+    'impact_assessment': _impact_assessment_adapter,
+    'verification_criteria': _verification_criteria_adapter,
+}
+
+
+def check_document(key: str, value: Any) -> Any:
+    """Check a schema-bound JSONB document (impact_assessment or verification_criteria).
+    
+    Empty documents are accepted: a DRAFT has not been assessed yet.
+    Returns the value given, not a re-serialized copy. Used by the ORM
+    @validates hook and by the API schemas, whose Core INSERT/UPDATE
+    statements bypass @validates.
+    
+    Raises:
+        pydantic.ValidationError (a ValueError) if the document is invalid
+    """
+    if value:
+        _DOCUMENT_ADAPTERS[key].validate_python(value)
+    return value
+
+
 class ChangeRequest(Base):
     """Governed change request for high-risk production changes.
     
@@ -91,14 +178,17 @@ class ChangeRequest(Base):
     __tablename__ = "change_requests"
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     
     # Change Identification
     change_key = Column(String(100), nullable=False, unique=True, index=True)
     """Unique identifier (e.g., 'CHG-2025-001')"""
     
-    change_type = Column(SQLEnum(ChangeType), nullable=False, index=True)
-    risk_level = Column(SQLEnum(ChangeRiskLevel), nullable=False, index=True)
+    change_type = Column(SQLEnum(ChangeType, values_callable=_enum_values), nullable=False, index=True)
+    risk_level = Column(SQLEnum(ChangeRiskLevel, values_callable=_enum_values), nullable=False, index=True)
+    # APPROVAL_STAGES[risk_level], generated by PostgreSQL so every write
+    # path (ORM or Core) keeps it in step and approval queues filter on an int
+    approval_stage = Column(SmallInteger, Computed(_APPROVAL_STAGE_EXPRESSION, persisted=True), index=True)
     
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
@@ -113,24 +203,24 @@ class ChangeRequest(Base):
     # Requester Information
     requested_by = Column(UUID(as_uuid=True), nullable=False, index=True)
     requested_by_email = Column(String(255), nullable=False)
-    requested_at = Column(DateTime, nullable=False, server_default=func.now())
+    requested_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Approval Workflow
-    status = Column(SQLEnum(ChangeStatus), nullable=False, default=ChangeStatus.DRAFT, index=True)
+    status = Column(SQLEnum(ChangeStatus, values_callable=_enum_values), nullable=False, default=ChangeStatus.DRAFT, index=True)
     
     reviewer_id = Column(UUID(as_uuid=True), nullable=True)
     reviewer_email = Column(String(255), nullable=True)
-    reviewed_at = Column(DateTime, nullable=True)
+    reviewed_at = Column(DateTime(timezone=True), nullable=True)
     review_notes = Column(Text, nullable=True)
     
     approver_id = Column(UUID(as_uuid=True), nullable=True)
     approver_email = Column(String(255), nullable=True)
-    approved_at = Column(DateTime, nullable=True)
+    approved_at = Column(DateTime(timezone=True), nullable=True)
     approval_notes = Column(Text, nullable=True)
     
     rejection_reason = Column(Text, nullable=True)
     rejected_by = Column(UUID(as_uuid=True), nullable=True)
-    rejected_at = Column(DateTime, nullable=True)
+    rejected_at = Column(DateTime(timezone=True), nullable=True)
     
     # Execution Window
     scheduled_start = Column(DateTime, nullable=True)
@@ -141,7 +231,7 @@ class ChangeRequest(Base):
     execution_completed_at = Column(DateTime, nullable=True)
     
     # Change Details
-    change_details = Column(JSONB, nullable=False, default=dict)
+    change_details = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Specific change parameters:
     - For WORKFLOW_DEPLOYMENT: workflow_config, env_vars, resource_limits
     - For CAPABILITY_GRANT: capability_id, agent_id, constraints
@@ -149,7 +239,7 @@ class ChangeRequest(Base):
     """
     
     # Impact Assessment
-    impact_assessment = Column(JSONB, nullable=False, default=dict)
+    impact_assessment = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Required fields:
     - affected_systems: List of systems impacted
     - downtime_required: Boolean
@@ -160,7 +250,7 @@ class ChangeRequest(Base):
     """
     
     # Testing and Validation
-    testing_evidence = Column(JSONB, nullable=False, default=dict)
+    testing_evidence = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Pre-production testing results:
     - test_env_results: Staging environment test results
     - validation_passed: Boolean
@@ -170,7 +260,7 @@ class ChangeRequest(Base):
     
     # Post-Deployment Verification
     verification_required = Column(Boolean, nullable=False, default=True)
-    verification_criteria = Column(JSONB, nullable=False, default=list)
+    verification_criteria = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
     """Success criteria to verify after deployment:
     [
         {
@@ -187,19 +277,16 @@ class ChangeRequest(Base):
     
     # Rollback
     rollback_required = Column(Boolean, nullable=False, default=False)
-    rollback_procedure = Column(JSONB, nullable=False, default=dict)
+    rollback_procedure = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Automated rollback steps if deployment fails"""
     
     rollback_executed = Column(Boolean, nullable=False, default=False)
     rollback_executed_at = Column(DateTime, nullable=True)
     rollback_successful = Column(Boolean, nullable=True)
     
-    # Audit Trail
-    audit_event_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list)
-    """Links to all audit events generated by this change"""
-    
-    # Metadata
-    metadata = Column(JSONB, nullable=False, default=dict)
+    # Metadata (attribute renamed: "metadata" is reserved by declarative Base;
+    # the column keeps its name)
+    change_metadata = Column('metadata', JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Additional metadata:
     - compliance_tags: Frameworks addressed (HIPAA, SOC2, etc.)
     - stakeholders: List of notified parties
@@ -207,20 +294,54 @@ class ChangeRequest(Base):
     - emergency_contact: Who to call if issues arise
     """
     
-    # Timestamps
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    # Timestamps (decision and audit timestamps are set server-side with now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    workflow = relationship("Workflow", foreign_keys=[workflow_id], backref="change_requests")
-    capability = relationship("Capability", foreign_keys=[capability_id], backref="change_requests")
-    control_policy = relationship("ControlPolicy", foreign_keys=[control_policy_id], backref="change_requests")
+    workflow = relationship("Workflow", foreign_keys=[workflow_id], back_populates="change_requests")
+    capability = relationship("Capability", foreign_keys=[capability_id], back_populates="change_requests")
+    control_policy = relationship("ControlPolicy", foreign_keys=[control_policy_id], back_populates="change_requests")
+    # Links to all audit events generated by this change, one row each.
+    # Write-only: appending is a single-row INSERT, and reads are explicit
+    # (audit_event_links.select()) rather than loading the whole collection
+    audit_event_links = relationship(
+        "ChangeRequestAuditEvent",
+        lazy="write_only",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         Index('idx_change_status_risk', 'status', 'risk_level'),
         Index('idx_change_requested', 'requested_by', 'requested_at'),
         Index('idx_change_execution_window', 'scheduled_start', 'scheduled_end'),
         Index('idx_change_workflow', 'workflow_id', 'status'),
+        Index('idx_change_created_keyset', 'created_at', 'id'),
+        # Partial: completed/rejected history never enters these indexes
+        Index('idx_change_open', 'risk_level', 'created_at', 'id',
+              postgresql_where=text(_OPEN_STATUS_PREDICATE)),
+        Index('idx_change_open_keyset', 'created_at', 'id',
+              postgresql_where=text(_OPEN_STATUS_PREDICATE)),
+        Index('idx_change_rollback_pending', 'execution_completed_at',
+              postgresql_where=text('rollback_required AND NOT rollback_executed')),
+        CheckConstraint('scheduled_start <= scheduled_end', name='ck_change_window_order'),
+        # HIGH/CRITICAL changes cannot be scheduled or executed without a window
+        CheckConstraint(
+            "risk_level NOT IN ('HIGH', 'CRITICAL') "
+            "OR status NOT IN ('SCHEDULED', 'IN_PROGRESS') "
+            "OR (scheduled_start IS NOT NULL AND scheduled_end IS NOT NULL)",
+            name='ck_change_window_required'
+        ),
+        # Containment (@>) lookups into the JSONB documents, e.g.
+        # ChangeRequest.change_details.contains({"environment": "production"})
+        Index('idx_change_details_gin', 'change_details', postgresql_using='gin',
+              postgresql_ops={'change_details': 'jsonb_path_ops'}),
+        Index('idx_change_impact_gin', 'impact_assessment', postgresql_using='gin',
+              postgresql_ops={'impact_assessment': 'jsonb_path_ops'}),
+        # Column name, not the attribute: the table column is keyed 'metadata'
+        Index('idx_change_metadata_gin', 'metadata', postgresql_using='gin',
+              postgresql_ops={'metadata': 'jsonb_path_ops'}),
         {'comment': 'Governed change requests for high-risk production changes (Phase 3: Enforcement - FLAGSHIP)'}
     )
 
@@ -233,46 +354,59 @@ class ChangeRequest(Base):
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary for API responses."""
+        """Serialize to dictionary for API responses.
+
+        Linked audit event IDs are not included: they live in
+        change_request_audit_events (see select_audit_event_ids).
+
+        UUIDs and datetimes are left as native values: orjson (the app's
+        default ORJSONResponse, or to_json) encodes them in C, to the same
+        strings str()/isoformat() would produce (with the UTC offset for
+        the timezone-aware columns, without it for the naive ones).
+        """
+        reviewer_id = self.reviewer_id
+        approver_id = self.approver_id
+        rejection_reason = self.rejection_reason
         return {
-            "id": str(self.id),
+            "id": self.id,
             "change_key": self.change_key,
-            "change_type": self.change_type.value,
-            "risk_level": self.risk_level.value,
+            # str-based enums: the members serialize as their values directly
+            "change_type": self.change_type,
+            "risk_level": self.risk_level,
             "title": self.title,
             "description": self.description,
             "rationale": self.rationale,
-            "status": self.status.value,
-            "workflow_id": str(self.workflow_id) if self.workflow_id else None,
-            "capability_id": str(self.capability_id) if self.capability_id else None,
-            "control_policy_id": str(self.control_policy_id) if self.control_policy_id else None,
+            "status": self.status,
+            "workflow_id": self.workflow_id,
+            "capability_id": self.capability_id,
+            "control_policy_id": self.control_policy_id,
             "requester": {
-                "id": str(self.requested_by),
+                "id": self.requested_by,
                 "email": self.requested_by_email,
-                "requested_at": self.requested_at.isoformat() if self.requested_at else None
+                "requested_at": self.requested_at
             },
             "reviewer": {
-                "id": str(self.reviewer_id) if self.reviewer_id else None,
+                "id": reviewer_id,
                 "email": self.reviewer_email,
-                "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
+                "reviewed_at": self.reviewed_at,
                 "notes": self.review_notes
-            } if self.reviewer_id else None,
+            } if reviewer_id else None,
             "approver": {
-                "id": str(self.approver_id) if self.approver_id else None,
+                "id": approver_id,
                 "email": self.approver_email,
-                "approved_at": self.approved_at.isoformat() if self.approved_at else None,
+                "approved_at": self.approved_at,
                 "notes": self.approval_notes
-            } if self.approver_id else None,
+            } if approver_id else None,
             "rejection": {
-                "reason": self.rejection_reason,
-                "rejected_by": str(self.rejected_by) if self.rejected_by else None,
-                "rejected_at": self.rejected_at.isoformat() if self.rejected_at else None
-            } if self.rejection_reason else None,
+                "reason": rejection_reason,
+                "rejected_by": self.rejected_by,
+                "rejected_at": self.rejected_at
+            } if rejection_reason else None,
             "execution_window": {
-                "scheduled_start": self.scheduled_start.isoformat() if self.scheduled_start else None,
-                "scheduled_end": self.scheduled_end.isoformat() if self.scheduled_end else None,
-                "started_at": self.execution_started_at.isoformat() if self.execution_started_at else None,
-                "completed_at": self.execution_completed_at.isoformat() if self.execution_completed_at else None
+                "scheduled_start": self.scheduled_start,
+                "scheduled_end": self.scheduled_end,
+                "started_at": self.execution_started_at,
+                "completed_at": self.execution_completed_at
             },
             "change_details": self.change_details,
             "impact_assessment": self.impact_assessment,
@@ -288,26 +422,110 @@ class ChangeRequest(Base):
                 "required": self.rollback_required,
                 "procedure": self.rollback_procedure,
                 "executed": self.rollback_executed,
-                "executed_at": self.rollback_executed_at.isoformat() if self.rollback_executed_at else None,
+                "executed_at": self.rollback_executed_at,
                 "successful": self.rollback_successful
             },
-            "audit_event_ids": [str(eid) for eid in self.audit_event_ids],
-            "metadata": self.metadata,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "metadata": self.change_metadata,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
+    def to_json(self) -> bytes:
+        """Encode to_dict() as JSON bytes, e.g. for Response(content=...)."""
+        return orjson.dumps(self.to_dict())
+
+    @validates('impact_assessment', 'verification_criteria')
+    def _validate_document(self, key: str, value: Any) -> Any:
+        """Check JSONB documents against their schemas on assignment (see check_document)."""
+        return check_document(key, value)
+
+    def validate_documents(self) -> None:
+        """Re-check all schema-bound JSONB documents (e.g. before submission).
+        
+        Raises:
+            pydantic.ValidationError (a ValueError) if a document is invalid
+        """
+        self._validate_document('impact_assessment', self.impact_assessment)
+        self._validate_document('verification_criteria', self.verification_criteria)
+
+    def select_audit_event_ids(self) -> Select:
+        """SELECT of the audit event IDs linked to this change, oldest first."""
+        return (
+            select(ChangeRequestAuditEvent.audit_event_id)
+            .where(ChangeRequestAuditEvent.change_request_id == self.id)
+            .order_by(ChangeRequestAuditEvent.created_at)
+        )
+
+    @classmethod
+    def query_for_listing(cls) -> Select:
+        """SELECT for code that iterates change requests and reads relationships.
+        
+        workflow, capability and control_policy are loaded with one
+        SELECT ... WHERE id IN (...) each for the whole result, instead of
+        a lazy SELECT per row. The API list endpoint does not need this:
+        it serializes scalar columns in SQL and never touches them.
+        """
+        return select(cls).options(
+            selectinload(cls.workflow),
+            selectinload(cls.capability),
+            selectinload(cls.control_policy),
+        )
+
+    @hybrid_method
     def is_within_execution_window(self) -> bool:
-        """Check if current time is within the approved execution window."""
+        """Check if current time is within the approved execution window.
+        
+        On the class it is a SQL expression, so callers can filter with
+        select(ChangeRequest).where(ChangeRequest.is_within_execution_window())
+        and let idx_change_execution_window find the open windows.
+        """
         if not self.scheduled_start or not self.scheduled_end:
             return False
         now = datetime.utcnow()
         return self.scheduled_start <= now <= self.scheduled_end
 
+    @is_within_execution_window.expression
+    def is_within_execution_window(cls):
+        # The window columns are naive UTC; compare against the database
+        # clock in UTC rather than now() in the session time zone. NULL
+        # bounds compare as NULL and drop the row, as above.
+        now = func.timezone('UTC', func.now())
+        return and_(cls.scheduled_start <= now, cls.scheduled_end >= now)
+
+    @hybrid_method
     def requires_multi_stage_approval(self) -> bool:
         """Check if this change requires reviewer + approver."""
-        return self.risk_level in (ChangeRiskLevel.MEDIUM, ChangeRiskLevel.HIGH, ChangeRiskLevel.CRITICAL)
+        # From risk_level, so it also holds before the row is flushed
+        return APPROVAL_STAGES[self.risk_level] >= 1
+
+    @requires_multi_stage_approval.expression
+    def requires_multi_stage_approval(cls):
+        return cls.approval_stage >= 1
 
+    @hybrid_method
     def can_auto_approve(self) -> bool:
         """Check if this change can be auto-approved (LOW risk only)."""
-        return self.risk_level == ChangeRiskLevel.LOW
+        return APPROVAL_STAGES[self.risk_level] == 0
+
+    @can_auto_approve.expression
+    def can_auto_approve(cls):
+        return cls.approval_stage == 0
+
+
+class ChangeRequestAuditEvent(Base):
+    """Link from a change request to an audit event it generated.
+    
+    audit_event_id has no foreign key: audit_events is partitioned by
+    created_at (its key is (id, created_at)) and old partitions are
+    dropped for retention, which a referencing FK would block.
+    """
+    __tablename__ = "change_request_audit_events"
+
+    change_request_id = Column(
+        UUID(as_uuid=True), ForeignKey('change_requests.id', ondelete='CASCADE'), primary_key=True
+    )
+    audit_event_id = Column(UUID(as_uuid=True), primary_key=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ChangeRequestAuditEvent(change_request={self.change_request_id}, audit_event={self.audit_event_id})>"
@@ -3,14 +3,13 @@
 NIST AI RMF MAP function: Define integration points for capabilities
 Links capabilities to external systems, APIs, or infrastructure
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Index, Enum as SQLEnum, Computed, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
 import enum
 
-from backend.app.db.base import Base
+from app.db.base import Base
 
 
 class ConnectorType(enum.Enum):
@@ -24,6 +23,15 @@ class ConnectorType(enum.Enum):
     EXTERNAL_SERVICE = "external_service"  # Third-party service
 
 
+# Config keys each connector type must define (see Connector.validate_config)
+_REQUIRED_CONFIG_KEYS = {
+    ConnectorType.API: frozenset(("method", "auth_type")),
+    ConnectorType.DATABASE: frozenset(("db_type", "connection_string_secret_arn")),
+    ConnectorType.ML_MODEL: frozenset(("model_name", "version")),
+    # Add more as needed
+}
+
+
 class Connector(Base):
     """Integration connectors for capabilities
     
@@ -38,11 +46,21 @@ class Connector(Base):
     __tablename__ = "connectors"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     connector_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Capability association
     capability_id = Column(UUID(as_uuid=True), ForeignKey("capabilities.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Denormalized copy of the parent capability's full_key (immutable), filled
+    # by the connectors_set_capability_full_key trigger
+    capability_full_key = Column(String(511), nullable=False, server_default=FetchedValue())
+    # Composite key for audit trails: workflow_key.capability_key.connector_key,
+    # computed by PostgreSQL so reading it never loads the capability
+    full_key = Column(
+        String(767),
+        Computed("capability_full_key || '.' || connector_key", persisted=True),
+        index=True,
+    )
     
     # Connector details
     name = Column(String(255), nullable=False)
@@ -52,39 +70,35 @@ class Connector(Base):
     # Connection configuration (NO CREDENTIALS)
     # Use AWS Secrets Manager ARN or similar for credentials
     endpoint_url = Column(String(512), nullable=True)  # API/service endpoint
-    config = Column(JSONB, nullable=True, default=dict)  # Type-specific config
+    config = Column(JSONB, nullable=True, server_default=text("'{}'::jsonb"))  # Type-specific config
     
     # Lifecycle
     is_active = Column(Boolean, nullable=False, default=True)
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(String(255), nullable=False)
     
     # Relationships
     capability = relationship("Capability", back_populates="connectors")
 
+    __table_args__ = (
+        Index('idx_connector_active_created', 'is_active', 'created_at', 'id'),  # Keyset pagination
+        Index('ux_connector_active_name', 'name', unique=True, postgresql_where=text('is_active')),
+        Index('idx_connector_active_type', 'is_active', 'connector_type'),
+    )
+
     def __repr__(self):
         return f"<Connector(key='{self.connector_key}', type={self.connector_type.value}, active={self.is_active})>"
 
-    @property
-    def full_key(self) -> str:
-        """Composite key for audit trails"""
-        return f"{self.capability.full_key}.{self.connector_key}"
-    
     def validate_config(self) -> bool:
         """Type-specific config validation
         
         Override in subclasses or use Pydantic models
         """
-        required_keys = {
-            ConnectorType.API: ["method", "auth_type"],
-            ConnectorType.DATABASE: ["db_type", "connection_string_secret_arn"],
-            ConnectorType.ML_MODEL: ["model_name", "version"],
-            # Add more as needed
-        }
-        
-        if self.connector_type in required_keys:
-            return all(k in (self.config or {}) for k in required_keys[self.connector_type])
-        return True
+        required = _REQUIRED_CONFIG_KEYS.get(self.connector_type)
+        if required is None:
+            return True
+        # Key-view superset test: one C-level pass, no per-key Python loop
+        return (self.config or {}).keys() >= required
@@ -3,14 +3,13 @@
 Governance policies for production change management
 The heart of S.S.O.: No changes without approval
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum, Integer
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Index, Enum as SQLEnum, Integer, Computed, and_, or_, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
 import enum
 
-from backend.app.db.base import Base
+from app.db.base import Base
 
 
 class PolicyAction(enum.Enum):
@@ -29,6 +28,51 @@ class ApprovalType(enum.Enum):
     COMMITTEE = "committee"  # Review board
 
 
+def _promoted_condition(key: str, json_type: str, cast: str = "") -> Computed:
+    """Generated column holding conditions[key] when it has the given JSON type.
+
+    Any other type (or a missing key) leaves the column NULL, so the
+    promoted column never claims a match that evaluate_conditions would not.
+    """
+    return Computed(
+        f"CASE WHEN jsonb_typeof(conditions -> '{key}') = '{json_type}' "
+        f"THEN (conditions ->> '{key}'){cast} END",
+        persisted=True,
+    )
+
+
+# Condition keys mirrored into typed columns: (context key, attribute, Python type)
+PROMOTED_CONDITIONS = (
+    ("change_type", "condition_change_type", str),
+    ("environment", "condition_environment", str),
+    ("after_hours", "condition_after_hours", bool),
+)
+
+
+# Condition matching uses dict item views: their subset/disjoint tests run
+# in C, look up each key once and compare values with ==, so unhashable
+# JSON values (lists, objects) work. A condition expecting None also
+# matches an absent context key (context.get semantics); only conditions
+# holding a None value need the per-key fallback for that.
+
+def _matches_all(conditions: dict, context: dict) -> bool:
+    """True if every condition equals the context value for its key."""
+    if conditions.items() <= context.items():
+        return True
+    return None in conditions.values() and all(
+        context.get(key) == expected for key, expected in conditions.items()
+    )
+
+
+def _matches_any(conditions: dict, context: dict) -> bool:
+    """True if any condition equals the context value for its key."""
+    if not conditions.items().isdisjoint(context.items()):
+        return True
+    return None in conditions.values() and any(
+        context.get(key) == expected for key, expected in conditions.items()
+    )
+
+
 class ControlPolicy(Base):
     """Core governance policies
     
@@ -44,7 +88,7 @@ class ControlPolicy(Base):
     __tablename__ = "control_policies"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     policy_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Workflow association (optional - can apply globally)
@@ -57,12 +101,21 @@ class ControlPolicy(Base):
     
     # Approval requirements
     approval_type = Column(SQLEnum(ApprovalType), nullable=False, default=ApprovalType.NONE)
-    approval_required_for = Column(JSONB, nullable=True, default=list)  # List of change types
-    approver_roles = Column(JSONB, nullable=True, default=list)  # Required approver roles
+    approval_required_for = Column(JSONB, nullable=True, server_default=text("'[]'::jsonb"))  # List of change types
+    approver_roles = Column(JSONB, nullable=True, server_default=text("'[]'::jsonb"))  # Required approver roles
     
     # Conditions and constraints
-    conditions = Column(JSONB, nullable=True, default=dict)  # When policy applies
-    auto_deny_conditions = Column(JSONB, nullable=True, default=dict)  # Instant deny rules
+    conditions = Column(JSONB, nullable=True, server_default=text("'{}'::jsonb"))  # When policy applies
+    auto_deny_conditions = Column(JSONB, nullable=True, server_default=text("'{}'::jsonb"))  # Instant deny rules
+    
+    # Frequently matched condition keys, generated from conditions (which stays
+    # the source of truth) so policy lookups can filter on an index
+    condition_change_type = Column(String(255), _promoted_condition("change_type", "string"))
+    condition_environment = Column(String(255), _promoted_condition("environment", "string"))
+    condition_after_hours = Column(Boolean, _promoted_condition("after_hours", "boolean", "::boolean"))
+    
+    # Free-form policy metadata (not "metadata": reserved by declarative Base)
+    policy_metadata = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     
     # Priority (higher number = higher priority)
     priority = Column(Integer, nullable=False, default=100)
@@ -71,13 +124,23 @@ class ControlPolicy(Base):
     is_active = Column(Boolean, nullable=False, default=True)
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(String(255), nullable=False)
     last_modified_by = Column(String(255), nullable=False)
     
     # Relationships
     workflow = relationship("Workflow", backref="control_policies")
+    change_requests = relationship("ChangeRequest", back_populates="control_policy")
+
+    __table_args__ = (
+        # Live policies in evaluation order (keyset on priority, id); partial, so history adds no index cost
+        Index('idx_control_policies_active_priority', 'priority', 'id', postgresql_where=text('is_active')),
+        Index('ux_control_policy_active_name', 'name', unique=True, postgresql_where=text('is_active')),
+        # Candidate lookup by promoted conditions (see match_clause)
+        Index('idx_control_policies_match', 'condition_change_type', 'condition_environment',
+              postgresql_where=text('is_active')),
+    )
 
     def __repr__(self):
         return f"<ControlPolicy(key='{self.policy_key}', action={self.policy_action.value}, approval={self.approval_type.value})>"
@@ -92,6 +155,28 @@ class ControlPolicy(Base):
         """Check if policy can block changes"""
         return self.policy_action in (PolicyAction.DENY, PolicyAction.REQUIRE_APPROVAL)
 
+    @classmethod
+    def match_clause(cls, context: dict):
+        """WHERE clause selecting policies whose promoted conditions fit context.
+        
+        A NULL promoted column means the policy does not constrain that key
+        (or constrains it with a non-matching JSON type), so it stays a
+        candidate. The result is a superset of the matching policies: run
+        evaluate_conditions on each candidate for the remaining keys.
+        
+        Args:
+            context: Request context (time, user, change type, etc)
+        """
+        clauses = []
+        for key, attribute, kind in PROMOTED_CONDITIONS:
+            column = getattr(cls, attribute)
+            value = context.get(key)
+            if isinstance(value, kind):
+                clauses.append(or_(column.is_(None), column == value))
+            else:
+                clauses.append(column.is_(None))
+        return and_(*clauses)
+
     def evaluate_conditions(self, context: dict) -> bool:
         """Evaluate if policy applies to current context
         
@@ -101,18 +186,14 @@ class ControlPolicy(Base):
         Returns:
             True if policy should be applied
         """
-        if not self.conditions:
+        conditions = self.conditions
+        if not conditions:
             return True  # No conditions = always applies
         
         # Check auto-deny conditions first
-        if self.auto_deny_conditions:
-            for key, expected_value in self.auto_deny_conditions.items():
-                if context.get(key) == expected_value:
-                    return True  # Auto-deny triggered
+        auto_deny = self.auto_deny_conditions
+        if auto_deny and _matches_any(auto_deny, context):
+            return True  # Auto-deny triggered
         
         # Check standard conditions
-        for key, expected_value in self.conditions.items():
-            if context.get(key) != expected_value:
-                return False
-        
-        return True
+        return _matches_all(conditions, context)
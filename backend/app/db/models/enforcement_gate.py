@@ -16,16 +16,20 @@ Compliance:
 - SOC 2 CC6.1: Logical access controls
 - ISO 27001 A.9.4.1: Information access restriction
 """
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import JSONB, UUID, ARRAY
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Enum as SQLEnum, ForeignKey, Identity, Index, Integer, Table, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import JSONB, UUID, aggregate_order_by
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
+import uuid
+
+import orjson
 
-from .base import Base
+from app.db.base import Base
 
 
 class GateType(str, enum.Enum):
@@ -48,6 +52,20 @@ class GateOutcome(str, enum.Enum):
     DEGRADE = "DEGRADE"  # Degraded mode, allow read-only or limited operations
 
 
+# Control policies evaluated at each gate, in evaluation order. position is
+# an identity column, so links keep their insertion order without the
+# application numbering them.
+gate_control_policies = Table(
+    "gate_control_policies",
+    Base.metadata,
+    Column("gate_id", UUID(as_uuid=True), ForeignKey("enforcement_gates.id", ondelete="CASCADE"), primary_key=True),
+    Column("policy_id", UUID(as_uuid=True), ForeignKey("control_policies.id", ondelete="CASCADE"), primary_key=True),
+    Column("position", Integer, Identity(), nullable=False),
+    # "Which gates evaluate policy X" (the primary key leads with gate_id)
+    Index("idx_gate_control_policies_policy", "policy_id"),
+)
+
+
 class EnforcementGate(Base):
     """Enforcement gate where control policies are evaluated.
     
@@ -66,7 +84,7 @@ class EnforcementGate(Base):
     __tablename__ = "enforcement_gates"
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     
     # Gate Identification
     gate_key = Column(String(100), nullable=False, unique=True, index=True)
@@ -80,10 +98,6 @@ class EnforcementGate(Base):
     workflow_id = Column(UUID(as_uuid=True), ForeignKey('workflows.id', ondelete='SET NULL'), nullable=True, index=True)
     capability_id = Column(UUID(as_uuid=True), ForeignKey('capabilities.id', ondelete='SET NULL'), nullable=True, index=True)
     
-    # Control Policy Associations
-    control_policy_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list)
-    """List of control policy UUIDs to evaluate at this gate"""
-    
     # Enforcement Configuration
     enforcement_mode = Column(String(50), nullable=False, default='BLOCKING')
     """BLOCKING (fail-closed) or MONITORING (fail-open with warnings)"""
@@ -99,8 +113,9 @@ class EnforcementGate(Base):
     capture_outputs = Column(Boolean, nullable=False, default=True)
     capture_context = Column(Boolean, nullable=False, default=True)
     
-    # Metadata
-    metadata = Column(JSONB, nullable=False, default=dict)
+    # Metadata (attribute renamed: "metadata" is reserved by declarative Base;
+    # the column keeps its name)
+    gate_metadata = Column('metadata', JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Additional configuration:
     - timeout_seconds: Max time for gate evaluation
     - retry_policy: Retry configuration for transient failures
@@ -113,19 +128,46 @@ class EnforcementGate(Base):
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(UUID(as_uuid=True), nullable=False)
     updated_by = Column(UUID(as_uuid=True), nullable=False)
 
     # Relationships
-    workflow = relationship("Workflow", foreign_keys=[workflow_id], backref="enforcement_gates")
-    capability = relationship("Capability", foreign_keys=[capability_id], backref="enforcement_gates")
+    # lazy="raise": an unplanned per-row SELECT fails instead of becoming an
+    # N+1; load with selectinload(EnforcementGate.workflow) etc. when needed
+    workflow = relationship("Workflow", foreign_keys=[workflow_id], back_populates="enforcement_gates", lazy="raise")
+    capability = relationship("Capability", foreign_keys=[capability_id], back_populates="enforcement_gates", lazy="raise")
+    # Execution history is unbounded (partitioned by month): write-only, read
+    # with explicit queries (list_as_dicts); the database cascades deletes
+    executions = relationship(
+        "GateExecution",
+        back_populates="gate",
+        lazy="write_only",
+        passive_deletes=True,
+    )
+    # Control policies to evaluate at this gate; load with
+    # selectinload(EnforcementGate.control_policies) before calling to_dict
+    control_policies = relationship(
+        "ControlPolicy",
+        secondary=gate_control_policies,
+        order_by=gate_control_policies.c.position,
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         Index('idx_gate_workflow', 'workflow_id', 'gate_type', 'is_active'),
         Index('idx_gate_capability', 'capability_id', 'gate_type', 'is_active'),
-        Index('idx_gate_active', 'is_active', 'gate_type'),
+        # Runtime lookup "active gates of type T (for workflow X)": partial, and
+        # covering (INCLUDE) so it is answered by an index-only scan
+        Index('idx_gate_active_partial', 'gate_type', 'workflow_id', postgresql_where=text('is_active'),
+              postgresql_include=['id', 'enforcement_mode']),
+        # Containment (@>) lookups, e.g. gates tagged HIPAA (see with_compliance_tag)
+        # Column name, not the attribute: the table column is keyed 'metadata'
+        Index('idx_gate_metadata_gin', 'metadata', postgresql_using='gin',
+              postgresql_ops={'metadata': 'jsonb_path_ops'}),
+        # Equality on gate criticality
+        Index('idx_gate_risk_level', text("(metadata ->> 'risk_level')")),
         {'comment': 'Enforcement gates for control policy evaluation (Phase 3: Enforcement)'}
     )
 
@@ -138,31 +180,82 @@ class EnforcementGate(Base):
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "gate_key": self.gate_key,
-            "gate_type": self.gate_type.value,
-            "name": self.name,
-            "description": self.description,
-            "workflow_id": str(self.workflow_id) if self.workflow_id else None,
-            "capability_id": str(self.capability_id) if self.capability_id else None,
-            "control_policy_ids": [str(pid) for pid in self.control_policy_ids],
-            "enforcement_mode": self.enforcement_mode,
-            "require_all_pass": self.require_all_pass,
-            "check_kill_switches": self.check_kill_switches,
-            "evidence_capture": {
-                "inputs": self.capture_inputs,
-                "outputs": self.capture_outputs,
-                "context": self.capture_context
-            },
-            "metadata": self.metadata,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "created_by": str(self.created_by),
-            "updated_by": str(self.updated_by)
-        }
+        """Serialize to dictionary for API responses.
+        
+        Results are cached per process by (id, updated_at, policy IDs):
+        any UPDATE bumps updated_at and policy links are part of the key,
+        so a stale dict is never returned. The dict may be shared between
+        callers; treat it as read-only.
+        
+        UUIDs, datetimes and enums are left native for orjson to encode
+        (ORJSONResponse), as in list_as_dicts.
+        """
+        policy_ids = [policy.id for policy in self.control_policies]
+        return _cached_dict(
+            _gate_dict_cache,
+            (self.id, self.updated_at, tuple(policy_ids)) if self.updated_at is not None else None,
+            lambda: _gate_dict(
+                self.id, self.gate_key, self.gate_type, self.name, self.description,
+                self.workflow_id, self.capability_id, policy_ids, self.enforcement_mode,
+                self.require_all_pass, self.check_kill_switches, self.capture_inputs,
+                self.capture_outputs, self.capture_context, self.gate_metadata, self.is_active,
+                self.created_at, self.updated_at, self.created_by, self.updated_by,
+            ),
+        )
+
+    def to_json(self) -> bytes:
+        """Encode to_dict() as JSON bytes, e.g. for Response(content=...)."""
+        return orjson.dumps(self.to_dict())
+
+    @classmethod
+    def with_compliance_tag(cls, tag: str):
+        """WHERE clause for gates whose metadata.compliance_tags include tag.
+        
+        Written as containment (@>) so idx_gate_metadata_gin applies.
+        """
+        return cls.gate_metadata.contains({"compliance_tags": [tag]})
+
+    @classmethod
+    async def list_as_dicts(cls, db: AsyncSession, limit: int = 1000, **filters: Any) -> List[Dict[str, Any]]:
+        """List gates as to_dict()-shaped dicts without building ORM objects.
+        
+        Runs a Core SELECT of the table columns and builds each dict from
+        the row tuple. UUIDs, datetimes and enums are left native for
+        orjson to encode (ORJSONResponse), instead of str()/isoformat().
+        
+        Args:
+            db: Database session
+            limit: Maximum gates to return (newest first)
+            **filters: column=value equality filters, e.g. is_active=True
+        """
+        query = _GATE_LIST_QUERY.where(
+            *(cls.__table__.c[name] == value for name, value in filters.items())
+        ).limit(limit)
+        result = await db.execute(query)
+        return [_gate_dict(*row) for row in result]
+
+
+class GateExecutionRow(NamedTuple):
+    """Plain gate execution row for the buffered write path (GateExecutionBuffer).
+
+    Converts straight to Core insert parameters via _asdict(), with no ORM
+    instance. There is no id field: the database assigns a time-ordered
+    uuid_generate_v7(). executed_at is stamped when the gate fires, not
+    when the batch is written.
+    """
+    gate_id: uuid.UUID
+    gate_key: str
+    execution_id: uuid.UUID
+    actor_id: uuid.UUID
+    actor_type: str
+    outcome: GateOutcome
+    executed_at: datetime
+    request_id: Optional[str] = None
+    controls_evaluated: List[Dict[str, Any]] = []
+    kill_switches_checked: List[Dict[str, Any]] = []
+    captured_evidence: Dict[str, Any] = {}
+    duration_ms: Optional[int] = None
+    errors: List[Any] = []
 
 
 class GateExecution(Base):
@@ -173,28 +266,29 @@ class GateExecution(Base):
     """
     __tablename__ = "gate_executions"
 
-    # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Primary Key (id, executed_at). Time-ordered UUIDv7, like audit_events:
+    # new rows append at the right edge of the index, not at random pages
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('uuid_generate_v7()'))
     
     # Gate Reference
-    gate_id = Column(UUID(as_uuid=True), ForeignKey('enforcement_gates.id', ondelete='CASCADE'), nullable=False, index=True)
+    gate_id = Column(UUID(as_uuid=True), ForeignKey('enforcement_gates.id', ondelete='CASCADE'), nullable=False)
     gate_key = Column(String(100), nullable=False, index=True)
     
     # Execution Context
     execution_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     """Links to workflow execution or capability invocation"""
     
-    request_id = Column(String(100), nullable=True, index=True)
+    request_id = Column(String(100), nullable=True)
     """Distributed tracing ID"""
     
     # Actor
-    actor_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    actor_id = Column(UUID(as_uuid=True), nullable=False)
     actor_type = Column(String(50), nullable=False)  # USER, AGENT, SYSTEM
     
     # Evaluation Results
-    outcome = Column(SQLEnum(GateOutcome), nullable=False, index=True)
+    outcome = Column(SQLEnum(GateOutcome), nullable=False)
     
-    controls_evaluated = Column(JSONB, nullable=False, default=list)
+    controls_evaluated = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
     """List of control evaluations:
     [
         {
@@ -207,7 +301,7 @@ class GateExecution(Base):
     ]
     """
     
-    kill_switches_checked = Column(JSONB, nullable=False, default=list)
+    kill_switches_checked = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
     """List of kill switches checked:
     [
         {
@@ -220,7 +314,7 @@ class GateExecution(Base):
     """
     
     # Evidence
-    captured_evidence = Column(JSONB, nullable=False, default=dict)
+    captured_evidence = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     """Captured context, inputs, outputs (sanitized for PHI/PII)"""
     
     # Performance
@@ -228,21 +322,33 @@ class GateExecution(Base):
     """Gate evaluation duration in milliseconds"""
     
     # Error Handling
-    errors = Column(JSONB, nullable=False, default=list)
+    errors = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
     """Any errors encountered during evaluation"""
     
-    # Timestamps
-    executed_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    # Timestamps (partition key, so part of the primary key)
+    executed_at = Column(DateTime, primary_key=True, server_default=func.now())
 
     # Relationships
-    gate = relationship("EnforcementGate", foreign_keys=[gate_id], backref="executions")
+    # gate_key is denormalized onto the row, so rendering never needs the gate
+    gate = relationship("EnforcementGate", foreign_keys=[gate_id], back_populates="executions", lazy="raise")
 
+    # gate_id, actor_id and outcome are covered by the composites below
     __table_args__ = (
         Index('idx_gate_exec_gate_time', 'gate_id', 'executed_at'),
         Index('idx_gate_exec_outcome_time', 'outcome', 'executed_at'),
         Index('idx_gate_exec_actor', 'actor_id', 'executed_at'),
         Index('idx_gate_exec_request', 'request_id'),
-        {'comment': 'Gate execution history for analytics and debugging (Phase 3: Enforcement)'}
+        # Append-only: executed_at tracks physical order, so BRIN prunes ranges cheaply
+        Index('idx_gate_exec_executed_brin', 'executed_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+        # Containment (@>) lookups into control results (see failed_policy)
+        Index('idx_gate_exec_controls_gin', 'controls_evaluated', postgresql_using='gin',
+              postgresql_ops={'controls_evaluated': 'jsonb_path_ops'}),
+        {
+            'comment': 'Gate execution history for analytics and debugging (Phase 3: Enforcement)',
+            # One child table per month (migration 035); retention drops whole partitions
+            'postgresql_partition_by': 'RANGE (executed_at)',
+        }
     )
 
     def __repr__(self) -> str:
@@ -253,22 +359,159 @@ class GateExecution(Base):
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "gate_id": str(self.gate_id),
-            "gate_key": self.gate_key,
-            "execution_id": str(self.execution_id),
-            "request_id": self.request_id,
-            "actor": {
-                "id": str(self.actor_id),
-                "type": self.actor_type
-            },
-            "outcome": self.outcome.value,
-            "controls_evaluated": self.controls_evaluated,
-            "kill_switches_checked": self.kill_switches_checked,
-            "captured_evidence": self.captured_evidence,
-            "duration_ms": self.duration_ms,
-            "errors": self.errors,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None
-        }
+        """Serialize to dictionary for API responses.
+        
+        Executions are write-once, so results are cached per process by
+        id alone. The dict may be shared between callers; treat it as
+        read-only. Values are left native, as in list_as_dicts.
+        """
+        return _cached_dict(
+            _execution_dict_cache,
+            self.id,
+            lambda: _execution_dict(
+                self.id, self.gate_id, self.gate_key, self.execution_id, self.request_id,
+                self.actor_id, self.actor_type, self.outcome, self.controls_evaluated,
+                self.kill_switches_checked, self.captured_evidence, self.duration_ms,
+                self.errors, self.executed_at,
+            ),
+        )
+
+    def to_json(self) -> bytes:
+        """Encode to_dict() as JSON bytes, e.g. for Response(content=...)."""
+        return orjson.dumps(self.to_dict())
+
+    @classmethod
+    def failed_policy(cls, policy_id: Any):
+        """WHERE clause for executions in which the given policy evaluated to FAIL.
+        
+        Written as containment (@>) so idx_gate_exec_controls_gin applies.
+        """
+        return cls.controls_evaluated.contains([{"policy_id": str(policy_id), "result": "FAIL"}])
+
+    @classmethod
+    async def list_as_dicts(cls, db: AsyncSession, limit: int = 1000, **filters: Any) -> List[Dict[str, Any]]:
+        """List executions as to_dict()-shaped dicts without building ORM objects.
+        
+        Gate history is the high-volume listing: a Core SELECT of the
+        table columns, one dict per row tuple. UUIDs, datetimes and enums
+        are left native for orjson to encode (ORJSONResponse).
+        
+        Args:
+            db: Database session
+            limit: Maximum executions to return (most recent first)
+            **filters: column=value equality filters, e.g. gate_id=...
+        """
+        query = _EXECUTION_LIST_QUERY.where(
+            *(cls.__table__.c[name] == value for name, value in filters.items())
+        ).limit(limit)
+        result = await db.execute(query)
+        return [_execution_dict(*row) for row in result]
+
+
+# Each gate's policy IDs in evaluation order, aggregated per row by PostgreSQL
+_GATE_POLICY_IDS = (
+    select(func.coalesce(
+        func.array_agg(aggregate_order_by(gate_control_policies.c.policy_id, gate_control_policies.c.position)),
+        text("'{}'::uuid[]"),
+    ))
+    .where(gate_control_policies.c.gate_id == EnforcementGate.id)
+    .scalar_subquery()
+)
+
+# Core list queries for list_as_dicts; column order matches the builders below.
+# Mapper columns are keyed by attribute ('gate_metadata'), table columns by
+# column key ('metadata')
+_gate_columns = inspect(EnforcementGate).columns
+_GATE_LIST_QUERY = select(
+    *(_gate_columns[name] for name in (
+        'id', 'gate_key', 'gate_type', 'name', 'description', 'workflow_id', 'capability_id',
+    )),
+    _GATE_POLICY_IDS.label('control_policy_ids'),
+    *(_gate_columns[name] for name in (
+        'enforcement_mode', 'require_all_pass', 'check_kill_switches',
+        'capture_inputs', 'capture_outputs', 'capture_context', 'gate_metadata', 'is_active',
+        'created_at', 'updated_at', 'created_by', 'updated_by',
+    )),
+).order_by(EnforcementGate.created_at.desc(), EnforcementGate.id.desc())
+
+_EXECUTION_LIST_QUERY = select(*(GateExecution.__table__.c[name] for name in (
+    'id', 'gate_id', 'gate_key', 'execution_id', 'request_id', 'actor_id', 'actor_type',
+    'outcome', 'controls_evaluated', 'kill_switches_checked', 'captured_evidence',
+    'duration_ms', 'errors', 'executed_at',
+))).order_by(GateExecution.executed_at.desc(), GateExecution.id.desc())
+
+
+# Serialized to_dict() results, bounded LRU per process (see to_dict)
+_TO_DICT_CACHE_SIZE = 4096
+_gate_dict_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+_execution_dict_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+
+
+def _cached_dict(cache: "OrderedDict[Hashable, Dict[str, Any]]", key: Optional[Hashable],
+                 build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return cache[key], building and storing it on a miss; key None bypasses the cache."""
+    if key is None:
+        return build()
+    data = cache.get(key)
+    if data is not None:
+        cache.move_to_end(key)
+        return data
+    data = cache[key] = build()
+    while len(cache) > _TO_DICT_CACHE_SIZE:
+        cache.popitem(last=False)
+    return data
+
+
+def _gate_dict(id, gate_key, gate_type, name, description, workflow_id, capability_id,
+               control_policy_ids, enforcement_mode, require_all_pass, check_kill_switches,
+               capture_inputs, capture_outputs, capture_context, gate_metadata, is_active,
+               created_at, updated_at, created_by, updated_by) -> Dict[str, Any]:
+    """EnforcementGate.to_dict() shape, from the model or a _GATE_LIST_QUERY row."""
+    return {
+        "id": id,
+        "gate_key": gate_key,
+        "gate_type": gate_type,
+        "name": name,
+        "description": description,
+        "workflow_id": workflow_id,
+        "capability_id": capability_id,
+        "control_policy_ids": control_policy_ids,
+        "enforcement_mode": enforcement_mode,
+        "require_all_pass": require_all_pass,
+        "check_kill_switches": check_kill_switches,
+        "evidence_capture": {
+            "inputs": capture_inputs,
+            "outputs": capture_outputs,
+            "context": capture_context
+        },
+        "metadata": gate_metadata,
+        "is_active": is_active,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "created_by": created_by,
+        "updated_by": updated_by
+    }
+
+
+def _execution_dict(id, gate_id, gate_key, execution_id, request_id, actor_id, actor_type,
+                    outcome, controls_evaluated, kill_switches_checked, captured_evidence,
+                    duration_ms, errors, executed_at) -> Dict[str, Any]:
+    """GateExecution.to_dict() shape, from the model or an _EXECUTION_LIST_QUERY row."""
+    return {
+        "id": id,
+        "gate_id": gate_id,
+        "gate_key": gate_key,
+        "execution_id": execution_id,
+        "request_id": request_id,
+        "actor": {
+            "id": actor_id,
+            "type": actor_type
+        },
+        "outcome": outcome,
+        "controls_evaluated": controls_evaluated,
+        "kill_switches_checked": kill_switches_checked,
+        "captured_evidence": captured_evidence,
+        "duration_ms": duration_ms,
+        "errors": errors,
+        "executed_at": executed_at
+    }
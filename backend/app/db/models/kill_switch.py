@@ -3,14 +3,19 @@
 Emergency stop mechanism - overrides ALL policies
 Critical safety feature for PHI/PII and production incidents
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Index, Enum as SQLEnum, Update, and_, or_, text, update
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from datetime import datetime, timedelta
-import uuid
+from typing import Any
 import enum
 
-from backend.app.db.base import Base
+from app.db.base import Base
+
+
+# deactivated_by recorded when the auto-release sweep releases a switch
+AUTO_DEACTIVATED_BY = "system:auto-deactivate"
 
 
 class KillSwitchMode(enum.Enum):
@@ -53,7 +58,7 @@ class KillSwitch(Base):
     __tablename__ = "kill_switches"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     switch_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Scope (NULL = global, affects everything)
@@ -81,20 +86,55 @@ class KillSwitch(Base):
     
     # Related incident tracking
     incident_id = Column(String(255), nullable=True, index=True)  # PagerDuty, Jira, etc
-    metadata = Column(JSONB, nullable=True, default=dict)
+    # Attribute renamed ("metadata" is reserved by declarative Base); column keeps its name
+    kill_switch_metadata = Column('metadata', JSONB, nullable=True, server_default=text("'{}'::jsonb"))
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    workflow = relationship("Workflow", backref="kill_switches")
+    workflow = relationship("Workflow", back_populates="kill_switches", lazy="raise")
+
+    __table_args__ = (
+        # Engaged switches newest first; partial, so released switches add no index cost
+        Index('idx_kill_switches_active_created', 'created_at', postgresql_where=text('is_active')),
+        # Runtime check "engaged switch for workflow X or global" (live_for_workflow).
+        # B-tree indexes NULLs, so global (workflow_id IS NULL) switches are in it too
+        Index('idx_kill_switch_live', 'workflow_id', postgresql_where=text('is_active'),
+              postgresql_include=['mode', 'auto_deactivate_at']),
+        # Auto-release sweep (release_expired): only engaged switches with a deadline
+        Index('idx_kill_switch_auto_deactivate', 'auto_deactivate_at',
+              postgresql_where=text('is_active AND auto_deactivate_at IS NOT NULL')),
+    )
 
     def __repr__(self):
         status = "ACTIVE" if self.is_active else "INACTIVE"
         scope = f"workflow={self.workflow_id}" if self.workflow_id else "GLOBAL"
         return f"<KillSwitch({status}, mode={self.mode.value}, {scope})>"
 
+    @classmethod
+    def live_for_workflow(cls, workflow_id: Any):
+        """WHERE clause for engaged switches that apply to a workflow (its own and global).
+        
+        Written as is_active plus workflow_id = X OR IS NULL so idx_kill_switch_live applies.
+        A switch past auto_deactivate_at counts as released even before
+        the sweep (release_expired) reaches it, as in KillSwitchState.lookup;
+        auto_deactivate_at is an INCLUDE column of the index, so the check
+        needs no heap access.
+        
+        Args:
+            workflow_id: Workflow UUID, None for global switches only, or a
+                column expression (e.g. a correlated gate's workflow_id)
+        """
+        scope = cls.workflow_id.is_(None)
+        if workflow_id is not None:
+            scope = or_(cls.workflow_id == workflow_id, scope)
+        # Naive UTC column: compare in UTC regardless of the session time zone
+        now = func.timezone('UTC', func.now())
+        not_expired = or_(cls.auto_deactivate_at.is_(None), cls.auto_deactivate_at > now)
+        return and_(cls.is_active, scope, not_expired)
+
     @property
     def is_global(self) -> bool:
         """Check if kill switch affects ALL workflows"""
@@ -105,9 +145,32 @@ class KillSwitch(Base):
         """Check if kill switch blocks write operations"""
         return self.mode in (KillSwitchMode.HARD_STOP, KillSwitchMode.SOFT_STOP, KillSwitchMode.READ_ONLY)
 
+    @classmethod
+    def release_expired(cls) -> Update:
+        """UPDATE ... RETURNING id releasing every engaged switch past its auto_deactivate_at.
+        
+        One statement over idx_kill_switch_auto_deactivate (engaged switches
+        with a deadline only), run periodically by KillSwitchSweeper; rows
+        are never loaded to check should_auto_deactivate.
+        """
+        # Naive UTC column: compare in UTC regardless of the session time zone
+        now = func.timezone('UTC', func.now())
+        return (
+            update(cls)
+            .where(cls.is_active, cls.auto_deactivate_at.is_not(None), cls.auto_deactivate_at <= now)
+            .values(
+                is_active=False,
+                deactivated_at=now,
+                deactivated_by=AUTO_DEACTIVATED_BY,
+                resolution_notes=func.coalesce(cls.resolution_notes, 'Auto-deactivated at auto_deactivate_at'),
+            )
+            .returning(cls.id)
+            .execution_options(synchronize_session=False)
+        )
+
     @property
     def should_auto_deactivate(self) -> bool:
-        """Check if kill switch should auto-release"""
+        """Check if kill switch should auto-release (single row; the sweep uses release_expired)"""
         if not self.is_active or not self.auto_deactivate_at:
             return False
         return datetime.utcnow() >= self.auto_deactivate_at
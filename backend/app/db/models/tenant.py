@@ -6,13 +6,11 @@ with complete data isolation and tenant-specific configuration.
 Southern Shade LLC is the first tenant onboarding.
 """
 
-from sqlalchemy import Column, String, DateTime, Boolean, Text
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
 
-from backend.app.db.base import Base
+from app.db.base import Base
 
 
 class Tenant(Base):
@@ -24,18 +22,19 @@ class Tenant(Base):
     __tablename__ = "tenants"
     
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     tenant_key = Column(String(255), unique=True, nullable=False, index=True)  # e.g., "southern_shade_llc"
     
     # Tenant metadata
     tenant_name = Column(String(255), nullable=False)  # e.g., "Southern Shade LLC"
+    domain = Column(String(255), nullable=True)  # e.g., "southernshade.com"
     description = Column(Text, nullable=True)
     
     # Tenant status
     is_active = Column(Boolean, nullable=False, default=True)
     
     # Tenant-specific configuration (flexible JSON)
-    settings = Column(JSONB, nullable=True, default=dict)
+    settings = Column(JSONB, nullable=True, server_default=text("'{}'::jsonb"))
     # Example settings:
     # {
     #   "allowed_environments": ["dev", "staging", "prod"],
@@ -50,19 +49,19 @@ class Tenant(Base):
     billing_email = Column(String(255), nullable=True)
     
     # Audit trail
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(String(255), nullable=False)  # User/service principal
     
-    # Relationships (all tenant-scoped resources)
-    workflows = relationship("Workflow", back_populates="tenant", cascade="all, delete-orphan")
-    capabilities = relationship("Capability", back_populates="tenant", cascade="all, delete-orphan")
-    connectors = relationship("Connector", back_populates="tenant", cascade="all, delete-orphan")
-    control_policies = relationship("ControlPolicy", back_populates="tenant", cascade="all, delete-orphan")
-    kill_switches = relationship("KillSwitch", back_populates="tenant", cascade="all, delete-orphan")
-    break_glass_records = relationship("BreakGlass", back_populates="tenant", cascade="all, delete-orphan")
-    audit_events = relationship("AuditEvent", back_populates="tenant")
-    change_requests = relationship("ChangeRequest", back_populates="tenant")
+    # No tenant-scoped relationships yet: workflows, capabilities, etc. carry
+    # no tenant_id foreign key, so a relationship() here could not be mapped
+    # (and would fail mapper configuration for every model). Add each one
+    # together with its tenant_id column and migration.
+    
+    __table_args__ = (
+        Index('idx_tenant_created_keyset', 'created_at', 'id'),  # Keyset pagination
+        UniqueConstraint('domain', name='uq_tenants_domain'),
+    )
     
     def __repr__(self):
         return f"<Tenant(key='{self.tenant_key}', name='{self.tenant_name}', active={self.is_active})>"
@@ -3,14 +3,13 @@
 NIST AI RMF MAP function: Catalog high-risk AI workflows
 Enterprise-grade model for PHI/PII regulated environments
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
 import enum
 
-from backend.app.db.base import Base
+from app.db.base import Base
 
 
 class RiskLevel(enum.Enum):
@@ -37,7 +36,7 @@ class Workflow(Base):
     __tablename__ = "workflows"
 
     # Primary identity
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     workflow_key = Column(String(255), unique=True, nullable=False, index=True)
     
     # Descriptive metadata
@@ -51,16 +50,25 @@ class Workflow(Base):
     status = Column(SQLEnum(WorkflowStatus), nullable=False, default=WorkflowStatus.ACTIVE)
     
     # Audit trail (append-only)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     created_by = Column(String(255), nullable=False)  # User/service principal
     
-    # Flexible schema for domain-specific metadata
-    metadata = Column(JSONB, nullable=True, default=dict)
+    # Flexible schema for domain-specific metadata (attribute renamed:
+    # "metadata" is reserved by declarative Base; the column keeps its name)
+    workflow_metadata = Column('metadata', JSONB, nullable=True, server_default=text("'{}'::jsonb"))
     
     # Relationships
     capabilities = relationship("Capability", back_populates="workflow", cascade="all, delete-orphan")
     change_requests = relationship("ChangeRequest", back_populates="workflow")
+    # Load explicitly (selectinload) when needed; lazy loads raise
+    enforcement_gates = relationship("EnforcementGate", back_populates="workflow", lazy="raise")
+    kill_switches = relationship("KillSwitch", back_populates="workflow", lazy="raise")
+
+    __table_args__ = (
+        # Active workflows only; deprecated/deactivated history is not indexed
+        Index('idx_workflows_active', 'created_at', 'id', postgresql_where=text("status = 'ACTIVE'")),
+    )
 
     def __repr__(self):
         return f"<Workflow(key='{self.workflow_key}', risk={self.risk_level.value}, status={self.status.value})>"
@@ -36,7 +36,7 @@ async def seed_database():
                 description="HIPAA-compliant patient data analysis pipeline",
                 requires_approval=True,
                 approval_stages=["data_officer", "security_team"],
-                metadata={
+                workflow_metadata={
                     "compliance": ["HIPAA", "SOC2"],
                     "data_classification": "PHI",
                 },
@@ -46,7 +46,7 @@ async def seed_database():
                 description="Multi-stage production database schema migration",
                 requires_approval=True,
                 approval_stages=["dba", "tech_lead", "cto"],
-                metadata={
+                workflow_metadata={
                     "risk_level": "critical",
                     "rollback_plan": "automated",
                 },
@@ -56,7 +56,7 @@ async def seed_database():
                 description="AI-powered customer inquiry handler",
                 requires_approval=False,
                 approval_stages=[],
-                metadata={"customer_facing": True},
+                workflow_metadata={"customer_facing": True},
             ),
         ]
         
@@ -158,21 +158,21 @@ async def seed_database():
                     "environment": "prod",
                     "operation_type": "write",
                 },
-                metadata={"priority": "high"},
+                policy_metadata={"priority": "high"},
             ),
             ControlPolicy(
                 name="PHI Access Logging",
                 description="Mandatory audit logging for PHI data access",
                 outcome=PolicyOutcome.ALLOW,
                 conditions={"data_classification": "PHI"},
-                metadata={"audit_required": True},
+                policy_metadata={"audit_required": True},
             ),
             ControlPolicy(
                 name="Block Unencrypted Transmission",
                 description="Deny operations without TLS/encryption",
                 outcome=PolicyOutcome.DENY,
                 conditions={"encryption": False},
-                metadata={"compliance": "SOC2"},
+                policy_metadata={"compliance": "SOC2"},
             ),
         ]
         
@@ -190,7 +190,7 @@ async def seed_database():
                 scope_identifiers=["prod"],
                 is_active=False,
                 reason="Available for emergency use",
-                metadata={"severity": "critical"},
+                kill_switch_metadata={"severity": "critical"},
             ),
             KillSwitch(
                 name="PHI Access Suspension",
@@ -215,7 +215,7 @@ async def seed_database():
                 granted_to="sre-team@example.com",
                 expires_at=datetime.utcnow() + timedelta(hours=2),
                 capabilities_granted=["execute_database_migration"],
-                metadata={"incident_id": "INC-12345"},
+                break_glass_metadata={"incident_id": "INC-12345"},
             ),
         ]
         
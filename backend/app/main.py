@@ -18,12 +18,17 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 
-from app.db.database import init_db, check_db_connection
+from app.db.database import init_db, check_db_connection, dispose_db
+from app.services.audit_buffer import get_audit_buffer
+from app.services.gate_execution_buffer import get_gate_execution_buffer
+from app.services.kill_switch_state import get_kill_switch_state
+from app.services.kill_switch_sweeper import get_kill_switch_sweeper
+from app.services.partition_maintainer import get_partition_maintainer
 
 # App metadata
 VERSION = "0.1.0"
@@ -62,22 +67,45 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     Handles startup and shutdown events:
     - Startup: Initialize database connection, verify schema
-    - Shutdown: Clean up resources
+    - Startup: Start the audit event and gate execution flush loops
+    - Startup: Start the kill switch auto-release sweep and state listener
+    - Startup: Start the daily monthly-partition maintenance
+    - Shutdown: Flush buffered audit events and gate executions, clean up resources
     """
     # Startup
     print("🚀 S.S.O. Control Plane starting up...")
+    
     try:
-        if check_db_connection():
+        if await check_db_connection():
             print("✅ Database connection successful")
+            await get_partition_maintainer().maintain()
         else:
             print("⚠️  Database connection failed - check DATABASE_URL")
     except Exception as e:
         print(f"❌ Database initialization error: {e}")
     
+    get_audit_buffer().start()
+    get_gate_execution_buffer().start()
+    get_kill_switch_sweeper().start()
+    get_kill_switch_state().start()
+    get_partition_maintainer().start()
+    
     yield
     
     # Shutdown
     print("🛑 S.S.O. Control Plane shutting down...")
+    await get_partition_maintainer().stop()
+    await get_kill_switch_state().stop()
+    await get_kill_switch_sweeper().stop()
+    try:
+        await get_audit_buffer().stop()
+    except Exception as e:
+        print(f"❌ Audit event flush failed: {e}")
+    try:
+        await get_gate_execution_buffer().stop()
+    except Exception as e:
+        print(f"❌ Gate execution flush failed: {e}")
+    await dispose_db()
 
 # Create FastAPI application
 app = FastAPI(
@@ -85,6 +113,7 @@ app = FastAPI(
     description=DESCRIPTION,
     version=VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # Native UUID/datetime encoding
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -104,7 +133,7 @@ app.add_middleware(
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 # Register API routers
-from app.api import workflows, capabilities, connectors, control_policies, kill_switches, change_requests, llm, tenants
+from app.api import workflows, capabilities, connectors, control_policies, kill_switches, change_requests, gates, llm, tenants
 
 app.include_router(workflows.router, prefix="/api")
 app.include_router(capabilities.router, prefix="/api")
@@ -112,6 +141,7 @@ app.include_router(connectors.router, prefix="/api")
 app.include_router(control_policies.router, prefix="/api")
 app.include_router(kill_switches.router, prefix="/api")
 app.include_router(change_requests.router, prefix="/api")
+app.include_router(gates.router, prefix="/api")
 app.include_router(tenants.router, prefix="/api")
 app.include_router(llm.router)  # LLM chat completions endpoint
 
@@ -119,7 +149,7 @@ app.include_router(llm.router)  # LLM chat completions endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for load balancers and monitoring."""
-    db_healthy = check_db_connection()
+    db_healthy = await check_db_connection()
     return {
         "status": "healthy" if db_healthy else "degraded",
         "version": VERSION,
@@ -0,0 +1,273 @@
+"""AuditEventBuffer - Batched, hash-chained audit event writes
+
+Writing one audit event per INSERT costs a network round trip and a
+commit (WAL fsync) per event, on the request path. Instead, handlers
+push events onto a bounded asyncio.Queue and return; a single background
+worker drains the queue and writes each batch in one multi-row INSERT.
+A batch is written once it holds AUDIT_TRAIL_BUFFER_MAX_SIZE events or
+its oldest event has waited AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL seconds.
+
+Hash chain linkage is computed by the worker at write time: it takes a
+transaction-scoped advisory lock (so workers in other processes append
+to the chain one at a time), reads the chain tail once, then assigns
+sequence numbers and previous_hash/event_hash locally in enqueue order.
+
+Events are buffered as AuditEventRow tuples (AuditEvent.create_row) and
+written with a Core INSERT, so no ORM instances are built on this path.
+
+Once the queue is AUDIT_TRAIL_QUEUE_HIGH_WATER (80%) of
+AUDIT_TRAIL_QUEUE_MAX_SIZE full, enqueue() waits for the worker to drain
+it, which applies back-pressure to callers instead of growing without
+bound. Events still queued when a process dies are lost; callers that
+must not lose an event (e.g. BLOCKED outcomes) pass wait=True, which
+returns only once the event is committed. Those callers may also use
+the last 20% of the queue, so bulk traffic does not hold them back.
+
+A batch the database rejects is retried AUDIT_TRAIL_MAX_WRITE_ATTEMPTS
+times, then bisected until the rejected rows are written alone; those
+are logged and dropped, so one bad event cannot hold up everything
+queued behind it. Lost connections are not counted: nothing can be
+written until the database is back, and the queue applies back-pressure
+meanwhile.
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.database import async_session_maker, is_disconnect
+from app.db.models.audit_event import AuditEvent, AuditEventRow, compute_hash_for_row
+
+
+logger = logging.getLogger(__name__)
+
+# Batch triggers
+AUDIT_TRAIL_BUFFER_MAX_SIZE = int(os.getenv("AUDIT_TRAIL_BUFFER_MAX_SIZE", "500"))
+AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL = float(os.getenv("AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL", "0.03"))
+
+# Queue capacity; enqueue() blocks once it is reached
+AUDIT_TRAIL_QUEUE_MAX_SIZE = int(os.getenv("AUDIT_TRAIL_QUEUE_MAX_SIZE", "10000"))
+# Fill level at which enqueue() without wait=True starts to block
+AUDIT_TRAIL_QUEUE_HIGH_WATER = float(os.getenv("AUDIT_TRAIL_QUEUE_HIGH_WATER", "0.8"))
+
+# Attempts at a rejected batch before it is split to isolate the bad rows
+AUDIT_TRAIL_MAX_WRITE_ATTEMPTS = int(os.getenv("AUDIT_TRAIL_MAX_WRITE_ATTEMPTS", "3"))
+
+# Pause before retrying a batch whose write failed
+_RETRY_DELAY_SECONDS = 1.0
+
+# pg_advisory_xact_lock key serializing chain appends across workers
+_CHAIN_LOCK_KEY = 0x55504144  # "AUDT"
+
+_CHAIN_TAIL_QUERY = (
+    select(AuditEvent.sequence_number, AuditEvent.event_hash)
+    .order_by(AuditEvent.sequence_number.desc())
+    .limit(1)
+)
+
+# Every batch sends the same full column set (AuditEventRow fields), so this
+# compiles to one statement text: SQLAlchemy reuses the compiled form and
+# asyncpg's executemany prepares it once per connection (statement cache,
+# DB_USE_PGBOUNCER off) and pipelines the rows through that plan
+_INSERT_QUERY = insert(AuditEvent.__table__)
+
+# Queue entry: the row, and a future to resolve once it is committed (wait=True)
+_Entry = Tuple[AuditEventRow, Optional[asyncio.Future]]
+
+
+class AuditEventBuffer:
+    """Queue plus background worker that writes audit events in batches."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker = async_session_maker,
+        max_size: int = AUDIT_TRAIL_BUFFER_MAX_SIZE,
+        flush_interval: float = AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL,
+        queue_size: int = AUDIT_TRAIL_QUEUE_MAX_SIZE,
+    ):
+        """
+        Initialize the AuditEventBuffer.
+
+        Args:
+            session_maker: Session factory used for batch transactions
+            max_size: Events per batch INSERT
+            flush_interval: Longest an event waits for its batch to fill
+            queue_size: Queued events before enqueue() blocks (callers
+                without wait=True block at AUDIT_TRAIL_QUEUE_HIGH_WATER of it)
+        """
+        self.session_maker = session_maker
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Optional[_Entry]]" = asyncio.Queue(maxsize=queue_size)
+        self._high_water = max(1, int(queue_size * AUDIT_TRAIL_QUEUE_HIGH_WATER))
+        self._below_high_water = asyncio.Event()
+        self._below_high_water.set()
+        # Entries still unwritten when stop() gave up on a lost connection
+        self._unwritten: List[_Entry] = []
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def enqueue(self, row: AuditEventRow, wait: bool = False) -> None:
+        """Queue one event built with AuditEvent.create_row().
+
+        create_row stamps created_at at the time of the action, since it
+        is part of the event hash.
+
+        Args:
+            row: Event to write
+            wait: Return only after the event is committed (raises if it
+                is dropped); otherwise return as soon as it is queued
+        """
+        future = asyncio.get_running_loop().create_future() if wait else None
+        if future is None:
+            while self._queue.qsize() >= self._high_water:
+                self._below_high_water.clear()
+                await self._below_high_water.wait()
+        await self._queue.put((row, future))
+        if future is not None:
+            await future
+
+    async def _next_batch(self) -> Tuple[List[_Entry], bool]:
+        """Collect the next batch; the flag is True once stop() was requested."""
+        batch: List[_Entry] = []
+        entry = await self._queue.get()
+        if entry is None:
+            return batch, True
+        batch.append(entry)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.max_size:
+            try:
+                entry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                # Someone is waiting on this batch: write what we have now
+                if any(future is not None for _, future in batch):
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    async def _write(self, batch: List[_Entry], attempts: int = AUDIT_TRAIL_MAX_WRITE_ATTEMPTS) -> None:
+        """Write a batch and settle its waiters; bisect it if it keeps failing.
+
+        A rejected batch is tried `attempts` times, then each half once
+        (recursively), so a bad row ends up alone and is dropped while
+        the rows around it are written, in order. Lost connections are
+        retried without limit, except once stop() was requested.
+        """
+        failures = 0
+        while True:
+            error = await self._try_write(batch)
+            if error is None:
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_result(None)
+                return
+            if is_disconnect(error):
+                if self._stopping:
+                    self._unwritten.extend(batch)
+                    self._fail_waiters(batch, error)
+                    return
+            else:
+                failures += 1
+                if failures >= attempts:
+                    break
+            await asyncio.sleep(_RETRY_DELAY_SECONDS)
+
+        if len(batch) == 1:
+            row, _ = batch[0]
+            logger.error(f"Dropping audit event the database rejected: {row!r}: {error}")
+            self._fail_waiters(batch, error)
+            return
+        middle = len(batch) // 2
+        await self._write(batch[:middle], attempts=1)
+        await self._write(batch[middle:], attempts=1)
+
+    async def _try_write(self, batch: List[_Entry]) -> Optional[Exception]:
+        """Write a batch in its own transaction; return the error if it failed."""
+        try:
+            async with self.session_maker() as db:
+                await self._write_batch(db, [row for row, _ in batch])
+        except Exception as e:
+            logger.error(f"Audit event write failed ({len(batch)} events): {e}")
+            return e
+        return None
+
+    @staticmethod
+    def _fail_waiters(batch: List[_Entry], error: Exception) -> None:
+        """Raise the write error in every wait=True caller of a batch."""
+        for _, future in batch:
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    async def _write_batch(db: AsyncSession, batch: List[AuditEventRow]) -> None:
+        """Chain and insert a batch: lock, read the tail, one multi-row INSERT."""
+        await db.execute(select(func.pg_advisory_xact_lock(_CHAIN_LOCK_KEY)))
+        tail = (await db.execute(_CHAIN_TAIL_QUERY)).first()
+        sequence_number, previous_hash = tail if tail is not None else (0, None)
+
+        rows = []
+        for row in batch:
+            sequence_number += 1
+            row = row._replace(sequence_number=sequence_number, previous_hash=previous_hash)
+            previous_hash = compute_hash_for_row(row)
+            rows.append(row._replace(event_hash=previous_hash).insert_params())
+
+        await db.execute(_INSERT_QUERY, rows)
+        await db.commit()
+
+    async def _run(self) -> None:
+        """Background worker: drain the queue batch by batch until stopped."""
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if self._queue.qsize() < self._high_water:
+                self._below_high_water.set()
+            if batch:
+                await self._write(batch)
+
+    def start(self) -> None:
+        """Start the background worker (call on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything queued so far, then stop the worker."""
+        if self._task is None:
+            return
+        # Sentinel: the worker writes every entry ahead of it, then exits
+        self._stopping = True
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        if self._unwritten or not self._queue.empty():
+            logger.error(
+                f"Audit events not written at shutdown: "
+                f"{len(self._unwritten) + self._queue.qsize()}"
+            )
+
+
+# Singleton instance for FastAPI dependency injection
+_buffer_instance: Optional[AuditEventBuffer] = None
+
+
+def get_audit_buffer() -> AuditEventBuffer:
+    """Get or create the global AuditEventBuffer instance."""
+    global _buffer_instance
+    if _buffer_instance is None:
+        _buffer_instance = AuditEventBuffer()
+    return _buffer_instance
@@ -0,0 +1,137 @@
+"""Audit chain verification
+
+find_broken_link checks that every audit event's previous_hash equals the event_hash of
+the event before it, across the whole log, without building ORM
+objects: only (sequence_number, event_hash, previous_hash) are streamed,
+in sequence order, and each chunk is compared with list slicing, which
+runs the per-element comparison in C.
+
+A link check alone does not prove events are untampered (an attacker
+who rewrites an event can rewrite its hash too); pair it with
+verify_new_events, which recomputes hashes.
+
+verify_new_events is incremental: each run records a high-water mark in
+audit_chain_verifications, and the next run recomputes hashes only for
+events after it. The log is append-only, so steady-state cost is
+O(new events). Pass full=True to re-verify from the start (e.g. for a
+periodic deep audit), since a checkpoint cannot notice later tampering
+with events it already covered.
+"""
+
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.audit_event import AuditChainVerification, AuditEvent, row_hash_matches
+
+
+# Rows fetched per round trip while streaming the chain
+LINK_CHECK_CHUNK_SIZE = 10000
+
+_LINKS_QUERY = (
+    select(AuditEvent.sequence_number, AuditEvent.event_hash, AuditEvent.previous_hash)
+    .order_by(AuditEvent.sequence_number)
+    .execution_options(yield_per=LINK_CHECK_CHUNK_SIZE)
+)
+
+# Only the columns compute_hash reads, plus the stored hash
+_HASH_COLUMNS = (
+    AuditEvent.sequence_number,
+    AuditEvent.event_type,
+    AuditEvent.action,
+    AuditEvent.actor_id,
+    AuditEvent.actor_type,
+    AuditEvent.resource_type,
+    AuditEvent.resource_id,
+    AuditEvent.outcome,
+    AuditEvent.context,
+    AuditEvent.previous_hash,
+    AuditEvent.event_hash,
+    AuditEvent.created_at,
+)
+
+_CHECKPOINT_QUERY = (
+    select(AuditChainVerification.verified_through_sequence, AuditChainVerification.verified_hash)
+    .order_by(AuditChainVerification.verified_through_sequence.desc())
+    .limit(1)
+)
+
+
+async def find_broken_link(db: AsyncSession) -> Optional[int]:
+    """Return the sequence_number of the first event whose link is broken.
+
+    Args:
+        db: Transactional session (async_session_maker, not get_read_db:
+            server-side cursors need a transaction)
+
+    Returns:
+        sequence_number of the first event whose previous_hash does not
+        match its predecessor's event_hash, or None if the chain is intact
+    """
+    result = await db.stream(_LINKS_QUERY)
+    first = True
+    last_hash: Optional[str] = None
+    async for chunk in result.partitions():
+        sequences, event_hashes, previous_hashes = zip(*chunk)
+        if first:
+            # The genesis event links to nothing; if retention has dropped
+            # the oldest partitions, trust the first retained link
+            first = False
+            if sequences[0] != 1:
+                last_hash = previous_hashes[0]
+        # Compare the chunk's links in one shot, including the link to the
+        # last event of the previous chunk (None before the genesis event)
+        expected = (last_hash,) + event_hashes[:-1]
+        if expected != previous_hashes:
+            for sequence, want, got in zip(sequences, expected, previous_hashes):
+                if want != got:
+                    return sequence
+        last_hash = event_hashes[-1]
+    return None
+
+
+async def verify_new_events(db: AsyncSession, full: bool = False) -> Optional[int]:
+    """Verify hashes and links of events past the last checkpoint.
+
+    On success the new high-water mark is recorded and committed; on
+    failure nothing is recorded, so the next run re-checks the same range.
+
+    Args:
+        db: Transactional session (async_session_maker, not get_read_db:
+            server-side cursors need a transaction)
+        full: Ignore the checkpoint and verify the whole log
+
+    Returns:
+        sequence_number of the first event whose hash or link is invalid,
+        or None if every checked event is valid
+    """
+    checkpoint = None if full else (await db.execute(_CHECKPOINT_QUERY)).first()
+    query = select(*_HASH_COLUMNS).order_by(AuditEvent.sequence_number)
+    if checkpoint is not None:
+        through, last_hash = checkpoint
+        query = query.where(AuditEvent.sequence_number > through)
+    else:
+        through, last_hash = 0, None
+
+    result = await db.stream(query.execution_options(yield_per=LINK_CHECK_CHUNK_SIZE))
+    verified = 0
+    async for chunk in result.partitions():
+        for row in chunk:
+            # Oldest retained event when earlier partitions were dropped
+            first_retained = through == 0 and verified == 0 and row.sequence_number != 1
+            if (row.previous_hash != last_hash and not first_retained) or not row_hash_matches(row):
+                return row.sequence_number
+            through, last_hash = row.sequence_number, row.event_hash
+            verified += 1
+
+    if verified:
+        await db.execute(
+            insert(AuditChainVerification).values(
+                verified_through_sequence=through,
+                verified_hash=last_hash,
+                events_verified=verified,
+            )
+        )
+        await db.commit()
+    return None
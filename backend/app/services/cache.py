@@ -0,0 +1,215 @@
+"""QueryCache - Redis-backed cache for serialized list responses
+
+Registry data (capabilities, connectors) is read thousands of times per
+write. QueryCache stores the fully rendered JSON body of a list response
+together with its ETag, keyed by a hash of the request filters, so a hit
+bypasses both the database and serialization.
+
+Entries carry a short TTL and are invalidated by namespace on every
+mutating endpoint. invalidate() also bumps the namespace's generation
+counter; a reader takes generation() before querying the database and
+passes it to set(), which stores the body only if no invalidation ran in
+between. Otherwise a page rendered (or streamed) from rows read before a
+write could be stored after that write's invalidation and served stale
+until its TTL.
+
+The cache is strictly best-effort: if REDIS_URL is not set or Redis is
+unreachable, every call degrades to a miss/no-op.
+
+LocalTTLCache is a per-process layer in front of Redis for tiny, very hot
+responses where even a Redis round trip matters (the active kill switch
+set read on every enforcement check).
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger(__name__)
+
+# Default entry lifetime in seconds
+DEFAULT_TTL_SECONDS = 60
+
+# HSET + EXPIRE only while the namespace generation (KEYS[2]) is still
+# ARGV[1]; one script, so no invalidation can run between check and write
+_SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'etag', ARGV[2], 'body', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+class QueryCache:
+    """Namespaced Redis cache for rendered response bodies."""
+
+    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the QueryCache.
+
+        Args:
+            redis_url: Redis connection URL (falls back to REDIS_URL env var)
+            ttl_seconds: Expiry applied to every cached entry
+        """
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        self.ttl_seconds = ttl_seconds
+        self.client = aioredis.from_url(redis_url) if redis_url else None
+        self._set_if_generation = (
+            self.client.register_script(_SET_IF_GENERATION) if self.client is not None else None
+        )
+
+    @staticmethod
+    def make_key(namespace: str, params: Dict[str, Any]) -> str:
+        """Build a cache key from a namespace and the request's filter params."""
+        digest = hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        return f"{namespace}:{digest}"
+
+    @staticmethod
+    def generation_key(namespace: str) -> str:
+        """Key of a namespace's generation counter (outside the namespace:* entries)."""
+        return f"{namespace}#generation"
+
+    async def generation(self, namespace: str) -> Optional[int]:
+        """Current generation of a namespace; None if Redis is unavailable (do not cache)."""
+        if self.client is None:
+            return None
+        try:
+            value = await self.client.get(self.generation_key(namespace))
+        except RedisError as e:
+            logger.warning(f"Query cache generation read failed for {namespace}: {e}")
+            return None
+        return int(value) if value is not None else 0
+
+    async def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Return (etag, body) for a cached entry, or None on miss."""
+        if self.client is None:
+            return None
+        try:
+            entry = await self.client.hgetall(key)
+        except RedisError as e:
+            logger.warning(f"Query cache read failed: {e}")
+            return None
+        if not entry:
+            return None
+        return entry[b"etag"].decode("utf-8"), entry[b"body"]
+
+    async def set(
+        self,
+        key: str,
+        etag: str,
+        body: bytes,
+        ttl_seconds: Optional[int] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a rendered body and its ETag.
+
+        ttl_seconds overrides the default expiry, so volatile namespaces
+        (e.g. kill switches) can use a shorter lifetime. With generation
+        (from generation() taken before the database read), the entry is
+        dropped if the namespace was invalidated since.
+        """
+        if self.client is None:
+            return
+        try:
+            if generation is not None:
+                namespace = key.rsplit(":", 1)[0]
+                await self._set_if_generation(
+                    keys=[key, self.generation_key(namespace)],
+                    args=[generation, etag, body, ttl_seconds or self.ttl_seconds],
+                )
+                return
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"etag": etag, "body": body})
+                pipe.expire(key, ttl_seconds or self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Query cache write failed: {e}")
+
+    async def invalidate(self, namespace: str) -> None:
+        """Drop every entry under a namespace (SCAN + UNLINK, non-blocking).
+
+        The generation is bumped first, so a set() for a page read before
+        this call can no longer land after the SCAN.
+        """
+        if self.client is None:
+            return
+        try:
+            await self.client.incr(self.generation_key(namespace))
+            keys = [key async for key in self.client.scan_iter(match=f"{namespace}:*", count=500)]
+            if keys:
+                await self.client.unlink(*keys)
+        except RedisError as e:
+            logger.warning(f"Query cache invalidation failed for {namespace}: {e}")
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self.client is not None:
+            await self.client.aclose()
+
+
+class LocalTTLCache:
+    """Small in-process TTL cache with a lock for collapsing concurrent misses.
+
+    Writes in the same process clear it via invalidate(); other workers
+    see changes once their entries expire, so keep ttl_seconds short.
+    """
+
+    def __init__(self, ttl_seconds: float = 1.0, maxsize: int = 64):
+        """
+        Initialize the LocalTTLCache.
+
+        Args:
+            ttl_seconds: Lifetime of each entry
+            maxsize: Entry cap; the cache is cleared when it is reached
+        """
+        self.ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        # Held while a miss is being filled, so concurrent requests for
+        # the same data wait for one load instead of each querying
+        self.lock = asyncio.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for ttl_seconds."""
+        if len(self._entries) >= self._maxsize:
+            self._entries.clear()
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+# Singleton instance for FastAPI dependency injection
+_cache_instance: Optional[QueryCache] = None
+
+
+def get_query_cache() -> QueryCache:
+    """Get or create the global QueryCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = QueryCache()
+    return _cache_instance
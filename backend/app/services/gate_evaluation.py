@@ -0,0 +1,156 @@
+"""Gate evaluation - kill switches and control policies in one round trip
+
+Evaluating a gate (see EnforcementGate) needs the gate's settings, the
+engaged kill switch that applies to its workflow, and the gate's active
+control policies. Fetched separately that is 2 + N queries per firing;
+evaluate_gate issues one statement instead:
+
+- gate: the gate's evaluation settings (a CTE)
+- kill: at most one engaged, unexpired switch for the gate's workflow or
+  global, HARD_STOP first (LATERAL ... LIMIT 1, served by
+  idx_kill_switch_live; KillSwitch.live_for_workflow applies the same
+  auto_deactivate_at rule as KillSwitchState.lookup)
+- policies: the gate's linked policies in evaluation order, pre-filtered
+  in SQL by ControlPolicy.match_clause (promoted conditions). Under a
+  HARD_STOP no policy rows are returned at all
+
+The remaining condition keys are checked in Python with
+ControlPolicy.evaluate_conditions on the few candidates that come back.
+
+While KillSwitchState is live (LISTEN/NOTIFY), the kill switch is
+resolved from memory instead and the kill CTE is left out of the query.
+"""
+
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import and_, case, null, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.db.models.control_policy import ControlPolicy
+from app.db.models.enforcement_gate import EnforcementGate, GateOutcome, gate_control_policies
+from app.db.models.kill_switch import KillSwitch, KillSwitchMode
+from app.services.kill_switch_state import get_kill_switch_state
+
+
+class GateEvaluation(NamedTuple):
+    """Result of evaluating one gate firing."""
+    gate_key: str
+    outcome: GateOutcome
+    kill_switch_id: Optional[uuid.UUID]
+    applicable_policy_ids: List[uuid.UUID]
+    failed_policy_ids: List[uuid.UUID]
+
+
+# HARD_STOP outranks every other engaged mode
+_KILL_SWITCH_RANK = case((KillSwitch.mode == KillSwitchMode.HARD_STOP, 0), else_=1)
+
+
+def _evaluation_query(gate_id: uuid.UUID, context: Dict[str, Any], kill_switch_in_sql: bool = True) -> Select:
+    """One row per candidate policy (or one row with no policy), each carrying the gate and kill switch columns.
+
+    With kill_switch_in_sql False the kill switch columns are NULL: the
+    caller resolves the switch from KillSwitchState instead.
+    """
+    gate = (
+        select(
+            EnforcementGate.id,
+            EnforcementGate.gate_key,
+            EnforcementGate.workflow_id,
+            EnforcementGate.enforcement_mode,
+            EnforcementGate.require_all_pass,
+            EnforcementGate.check_kill_switches,
+        )
+        .where(EnforcementGate.id == gate_id, EnforcementGate.is_active)
+        .cte("gate")
+    )
+    policy_link = gate_control_policies.c.gate_id == gate.c.id
+    if kill_switch_in_sql:
+        kill = (
+            select(KillSwitch.id, KillSwitch.mode)
+            .where(gate.c.check_kill_switches, KillSwitch.live_for_workflow(gate.c.workflow_id))
+            .order_by(_KILL_SWITCH_RANK)
+            .limit(1)
+            .lateral("kill")
+        )
+        kill_columns = (kill.c.id.label("kill_switch_id"), kill.c.mode.label("kill_switch_mode"))
+        policy_link = and_(policy_link, or_(kill.c.mode.is_(None), kill.c.mode != KillSwitchMode.HARD_STOP))
+    else:
+        kill_columns = (null().label("kill_switch_id"), null().label("kill_switch_mode"))
+
+    query = select(
+        gate.c.gate_key,
+        gate.c.workflow_id,
+        gate.c.check_kill_switches,
+        gate.c.enforcement_mode,
+        gate.c.require_all_pass,
+        *kill_columns,
+        ControlPolicy,
+    ).select_from(gate)
+    if kill_switch_in_sql:
+        query = query.outerjoin(kill, true())
+    return (
+        query
+        .outerjoin(gate_control_policies, policy_link)
+        .outerjoin(
+            ControlPolicy,
+            and_(
+                ControlPolicy.id == gate_control_policies.c.policy_id,
+                ControlPolicy.is_active,
+                ControlPolicy.match_clause(context),
+            ),
+        )
+        .order_by(gate_control_policies.c.position)
+    )
+
+
+async def evaluate_gate(db: AsyncSession, gate_id: uuid.UUID, context: Dict[str, Any]) -> Optional[GateEvaluation]:
+    """Evaluate a gate against a request context.
+
+    Outcome rules:
+    - an engaged HARD_STOP kill switch: HARD_STOP; any other engaged mode: DEGRADE
+    - a policy fails when it applies (evaluate_conditions) and is blocking
+      (DENY or REQUIRE_APPROVAL)
+    - require_all_pass: any failure blocks; otherwise the gate blocks only
+      when every applicable policy failed
+    - a block is BLOCK in BLOCKING mode and WARNING in MONITORING mode;
+      failures that do not block are WARNING
+
+    Args:
+        db: Database session
+        gate_id: Gate being fired
+        context: Request context (time, user, change type, etc)
+
+    Returns:
+        GateEvaluation, or None if the gate does not exist or is inactive
+    """
+    state = get_kill_switch_state()
+    kill_switch_in_memory = state.is_live
+    rows = (await db.execute(_evaluation_query(gate_id, context, not kill_switch_in_memory))).all()
+    if not rows:
+        return None
+
+    gate_key, workflow_id, check_kill_switches, enforcement_mode, require_all_pass, kill_switch_id, kill_switch_mode, _ = rows[0]
+    if kill_switch_in_memory and check_kill_switches:
+        switch = state.lookup(workflow_id)
+        if switch is not None:
+            kill_switch_id, kill_switch_mode = switch.id, switch.mode
+    if kill_switch_mode is KillSwitchMode.HARD_STOP:
+        return GateEvaluation(gate_key, GateOutcome.HARD_STOP, kill_switch_id, [], [])
+    if kill_switch_mode is not None:
+        return GateEvaluation(gate_key, GateOutcome.DEGRADE, kill_switch_id, [], [])
+
+    applicable = [
+        policy for *_, policy in rows
+        if policy is not None and policy.evaluate_conditions(context)
+    ]
+    failed = [policy.id for policy in applicable if policy.is_blocking]
+    blocked = bool(failed) and (require_all_pass or len(failed) == len(applicable))
+    if blocked and enforcement_mode == "BLOCKING":
+        outcome = GateOutcome.BLOCK
+    elif failed:
+        outcome = GateOutcome.WARNING
+    else:
+        outcome = GateOutcome.ALLOW
+    return GateEvaluation(gate_key, outcome, None, [policy.id for policy in applicable], failed)
@@ -0,0 +1,190 @@
+"""GateExecutionBuffer - Batched gate execution history writes
+
+Every gate firing records a GateExecution row. Writing each one with its
+own INSERT and commit puts a round trip and a WAL flush on the gate's
+hot path, so handlers push GateExecutionRow tuples onto a bounded
+asyncio.Queue instead; a background worker writes each batch in one
+multi-row INSERT (asyncpg executemany over one prepared statement) and
+one commit. A batch is written once it holds GATE_EXECUTION_BUFFER_MAX_SIZE
+rows or its oldest row has waited GATE_EXECUTION_BUFFER_FLUSH_INTERVAL
+seconds.
+
+Unlike audit events (AuditEventBuffer) there is no hash chain to extend,
+so batches from different workers never serialize on a lock, and each
+batch commits with synchronous_commit = remote_write: execution history
+is diagnostic, and a standby crash may cost the last batch, not
+consistency. gate_executions carries no row triggers, which would turn
+the batched INSERT back into per-row work; keep it that way.
+
+When the queue is full (GATE_EXECUTION_QUEUE_MAX_SIZE), enqueue() waits
+for room. Rows still queued when a process dies are lost.
+
+A batch that fails is tried GATE_EXECUTION_MAX_WRITE_ATTEMPTS times and
+then given up on: a rejected batch is bisected so only the rows the
+database refuses are dropped, and a batch that cannot reach the
+database at all is dropped whole. Either way it is logged, and the
+queue behind it keeps draining, so the gate's enqueue() never waits on
+history that cannot be written.
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional, Tuple
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.database import async_session_maker, is_disconnect
+from app.db.models.enforcement_gate import GateExecution, GateExecutionRow
+
+
+logger = logging.getLogger(__name__)
+
+# Batch triggers
+GATE_EXECUTION_BUFFER_MAX_SIZE = int(os.getenv("GATE_EXECUTION_BUFFER_MAX_SIZE", "500"))
+GATE_EXECUTION_BUFFER_FLUSH_INTERVAL = float(os.getenv("GATE_EXECUTION_BUFFER_FLUSH_INTERVAL", "0.05"))
+
+# Queue capacity; enqueue() blocks once it is reached
+GATE_EXECUTION_QUEUE_MAX_SIZE = int(os.getenv("GATE_EXECUTION_QUEUE_MAX_SIZE", "10000"))
+
+# Attempts at a batch before it is split (rejected) or dropped (unreachable)
+GATE_EXECUTION_MAX_WRITE_ATTEMPTS = int(os.getenv("GATE_EXECUTION_MAX_WRITE_ATTEMPTS", "3"))
+
+# Pause before retrying a batch whose write failed
+_RETRY_DELAY_SECONDS = 1.0
+
+# Every batch sends the full GateExecutionRow column set, so this compiles
+# to one statement text that asyncpg prepares once per connection
+_INSERT_QUERY = insert(GateExecution.__table__)
+
+_SYNCHRONOUS_COMMIT = text("SET LOCAL synchronous_commit = remote_write")
+
+
+class GateExecutionBuffer:
+    """Queue plus background worker that writes gate executions in batches."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker = async_session_maker,
+        max_size: int = GATE_EXECUTION_BUFFER_MAX_SIZE,
+        flush_interval: float = GATE_EXECUTION_BUFFER_FLUSH_INTERVAL,
+        queue_size: int = GATE_EXECUTION_QUEUE_MAX_SIZE,
+    ):
+        """
+        Initialize the GateExecutionBuffer.
+
+        Args:
+            session_maker: Session factory used for batch transactions
+            max_size: Rows per batch INSERT
+            flush_interval: Longest a row waits for its batch to fill
+            queue_size: Queued rows before enqueue() blocks
+        """
+        self.session_maker = session_maker
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Optional[GateExecutionRow]]" = asyncio.Queue(maxsize=queue_size)
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def enqueue(self, row: GateExecutionRow) -> None:
+        """Queue one execution record; returns as soon as it is queued."""
+        await self._queue.put(row)
+
+    async def _next_batch(self) -> Tuple[List[GateExecutionRow], bool]:
+        """Collect the next batch; the flag is True once stop() was requested."""
+        batch: List[GateExecutionRow] = []
+        row = await self._queue.get()
+        if row is None:
+            return batch, True
+        batch.append(row)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.max_size:
+            try:
+                row = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if row is None:
+                return batch, True
+            batch.append(row)
+        return batch, False
+
+    async def _write(self, batch: List[GateExecutionRow], attempts: int = GATE_EXECUTION_MAX_WRITE_ATTEMPTS) -> None:
+        """Write a batch, retrying up to `attempts` times, then split or drop it.
+
+        A rejected batch is bisected, each half tried once (recursively),
+        so a bad row ends up alone and is dropped while the rows around
+        it are written. A batch that cannot reach the database is dropped.
+        """
+        for attempt in range(1, attempts + 1):
+            error = await self._try_write(batch)
+            if error is None:
+                return
+            if attempt < attempts and not self._stopping:
+                await asyncio.sleep(_RETRY_DELAY_SECONDS)
+
+        if len(batch) == 1:
+            logger.error(f"Dropping gate execution after failed write: {batch[0]!r}: {error}")
+            return
+        if is_disconnect(error):
+            logger.error(f"Dropping {len(batch)} gate executions: database unreachable: {error}")
+            return
+        middle = len(batch) // 2
+        await self._write(batch[:middle], attempts=1)
+        await self._write(batch[middle:], attempts=1)
+
+    async def _try_write(self, batch: List[GateExecutionRow]) -> Optional[Exception]:
+        """Write a batch in its own transaction; return the error if it failed."""
+        try:
+            async with self.session_maker() as db:
+                await db.execute(_SYNCHRONOUS_COMMIT)
+                await db.execute(_INSERT_QUERY, [row._asdict() for row in batch])
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Gate execution write failed ({len(batch)} rows): {e}")
+            return e
+        return None
+
+    async def _run(self) -> None:
+        """Background worker: drain the queue batch by batch until stopped."""
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if batch:
+                await self._write(batch)
+
+    def start(self) -> None:
+        """Start the background worker (call on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything queued so far, then stop the worker."""
+        if self._task is None:
+            return
+        # Sentinel: the worker writes every row ahead of it, then exits;
+        # failing batches are retried without the pause, then dropped
+        self._stopping = True
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+
+# Singleton instance for FastAPI dependency injection
+_buffer_instance: Optional[GateExecutionBuffer] = None
+
+
+def get_gate_execution_buffer() -> GateExecutionBuffer:
+    """Get or create the global GateExecutionBuffer instance."""
+    global _buffer_instance
+    if _buffer_instance is None:
+        _buffer_instance = GateExecutionBuffer()
+    return _buffer_instance
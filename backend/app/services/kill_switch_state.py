@@ -0,0 +1,209 @@
+"""KillSwitchState - In-process view of engaged kill switches, kept fresh by LISTEN/NOTIFY
+
+Every gate firing checks kill switches first, but switches change
+rarely. Each worker keeps the engaged switches in memory, grouped by
+scope (workflow_id, or None for global), and evaluate_gate consults that
+instead of querying kill_switches.
+
+Freshness: an AFTER INSERT/UPDATE/DELETE trigger on kill_switches
+(migration 038) sends NOTIFY kill_switch_changed with the switch id. A
+background task holds one connection with LISTEN on that channel and
+re-reads only the switch that changed. The full set is reloaded after
+LISTEN is established (so no change can slip between the two) and every
+KILL_SWITCH_STATE_RESYNC_INTERVAL seconds as a safety net.
+
+Reloads and refreshes run one at a time under a lock, each reading and
+applying in one step, so a slow read can never overwrite the result of
+a later one (two notifications for the same switch, or a notification
+during a reload).
+
+While the listener is down (startup, lost connection, or a transaction-
+pooling PgBouncer, which does not support LISTEN), is_live is False and
+callers fall back to querying the database. A termination listener on
+the LISTEN connection clears is_live as soon as the connection drops.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.db.database import USE_PGBOUNCER, engine
+from app.db.models.kill_switch import KillSwitch, KillSwitchMode
+
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "kill_switch_changed"
+
+# Seconds between full reloads (covers anything a notification missed)
+KILL_SWITCH_STATE_RESYNC_INTERVAL = float(os.getenv("KILL_SWITCH_STATE_RESYNC_INTERVAL", "60"))
+
+# Pause before reconnecting after the listener connection fails
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+class KillSwitchSnapshot(NamedTuple):
+    """The fields gate evaluation needs from an engaged kill switch."""
+    id: UUID
+    workflow_id: Optional[UUID]
+    mode: KillSwitchMode
+    auto_deactivate_at: Optional[datetime]
+
+
+_SNAPSHOT_COLUMNS = (KillSwitch.id, KillSwitch.workflow_id, KillSwitch.mode, KillSwitch.auto_deactivate_at)
+
+# Engaged switches only (idx_kill_switch_live)
+_LOAD_QUERY = select(*_SNAPSHOT_COLUMNS).where(KillSwitch.is_active)
+
+
+class KillSwitchState:
+    """Engaged kill switches by scope, refreshed from NOTIFY kill_switch_changed."""
+
+    def __init__(self, resync_interval: float = KILL_SWITCH_STATE_RESYNC_INTERVAL):
+        """
+        Initialize the KillSwitchState.
+
+        Args:
+            resync_interval: Seconds between full reloads
+        """
+        self.resync_interval = resync_interval
+        self._by_scope: Dict[Optional[UUID], Dict[UUID, KillSwitchSnapshot]] = {}
+        self._live = False
+        self._task: Optional[asyncio.Task] = None
+        # Serializes read-and-apply of _reload and _refresh (FIFO)
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_live(self) -> bool:
+        """True while the listener is connected and the state is loaded."""
+        return self._live
+
+    def lookup(self, workflow_id: Optional[UUID]) -> Optional[KillSwitchSnapshot]:
+        """Engaged switch applying to a workflow (its own or global), HARD_STOP first.
+
+        Switches past auto_deactivate_at are skipped even before the sweep
+        releases them.
+        """
+        now = datetime.utcnow()
+        scopes = (None,) if workflow_id is None else (None, workflow_id)
+        found: Optional[KillSwitchSnapshot] = None
+        for scope in scopes:
+            for switch in self._by_scope.get(scope, {}).values():
+                if switch.auto_deactivate_at is not None and switch.auto_deactivate_at <= now:
+                    continue
+                if switch.mode is KillSwitchMode.HARD_STOP:
+                    return switch
+                found = found or switch
+        return found
+
+    def _store(self, switch: KillSwitchSnapshot) -> None:
+        self._by_scope.setdefault(switch.workflow_id, {})[switch.id] = switch
+
+    def _discard(self, switch_id: UUID) -> None:
+        for switches in self._by_scope.values():
+            switches.pop(switch_id, None)
+
+    async def _reload(self, connection) -> None:
+        """Replace the whole state with the engaged switches."""
+        async with self._lock:
+            result = await connection.execute(_LOAD_QUERY)
+            self._by_scope = {}
+            for row in result:
+                self._store(KillSwitchSnapshot(*row))
+
+    async def _refresh(self, switch_id: UUID) -> None:
+        """Re-read one switch after a notification."""
+        async with self._lock:
+            try:
+                async with engine.connect() as connection:
+                    row = (await connection.execute(_LOAD_QUERY.where(KillSwitch.id == switch_id))).first()
+            except Exception as e:
+                # The next resync corrects the state; until then, use the database
+                logger.error(f"Kill switch refresh failed ({switch_id}): {e}")
+                self._live = False
+                return
+            self._discard(switch_id)
+            if row is not None:
+                self._store(KillSwitchSnapshot(*row))
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        """asyncpg listener callback (sync): schedule the row refresh."""
+        asyncio.get_running_loop().create_task(self._refresh(UUID(payload)))
+
+    async def _listen(self) -> None:
+        """Hold the LISTEN connection; reload the state on every resync tick."""
+        async with engine.connect() as connection:
+            raw = (await connection.get_raw_connection()).driver_connection
+            closed = asyncio.Event()
+
+            def on_terminate(_connection) -> None:
+                # Stop serving from memory now, not at the next resync tick
+                self._live = False
+                closed.set()
+
+            raw.add_termination_listener(on_terminate)
+            await raw.add_listener(NOTIFY_CHANNEL, self._on_notify)
+            try:
+                while not raw.is_closed():
+                    await self._reload(connection)
+                    # Commit so the idle LISTEN connection holds no snapshot open
+                    await connection.commit()
+                    if raw.is_closed():
+                        break
+                    self._live = True
+                    try:
+                        await asyncio.wait_for(closed.wait(), self.resync_interval)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._live = False
+                if not raw.is_closed():
+                    raw.remove_termination_listener(on_terminate)
+                    await raw.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+
+    async def _run(self) -> None:
+        """Background loop: keep a listener connected, reconnecting on failure."""
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Kill switch listener failed: {e}")
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    def start(self) -> None:
+        """Start the listener (call on application startup)."""
+        if USE_PGBOUNCER:
+            # Transaction pooling cannot hold LISTEN; gate checks query instead
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the listener and release its connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Singleton instance for FastAPI dependency injection
+_state_instance: Optional[KillSwitchState] = None
+
+
+def get_kill_switch_state() -> KillSwitchState:
+    """Get or create the global KillSwitchState instance."""
+    global _state_instance
+    if _state_instance is None:
+        _state_instance = KillSwitchState()
+    return _state_instance
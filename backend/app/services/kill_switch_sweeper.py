@@ -0,0 +1,99 @@
+"""KillSwitchSweeper - Release kill switches whose auto_deactivate_at has passed
+
+Every KILL_SWITCH_SWEEP_INTERVAL seconds a background task runs one
+statement, KillSwitch.release_expired(): an UPDATE ... RETURNING id over
+the partial index idx_kill_switch_auto_deactivate, so each tick touches
+only the engaged switches with a deadline, never the whole table.
+
+The UPDATE is idempotent and row-locked, so running a sweeper in every
+worker process is safe: a switch is released (and returned) once. When
+anything was released, the rendered active-switch lists are invalidated.
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.kill_switches import invalidate_list_caches
+from app.db.database import async_session_maker
+from app.db.models.kill_switch import KillSwitch
+from app.services.cache import get_query_cache
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps (worst-case lateness of an auto-release)
+KILL_SWITCH_SWEEP_INTERVAL = float(os.getenv("KILL_SWITCH_SWEEP_INTERVAL", "10"))
+
+_RELEASE_QUERY = KillSwitch.release_expired()
+
+
+class KillSwitchSweeper:
+    """Background task that periodically releases expired kill switches."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker = async_session_maker,
+        interval: float = KILL_SWITCH_SWEEP_INTERVAL,
+    ):
+        """
+        Initialize the KillSwitchSweeper.
+
+        Args:
+            session_maker: Session factory used for each sweep
+            interval: Seconds between sweeps
+        """
+        self.session_maker = session_maker
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def sweep(self) -> List[UUID]:
+        """Release every expired switch now; returns the released IDs."""
+        async with self.session_maker() as db:
+            released = list((await db.execute(_RELEASE_QUERY)).scalars())
+            await db.commit()
+        if released:
+            await invalidate_list_caches(get_query_cache())
+            logger.info(f"Auto-deactivated kill switches: {', '.join(map(str, released))}")
+        return released
+
+    async def _run(self) -> None:
+        """Background loop: sweep, then sleep, until cancelled."""
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Kill switch sweep failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background loop (call on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Singleton instance for FastAPI dependency injection
+_sweeper_instance: Optional[KillSwitchSweeper] = None
+
+
+def get_kill_switch_sweeper() -> KillSwitchSweeper:
+    """Get or create the global KillSwitchSweeper instance."""
+    global _sweeper_instance
+    if _sweeper_instance is None:
+        _sweeper_instance = KillSwitchSweeper()
+    return _sweeper_instance
@@ -0,0 +1,93 @@
+"""PartitionMaintainer - Keep monthly partitions created ahead of time
+
+audit_events and gate_executions are range-partitioned by month with no
+DEFAULT partition (migrations 016 and 035), so every INSERT fails once
+the current month has no child table. Startup creates the next
+PARTITION_MONTHS_AHEAD months; this background task repeats that every
+PARTITION_MAINTENANCE_INTERVAL seconds (daily by default), so a process
+that stays up past the startup horizon keeps its partitions ahead of the
+calendar. It stands in for pg_partman / a cron job.
+
+The partition functions only create missing months (CREATE TABLE IF NOT
+EXISTS), so running the task in every worker process is safe.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from app.db.database import ensure_partitions
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between runs; a daily run keeps a two-month horizon far ahead
+PARTITION_MAINTENANCE_INTERVAL = float(os.getenv("PARTITION_MAINTENANCE_INTERVAL", "86400"))
+
+# Months past the current one that must already have partitions
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "2"))
+
+
+class PartitionMaintainer:
+    """Background task that periodically creates upcoming monthly partitions."""
+
+    def __init__(
+        self,
+        interval: float = PARTITION_MAINTENANCE_INTERVAL,
+        months_ahead: int = PARTITION_MONTHS_AHEAD,
+    ):
+        """
+        Initialize the PartitionMaintainer.
+
+        Args:
+            interval: Seconds between runs
+            months_ahead: Months past the current one to create
+        """
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self._task: Optional[asyncio.Task] = None
+
+    async def maintain(self) -> None:
+        """Create any missing partitions now."""
+        await ensure_partitions(self.months_ahead)
+
+    async def _run(self) -> None:
+        """Background loop: sleep, then maintain, until cancelled.
+
+        Startup has just run ensure_partitions, so the loop sleeps first.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {e}")
+
+    def start(self) -> None:
+        """Start the background loop (call on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Singleton instance for FastAPI dependency injection
+_maintainer_instance: Optional[PartitionMaintainer] = None
+
+
+def get_partition_maintainer() -> PartitionMaintainer:
+    """Get or create the global PartitionMaintainer instance."""
+    global _maintainer_instance
+    if _maintainer_instance is None:
+        _maintainer_instance = PartitionMaintainer()
+    return _maintainer_instance
@@ -0,0 +1,42 @@
+"""Trigram search indexes for capabilities and connectors
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 09:00:00.000000
+
+The registry list endpoints search name/description with a
+substring match (`lower(col) LIKE '%term%'`). A B-tree index cannot
+serve a leading wildcard, so every search was a sequential scan.
+
+pg_trgm GIN indexes on the lower() expressions make those predicates
+index-usable:
+- capabilities: lower(name), lower(description)
+- connectors: lower(name), lower(description)
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_capabilities_search_trgm ON capabilities '
+        'USING gin (lower(name) gin_trgm_ops, lower(description) gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_connectors_search_trgm ON connectors '
+        'USING gin (lower(name) gin_trgm_ops, lower(description) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_connectors_search_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_capabilities_search_trgm')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,33 @@
+"""Composite indexes for keyset pagination
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 09:30:00.000000
+
+List endpoints page with `WHERE (created_at, id) < (:ts, :id)
+ORDER BY created_at DESC, id DESC`. These composite indexes let
+PostgreSQL seek to the cursor position and read only `limit` rows:
+- capabilities: (is_active, created_at, id)
+- connectors: (is_active, created_at, id)
+- change_requests: (created_at, id)
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_capability_active_created', 'capabilities', ['is_active', 'created_at', 'id'])
+    op.create_index('idx_connector_active_created', 'connectors', ['is_active', 'created_at', 'id'])
+    op.create_index('idx_change_created_keyset', 'change_requests', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_change_created_keyset', table_name='change_requests')
+    op.drop_index('idx_connector_active_created', table_name='connectors')
+    op.drop_index('idx_capability_active_created', table_name='capabilities')
@@ -0,0 +1,37 @@
+"""Partial unique indexes on active capability/connector names
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 10:00:00.000000
+
+create_capability and create_connector insert with
+`ON CONFLICT (name) WHERE is_active DO NOTHING RETURNING *`.
+The conflict target is inferred from these partial unique indexes,
+which enforce "one active row per name" while still allowing any
+number of deactivated rows with the same name.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ux_capability_active_name', 'capabilities', ['name'],
+        unique=True, postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ux_connector_active_name', 'connectors', ['name'],
+        unique=True, postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_connector_active_name', table_name='connectors')
+    op.drop_index('ux_capability_active_name', table_name='capabilities')
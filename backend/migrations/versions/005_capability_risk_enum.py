@@ -0,0 +1,62 @@
+"""Native ENUM risk classification on capabilities + filter indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 10:30:00.000000
+
+list_capabilities filters on risk_level and requires_approval, and
+list_connectors on connector_type. Store capability risk as the native
+Postgres `risklevel` ENUM shared with workflows (4-byte ordinal instead
+of VARCHAR) and add the composite indexes for the common filter pairs:
+- capabilities: (is_active, risk_level), (is_active, requires_approval)
+- connectors: (is_active, connector_type)
+
+connectors.connector_type and change_requests.status are already native
+ENUM columns; change_requests.status is covered by idx_change_status_risk.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Shared with workflows.risk_level; create only if not already present
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE risklevel AS ENUM ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW'); "
+        "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+    )
+
+    op.add_column(
+        'capabilities',
+        sa.Column(
+            'risk_level',
+            postgresql.ENUM(name='risklevel', create_type=False),
+            nullable=False,
+            server_default='MEDIUM',
+        ),
+    )
+    op.add_column(
+        'capabilities',
+        sa.Column('requires_approval', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+    op.create_index('idx_capability_active_risk', 'capabilities', ['is_active', 'risk_level'])
+    op.create_index('idx_capability_active_approval', 'capabilities', ['is_active', 'requires_approval'])
+    op.create_index('idx_connector_active_type', 'connectors', ['is_active', 'connector_type'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_connector_active_type', table_name='connectors')
+    op.drop_index('idx_capability_active_approval', table_name='capabilities')
+    op.drop_index('idx_capability_active_risk', table_name='capabilities')
+    op.drop_column('capabilities', 'requires_approval')
+    op.drop_column('capabilities', 'risk_level')
+    # risklevel type is still used by workflows.risk_level
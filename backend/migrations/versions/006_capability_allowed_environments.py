@@ -0,0 +1,42 @@
+"""GIN-indexed allowed_environments on capabilities
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 11:00:00.000000
+
+list_capabilities filters with `allowed_environments.contains([env])`,
+which compiles to the array containment operator `@>`. Without an index
+that is a per-row array comparison over the whole table; the default
+GIN array opclass turns it into an index lookup.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'capabilities',
+        sa.Column(
+            'allowed_environments',
+            postgresql.ARRAY(sa.String(50)),
+            nullable=False,
+            server_default='{}',
+        ),
+    )
+    op.create_index(
+        'idx_capability_allowed_envs', 'capabilities', ['allowed_environments'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_capability_allowed_envs', table_name='capabilities')
+    op.drop_column('capabilities', 'allowed_environments')
@@ -0,0 +1,38 @@
+"""Prefix search indexes on capability and connector names
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 14:00:00.000000
+
+A trailing-asterisk search ("term*") is a left-anchored match on name
+(`lower(name) LIKE 'term%'`). A B-tree expression index with
+text_pattern_ops serves that as an index range scan regardless of the
+database collation, which is cheaper than the pg_trgm GIN lookup used
+for substring search:
+- capabilities: lower(name) text_pattern_ops
+- connectors: lower(name) text_pattern_ops
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_capabilities_name_prefix ON capabilities '
+        '(lower(name) text_pattern_ops)'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_connectors_name_prefix ON connectors '
+        '(lower(name) text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_connectors_name_prefix')
+    op.execute('DROP INDEX IF EXISTS ix_capabilities_name_prefix')
@@ -0,0 +1,46 @@
+"""Timezone-aware server-set timestamps on change_requests
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 15:00:00.000000
+
+Change request transitions now stamp their decision times with the
+database clock (`now()`) inside the UPDATE instead of sending a
+Python-generated datetime. now() is a timestamptz, so the columns it
+writes are converted to TIMESTAMP WITH TIME ZONE. Existing values were
+written as naive UTC and are reinterpreted as such.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = (
+    'requested_at',
+    'reviewed_at',
+    'approved_at',
+    'rejected_at',
+    'created_at',
+    'updated_at',
+)
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.execute(
+            f'ALTER TABLE change_requests ALTER COLUMN {column} '
+            f"TYPE TIMESTAMP WITH TIME ZONE USING {column} AT TIME ZONE 'UTC'"
+        )
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        op.execute(
+            f'ALTER TABLE change_requests ALTER COLUMN {column} '
+            f"TYPE TIMESTAMP WITHOUT TIME ZONE USING {column} AT TIME ZONE 'UTC'"
+        )
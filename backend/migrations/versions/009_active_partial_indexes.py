@@ -0,0 +1,48 @@
+"""Partial indexes for live-row list queries
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 16:00:00.000000
+
+The list endpoints read only live rows and sort them. Partial indexes
+cover just those rows, so history never adds index size or write cost,
+and the leading column matches the ORDER BY so no sort step is needed:
+- control_policies: (priority) WHERE is_active
+- kill_switches: (created_at) WHERE is_active
+- workflows: (created_at, id) WHERE status = 'ACTIVE'
+  (workflows has no is_active column; activity is the status enum)
+
+Indexes are built CONCURRENTLY so existing tables are not write-locked.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_control_policies_active_priority '
+            'ON control_policies (priority) WHERE is_active'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_kill_switches_active_created '
+            'ON kill_switches (created_at) WHERE is_active'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workflows_active '
+            "ON workflows (created_at, id) WHERE status = 'ACTIVE'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_workflows_active')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_kill_switches_active_created')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_control_policies_active_priority')
@@ -0,0 +1,38 @@
+"""Trigram search indexes for control policies
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 17:00:00.000000
+
+list_control_policies searched with `name ILIKE '%term%' OR
+description ILIKE '%term%'`, a sequential scan on every keystroke. It now
+uses the shared text_search filter (`lower(col) LIKE ...`), matching
+capabilities and connectors, and these pg_trgm GIN expression indexes
+make both the substring and the "term*" prefix forms index-usable:
+- control_policies: lower(name), lower(description)
+
+The indexes are not partial on is_active: the list query binds
+is_active as a parameter, which a generic prepared plan cannot match
+against a partial-index predicate.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_control_policies_search_trgm ON control_policies '
+        'USING gin (lower(name) gin_trgm_ops, lower(description) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_control_policies_search_trgm')
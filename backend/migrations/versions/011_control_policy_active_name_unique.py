@@ -0,0 +1,32 @@
+"""Partial unique index on active control policy names
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 18:00:00.000000
+
+create_control_policy inserts with
+`ON CONFLICT (name) WHERE is_active DO NOTHING RETURNING *`, like
+create_capability and create_connector. The conflict target is inferred
+from this partial unique index, which enforces "one active policy per
+name" while allowing any number of deactivated policies with that name.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ux_control_policy_active_name', 'control_policies', ['name'],
+        unique=True, postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_control_policy_active_name', table_name='control_policies')
@@ -0,0 +1,47 @@
+"""Keyset pagination indexes for control policies and tenants
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15 19:00:00.000000
+
+list_control_policies and list_tenants move from OFFSET to keyset
+pagination, like the registry lists in 003:
+- control_policies: (priority, id) WHERE is_active, replacing the
+  priority-only partial index so the (priority, id) row comparison and
+  ORDER BY priority, id are both served by one index
+- tenants: (created_at, id)
+
+Workflows are already covered by idx_workflows_active (009).
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_control_policies_active_priority')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_control_policies_active_priority '
+            'ON control_policies (priority, id) WHERE is_active'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tenant_created_keyset '
+            'ON tenants (created_at, id)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_tenant_created_keyset')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_control_policies_active_priority')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_control_policies_active_priority '
+            'ON control_policies (priority) WHERE is_active'
+        )
@@ -0,0 +1,38 @@
+"""policy_metadata column on control_policies
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15 20:00:00.000000
+
+The control policy API accepted a "metadata" object, but the ORM model
+had no column for it: `metadata` is reserved by the declarative Base, so
+the value was either set as a stray instance attribute or rejected by
+INSERT ... VALUES. It is stored as policy_metadata; the JSON API keeps
+the "metadata" key through field aliases.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'control_policies',
+        sa.Column(
+            'policy_metadata',
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('control_policies', 'policy_metadata')
@@ -0,0 +1,31 @@
+"""Unique tenant domain
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15 21:00:00.000000
+
+The tenants API identifies organizations by domain and rejected
+duplicates with a SELECT before every INSERT, which races under
+concurrent creates. Domain is now a column with a unique constraint, and
+create_tenant inserts with `ON CONFLICT (domain) DO NOTHING RETURNING *`.
+NULL domains (tenants created before this revision) do not conflict.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tenants', sa.Column('domain', sa.String(255), nullable=True))
+    op.create_unique_constraint('uq_tenants_domain', 'tenants', ['domain'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_tenants_domain', 'tenants', type_='unique')
+    op.drop_column('tenants', 'domain')
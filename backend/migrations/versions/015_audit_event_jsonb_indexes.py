@@ -0,0 +1,49 @@
+"""GIN and BRIN indexes on audit_events
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15 22:00:00.000000
+
+Compliance queries filter audit events by keys inside the JSONB columns
+("all events for gate_id X", "events tagged HIPAA"), which scanned the
+whole table:
+- context, metadata: GIN (jsonb_path_ops), used by containment (@>)
+  filters such as AuditEvent.context.contains({"gate_id": ...})
+- created_at: BRIN. The log is append-only, so created_at follows
+  physical order and a BRIN index prunes time ranges at a tiny
+  fraction of a btree's size
+
+Indexes are built CONCURRENTLY so the log is never write-locked.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_context_gin '
+            'ON audit_events USING GIN (context jsonb_path_ops)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_metadata_gin '
+            'ON audit_events USING GIN (metadata jsonb_path_ops)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_created_brin '
+            'ON audit_events USING BRIN (created_at) WITH (pages_per_range = 32)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_audit_created_brin')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_audit_metadata_gin')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_audit_context_gin')
@@ -0,0 +1,155 @@
+"""Partition audit_events by month
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15 23:00:00.000000
+
+audit_events is append-only and time-ordered but was a single heap, so
+retention meant a slow DELETE (plus vacuum) and every time-ranged audit
+query walked indexes covering the whole history. It is now
+PARTITION BY RANGE (created_at) with one child per calendar month:
+- retention is `DROP TABLE audit_events_YYYY_MM` (or DETACH first)
+- queries bounded on created_at are pruned to the months they touch
+
+Postgres requires every unique constraint on a partitioned table to
+include the partition key, so the primary key becomes (id, created_at)
+and the sequence_number / event_hash uniques become composites with
+created_at. The hash chain itself is unaffected: each row stores its
+previous_hash, which links across partition boundaries.
+
+audit_events_ensure_partitions(months_ahead) creates any missing
+monthly children from the current month forward. The application calls
+it on startup and then daily (app.services.partition_maintainer), so
+long-running processes stay ahead of the calendar without cron /
+pg_cron. There is deliberately no DEFAULT partition: rows that
+land in it would block creating the matching month later.
+
+The migration rebuilds the table and copies existing rows, holding an
+exclusive lock on audit_events for the duration.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+# Indexes declared on the model, recreated on the partitioned parent
+# (each cascades to every current and future partition)
+_INDEXES = (
+    'CREATE INDEX ix_audit_events_event_type ON audit_events (event_type)',
+    'CREATE INDEX ix_audit_events_actor_id ON audit_events (actor_id)',
+    'CREATE INDEX ix_audit_events_resource_type ON audit_events (resource_type)',
+    'CREATE INDEX ix_audit_events_resource_id ON audit_events (resource_id)',
+    'CREATE INDEX ix_audit_events_created_at ON audit_events (created_at)',
+    'CREATE INDEX idx_audit_actor_time ON audit_events (actor_id, created_at)',
+    'CREATE INDEX idx_audit_resource ON audit_events (resource_type, resource_id, created_at)',
+    'CREATE INDEX idx_audit_event_type_time ON audit_events (event_type, created_at)',
+    'CREATE INDEX idx_audit_outcome ON audit_events (outcome, created_at)',
+    'CREATE INDEX idx_audit_context_gin ON audit_events USING GIN (context jsonb_path_ops)',
+    'CREATE INDEX idx_audit_metadata_gin ON audit_events USING GIN (metadata jsonb_path_ops)',
+    'CREATE INDEX idx_audit_created_brin ON audit_events USING BRIN (created_at) WITH (pages_per_range = 32)',
+)
+
+
+def upgrade() -> None:
+    op.execute('LOCK TABLE audit_events IN ACCESS EXCLUSIVE MODE')
+
+    op.execute(
+        'CREATE TABLE audit_events_partitioned '
+        '(LIKE audit_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) '
+        'PARTITION BY RANGE (created_at)'
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit_events_create_partition(parent regclass, month date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            start_date date := date_trunc('month', month);
+            child text := format('audit_events_%s', to_char(start_date, 'YYYY_MM'));
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                child, parent, start_date, start_date + interval '1 month'
+            );
+        END;
+        $$
+    """)
+
+    # Children for every month already in the log, through next month
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min(created_at) FROM audit_events), now())),
+                    date_trunc('month', now()) + interval '1 month',
+                    interval '1 month'
+                )::date
+            LOOP
+                PERFORM audit_events_create_partition('audit_events_partitioned', month);
+            END LOOP;
+        END;
+        $$
+    """)
+
+    op.execute('INSERT INTO audit_events_partitioned SELECT * FROM audit_events')
+    op.execute('DROP TABLE audit_events')
+    op.execute('ALTER TABLE audit_events_partitioned RENAME TO audit_events')
+
+    op.execute('ALTER TABLE audit_events ADD PRIMARY KEY (id, created_at)')
+    op.execute(
+        'ALTER TABLE audit_events ADD CONSTRAINT uq_audit_events_sequence '
+        'UNIQUE (sequence_number, created_at)'
+    )
+    op.execute(
+        'ALTER TABLE audit_events ADD CONSTRAINT uq_audit_events_hash '
+        'UNIQUE (event_hash, created_at)'
+    )
+    for statement in _INDEXES:
+        op.execute(statement)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit_events_ensure_partitions(months_ahead integer DEFAULT 2)
+        RETURNS void LANGUAGE plpgsql AS $$
+        BEGIN
+            FOR i IN 0..months_ahead LOOP
+                PERFORM audit_events_create_partition(
+                    'audit_events', (date_trunc('month', now()) + make_interval(months => i))::date
+                );
+            END LOOP;
+        END;
+        $$
+    """)
+    op.execute('SELECT audit_events_ensure_partitions(2)')
+
+
+def downgrade() -> None:
+    op.execute('LOCK TABLE audit_events IN ACCESS EXCLUSIVE MODE')
+
+    op.execute(
+        'CREATE TABLE audit_events_heap '
+        '(LIKE audit_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)'
+    )
+    op.execute('INSERT INTO audit_events_heap SELECT * FROM audit_events')
+    op.execute('DROP TABLE audit_events CASCADE')
+    op.execute('ALTER TABLE audit_events_heap RENAME TO audit_events')
+
+    op.execute('ALTER TABLE audit_events ADD PRIMARY KEY (id)')
+    op.execute(
+        'ALTER TABLE audit_events ADD CONSTRAINT audit_events_sequence_number_key '
+        'UNIQUE (sequence_number)'
+    )
+    op.execute(
+        'ALTER TABLE audit_events ADD CONSTRAINT audit_events_event_hash_key '
+        'UNIQUE (event_hash)'
+    )
+    for statement in _INDEXES:
+        op.execute(statement)
+
+    op.execute('DROP FUNCTION IF EXISTS audit_events_ensure_partitions(integer)')
+    op.execute('DROP FUNCTION IF EXISTS audit_events_create_partition(regclass, date)')
@@ -0,0 +1,40 @@
+"""Server-side timestamp defaults for capabilities and break_glass
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15 23:30:00.000000
+
+created_at/updated_at (and break_glass.requested_at) were stamped with
+datetime.utcnow() in the application, so their values depended on each
+app host's clock. The models now use server_default=func.now() and
+onupdate=func.now() (NOW() rendered into the UPDATE statement), matching
+change_requests and enforcement_gates; this migration adds the column
+defaults those INSERTs rely on.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ('capabilities', 'created_at'),
+    ('capabilities', 'updated_at'),
+    ('break_glass', 'requested_at'),
+    ('break_glass', 'created_at'),
+    ('break_glass', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
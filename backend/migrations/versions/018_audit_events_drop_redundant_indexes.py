@@ -0,0 +1,53 @@
+"""Drop redundant audit_events indexes
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16 00:00:00.000000
+
+Every audit INSERT maintained five single-column btrees, four composites,
+two GIN indexes, a BRIN index and two unique constraints. The
+single-column indexes are covered by composites (or by BRIN), so they
+only cost write amplification:
+- ix_audit_events_actor_id       -> idx_audit_actor_time (actor_id, created_at)
+- ix_audit_events_resource_type  -> idx_audit_resource (resource_type, resource_id, created_at)
+- ix_audit_events_resource_id    -> idx_audit_resource (lookups always carry resource_type)
+- ix_audit_events_event_type     -> idx_audit_event_type_time (event_type, created_at)
+- ix_audit_events_created_at     -> idx_audit_created_brin
+
+uq_audit_events_hash is dropped too: nothing looks events up by hash,
+and tamper detection recomputes hashes along sequence_number order
+(still unique) rather than trusting the index.
+
+These are partitioned indexes, which cannot be dropped CONCURRENTLY.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    'ix_audit_events_event_type': 'event_type',
+    'ix_audit_events_actor_id': 'actor_id',
+    'ix_audit_events_resource_type': 'resource_type',
+    'ix_audit_events_resource_id': 'resource_id',
+    'ix_audit_events_created_at': 'created_at',
+}
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE audit_events DROP CONSTRAINT IF EXISTS uq_audit_events_hash')
+    for name in _INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    for name, column in _INDEXES.items():
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON audit_events ({column})')
+    op.execute(
+        'ALTER TABLE audit_events ADD CONSTRAINT uq_audit_events_hash '
+        'UNIQUE (event_hash, created_at)'
+    )
@@ -0,0 +1,54 @@
+"""Denormalized workflow_key on capabilities
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16 00:30:00.000000
+
+Capability.full_key read self.workflow.workflow_key, which lazy-loads
+the parent workflow: one SELECT per capability whenever full_key is
+embedded in an audit record. capabilities.workflow_key now holds a copy
+of the parent's key. workflow_key never changes once a workflow is
+created, so the copy only has to be set when workflow_id is; a trigger
+does that for every INSERT path (ORM, Core insert ... returning, seed
+scripts) rather than an ORM-only before_insert hook.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('capabilities', sa.Column('workflow_key', sa.String(255), nullable=True))
+    op.execute(
+        'UPDATE capabilities c SET workflow_key = w.workflow_key '
+        'FROM workflows w WHERE w.id = c.workflow_id'
+    )
+    op.alter_column('capabilities', 'workflow_key', nullable=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION capabilities_set_workflow_key()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            SELECT workflow_key INTO NEW.workflow_key
+            FROM workflows WHERE id = NEW.workflow_id;
+            RETURN NEW;
+        END;
+        $$
+    """)
+    op.execute(
+        'CREATE TRIGGER capabilities_set_workflow_key '
+        'BEFORE INSERT OR UPDATE OF workflow_id ON capabilities '
+        'FOR EACH ROW EXECUTE FUNCTION capabilities_set_workflow_key()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS capabilities_set_workflow_key ON capabilities')
+    op.execute('DROP FUNCTION IF EXISTS capabilities_set_workflow_key()')
+    op.drop_column('capabilities', 'workflow_key')
@@ -0,0 +1,60 @@
+"""Native ENUM types for break_glass.reason and break_glass.status
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16 01:00:00.000000
+
+SQLAlchemy's Enum maps to a native Postgres ENUM on this dialect, so a
+schema created from the models already has breakglassreason /
+breakglassstatus columns. Databases built any other way (hand-written
+DDL, non-native Enum) may hold the labels as VARCHAR. This revision
+creates the types if missing and converts the columns only when they are
+not already the ENUM, so it is a no-op on autogenerated schemas.
+
+Stored labels are the Python enum member names, as SQLAlchemy writes.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+_TYPES = {
+    'breakglassreason': (
+        'reason',
+        "('P0_INCIDENT', 'DATA_LOSS', 'SECURITY_RESPONSE', 'REGULATORY', "
+        "'CUSTOMER_IMPACT', 'SYSTEM_FAILURE')",
+    ),
+    'breakglassstatus': (
+        'status',
+        "('PENDING', 'APPROVED', 'DENIED', 'EXPIRED', 'REVOKED')",
+    ),
+}
+
+
+def upgrade() -> None:
+    for type_name, (column, labels) in _TYPES.items():
+        op.execute(
+            f"DO $$ BEGIN "
+            f"CREATE TYPE {type_name} AS ENUM {labels}; "
+            f"EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+        op.execute(f"""
+            DO $$ BEGIN
+                IF (SELECT udt_name FROM information_schema.columns
+                    WHERE table_name = 'break_glass' AND column_name = '{column}') <> '{type_name}'
+                THEN
+                    ALTER TABLE break_glass ALTER COLUMN {column} DROP DEFAULT;
+                    ALTER TABLE break_glass
+                        ALTER COLUMN {column} TYPE {type_name} USING upper({column}::text)::{type_name};
+                END IF;
+            END $$
+        """)
+
+
+def downgrade() -> None:
+    # Columns stay native ENUM: that is what the models have always mapped
+    pass
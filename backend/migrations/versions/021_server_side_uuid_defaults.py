@@ -0,0 +1,73 @@
+"""Server-side UUID primary key defaults
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16 01:30:00.000000
+
+Primary keys were generated in Python (uuid.uuid4) for every row. They
+now default in the database and come back through RETURNING:
+- gen_random_uuid() (pgcrypto; built in from Postgres 13) for the
+  registry and control tables
+- uuid_generate_v7() for audit_events: a time-ordered UUIDv7 (48-bit
+  millisecond timestamp prefix), so the append-heavy primary key index
+  grows at its right edge instead of splitting random pages
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+_RANDOM_UUID_TABLES = (
+    'workflows',
+    'capabilities',
+    'connectors',
+    'control_policies',
+    'kill_switches',
+    'break_glass',
+    'change_requests',
+    'enforcement_gates',
+    'gate_executions',
+    'tenants',
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+
+    # UUIDv7: a v4 UUID with its first 48 bits replaced by the Unix epoch
+    # in milliseconds and the version nibble set to 7
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7()
+        RETURNS uuid LANGUAGE sql VOLATILE AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$
+    """)
+
+    for table in _RANDOM_UUID_TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('audit_events', 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    op.alter_column('audit_events', 'id', server_default=None)
+    for table in _RANDOM_UUID_TABLES:
+        op.alter_column(table, 'id', server_default=None)
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
@@ -0,0 +1,40 @@
+"""audit_chain_verifications checkpoint table
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16 02:00:00.000000
+
+Chain audits recomputed SHA-256 for every event on every run. Each run
+now records the sequence number (and hash) it verified through, and
+the next run starts after it, so routine audits cost O(new events).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_chain_verifications',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('verified_through_sequence', sa.Integer(), nullable=False),
+        sa.Column('verified_hash', sa.String(64), nullable=False),
+        sa.Column('events_verified', sa.Integer(), nullable=False),
+        sa.Column('verified_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index(
+        'idx_audit_chain_verified_through',
+        'audit_chain_verifications',
+        ['verified_through_sequence'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_chain_verified_through', table_name='audit_chain_verifications')
+    op.drop_table('audit_chain_verifications')
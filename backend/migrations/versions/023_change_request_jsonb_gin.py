@@ -0,0 +1,50 @@
+"""GIN indexes on change_requests JSONB documents
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-15 23:40:00.000000
+
+Searching change requests by what they touch ("all production changes",
+"changes tagged SOC2") filters change_details, impact_assessment and
+metadata by containment (@>), which scanned and parsed every row.
+jsonb_path_ops supports only @> (and jsonpath matches), in exchange for
+a smaller and faster index than the default jsonb_ops.
+
+control_policies.conditions / auto_deny_conditions are not indexed: they
+are matched against a request context in ControlPolicy.evaluate_conditions,
+not filtered in SQL, so an index there would only add write cost.
+
+Indexes are built CONCURRENTLY so change requests stay writable.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_details_gin '
+            'ON change_requests USING GIN (change_details jsonb_path_ops)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_impact_gin '
+            'ON change_requests USING GIN (impact_assessment jsonb_path_ops)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_metadata_gin '
+            'ON change_requests USING GIN (metadata jsonb_path_ops)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_metadata_gin')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_impact_gin')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_details_gin')
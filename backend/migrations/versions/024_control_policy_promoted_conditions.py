@@ -0,0 +1,66 @@
+"""Promote frequently matched policy conditions into typed columns
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-16 00:10:00.000000
+
+Finding the policies that apply to a request meant reading every policy's
+conditions JSONB and comparing it key by key. change_type, environment
+and after_hours are now mirrored into typed, generated columns:
+- condition_change_type, condition_environment: text, set when the
+  condition value is a JSON string
+- condition_after_hours: boolean, set when the value is a JSON boolean
+
+conditions stays the source of truth (the API reads and writes it
+unchanged); PostgreSQL keeps the generated columns in sync on every write.
+A partial b-tree index over active policies serves
+ControlPolicy.match_clause.
+
+Adding STORED generated columns rewrites control_policies, which is a
+small configuration table; the index is then built CONCURRENTLY.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+def _promoted(key: str, json_type: str, cast: str = "") -> sa.Computed:
+    return sa.Computed(
+        f"CASE WHEN jsonb_typeof(conditions -> '{key}') = '{json_type}' "
+        f"THEN (conditions ->> '{key}'){cast} END",
+        persisted=True,
+    )
+
+
+def upgrade() -> None:
+    op.add_column('control_policies', sa.Column(
+        'condition_change_type', sa.String(255), _promoted('change_type', 'string'),
+    ))
+    op.add_column('control_policies', sa.Column(
+        'condition_environment', sa.String(255), _promoted('environment', 'string'),
+    ))
+    op.add_column('control_policies', sa.Column(
+        'condition_after_hours', sa.Boolean(), _promoted('after_hours', 'boolean', '::boolean'),
+    ))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_control_policies_match '
+            'ON control_policies (condition_change_type, condition_environment) '
+            'WHERE is_active'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_control_policies_match')
+    op.drop_column('control_policies', 'condition_after_hours')
+    op.drop_column('control_policies', 'condition_environment')
+    op.drop_column('control_policies', 'condition_change_type')
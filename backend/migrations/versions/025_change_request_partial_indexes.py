@@ -0,0 +1,47 @@
+"""Partial indexes on open and rollback-pending change requests
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-16 00:40:00.000000
+
+Review and approval queues only look at change requests that are not yet
+in a terminal state, but idx_change_status_risk also indexes the ever
+growing COMPLETED/REJECTED/CANCELLED history:
+- idx_change_open: (risk_level, created_at, id) over open statuses only,
+  matching the list endpoint's keyset order; queries must use the
+  positive status IN (...) form (OPEN_CHANGE_STATUSES) to match it
+- idx_change_rollback_pending: rollbacks that are required but not yet
+  executed
+
+Indexes are built CONCURRENTLY so change requests stay writable.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_open '
+            'ON change_requests (risk_level, created_at, id) '
+            "WHERE status IN ('DRAFT', 'SUBMITTED', 'UNDER_REVIEW', 'PENDING_APPROVAL', "
+            "'APPROVED', 'SCHEDULED', 'IN_PROGRESS')"
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_rollback_pending '
+            'ON change_requests (execution_completed_at) '
+            'WHERE rollback_required AND NOT rollback_executed'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_rollback_pending')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_open')
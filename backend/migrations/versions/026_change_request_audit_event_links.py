@@ -0,0 +1,67 @@
+"""Move change_requests.audit_event_ids into a link table
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-16 01:10:00.000000
+
+audit_event_ids was a UUID[] that only ever grew: every append rewrote
+the whole array (and the row, and its TOAST chunks), and every read
+decoded all of it. Each link is now one row in
+change_request_audit_events, keyed (change_request_id, audit_event_id),
+so appends are single-row INSERTs and lookups use the primary key.
+
+Existing arrays are unnested into the table in array order (created_at
+is taken from the change request's updated_at, offset by position so
+ordering is kept). audit_event_id has no FK: audit_events is partitioned
+and old partitions are dropped for retention.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'change_request_audit_events',
+        sa.Column(
+            'change_request_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('change_requests.id', ondelete='CASCADE'), primary_key=True,
+        ),
+        sa.Column('audit_event_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute("""
+        INSERT INTO change_request_audit_events (change_request_id, audit_event_id, created_at)
+        SELECT cr.id, link.audit_event_id,
+               cr.updated_at + (link.position * interval '1 microsecond')
+        FROM change_requests cr
+        CROSS JOIN LATERAL unnest(cr.audit_event_ids) WITH ORDINALITY AS link(audit_event_id, position)
+        ON CONFLICT DO NOTHING
+    """)
+    op.drop_column('change_requests', 'audit_event_ids')
+
+
+def downgrade() -> None:
+    op.add_column('change_requests', sa.Column(
+        'audit_event_ids', postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+        nullable=False, server_default='{}',
+    ))
+    op.execute("""
+        UPDATE change_requests cr
+        SET audit_event_ids = links.ids
+        FROM (
+            SELECT change_request_id, array_agg(audit_event_id ORDER BY created_at) AS ids
+            FROM change_request_audit_events
+            GROUP BY change_request_id
+        ) links
+        WHERE links.change_request_id = cr.id
+    """)
+    op.alter_column('change_requests', 'audit_event_ids', server_default=None)
+    op.drop_table('change_request_audit_events')
@@ -0,0 +1,64 @@
+"""Server-side, timezone-aware created_at/updated_at on every registry table
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-16 01:40:00.000000
+
+workflows, connectors, control_policies, kill_switches and tenants still
+stamped created_at/updated_at with datetime.utcnow() in the application,
+sending an extra parameter per INSERT from each app host's clock. They
+now use server_default now() / onupdate now(), as capabilities,
+break_glass and enforcement_gates already did (017).
+
+All of these columns also become TIMESTAMP WITH TIME ZONE, matching
+change_requests (008). Existing values were written as naive UTC and are
+reinterpreted as such. Each ALTER rewrites its table; these are small
+configuration tables.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    'workflows',
+    'capabilities',
+    'connectors',
+    'control_policies',
+    'kill_switches',
+    'break_glass',
+    'enforcement_gates',
+    'tenants',
+)
+
+# Tables whose defaults were still set by the application
+_NEW_DEFAULTS = ('workflows', 'connectors', 'control_policies', 'kill_switches', 'tenants')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f'ALTER TABLE {table} '
+            f"ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE USING created_at AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE USING updated_at AT TIME ZONE 'UTC'"
+        )
+    for table in _NEW_DEFAULTS:
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'))
+        op.alter_column(table, 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table in _NEW_DEFAULTS:
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
+    for table in _TABLES:
+        op.execute(
+            f'ALTER TABLE {table} '
+            f"ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE USING created_at AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE USING updated_at AT TIME ZONE 'UTC'"
+        )
@@ -0,0 +1,66 @@
+"""Database-computed full_key on connectors
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-16 02:10:00.000000
+
+Connector.full_key read self.capability.full_key, which lazy-loads the
+parent capability: one SELECT per connector whenever the key went into
+an audit record. Following capabilities.workflow_key (019):
+- capability_full_key: copy of the parent's workflow_key.capability_key,
+  set by a trigger on every INSERT path (both keys are immutable, so it
+  only has to be set when capability_id is)
+- full_key: STORED generated column, capability_full_key || '.' ||
+  connector_key, indexed for lookups by composite key
+
+BEFORE triggers run before generated columns are computed, so full_key
+always sees the copied key.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('connectors', sa.Column('capability_full_key', sa.String(511), nullable=True))
+    op.execute(
+        "UPDATE connectors co SET capability_full_key = c.workflow_key || '.' || c.capability_key "
+        'FROM capabilities c WHERE c.id = co.capability_id'
+    )
+    op.alter_column('connectors', 'capability_full_key', nullable=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION connectors_set_capability_full_key()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            SELECT workflow_key || '.' || capability_key INTO NEW.capability_full_key
+            FROM capabilities WHERE id = NEW.capability_id;
+            RETURN NEW;
+        END;
+        $$
+    """)
+    op.execute(
+        'CREATE TRIGGER connectors_set_capability_full_key '
+        'BEFORE INSERT OR UPDATE OF capability_id ON connectors '
+        'FOR EACH ROW EXECUTE FUNCTION connectors_set_capability_full_key()'
+    )
+
+    op.add_column('connectors', sa.Column(
+        'full_key', sa.String(767),
+        sa.Computed("capability_full_key || '.' || connector_key", persisted=True),
+    ))
+    op.create_index('ix_connectors_full_key', 'connectors', ['full_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_connectors_full_key', table_name='connectors')
+    op.drop_column('connectors', 'full_key')
+    op.execute('DROP TRIGGER IF EXISTS connectors_set_capability_full_key ON connectors')
+    op.execute('DROP FUNCTION IF EXISTS connectors_set_capability_full_key()')
+    op.drop_column('connectors', 'capability_full_key')
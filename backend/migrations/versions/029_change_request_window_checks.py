@@ -0,0 +1,44 @@
+"""Execution window CHECK constraints on change_requests
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-16 02:40:00.000000
+
+- ck_change_window_order: a window cannot end before it starts
+- ck_change_window_required: HIGH/CRITICAL changes cannot be SCHEDULED
+  or IN_PROGRESS without both window bounds
+
+Constraints are added NOT VALID (no full-table scan under the ACCESS
+EXCLUSIVE lock) and then validated under a SHARE UPDATE EXCLUSIVE lock,
+which does not block reads or writes. If validation fails, existing rows
+violate the rule and must be corrected first.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+_CONSTRAINTS = (
+    ('ck_change_window_order', 'scheduled_start <= scheduled_end'),
+    (
+        'ck_change_window_required',
+        "risk_level NOT IN ('HIGH', 'CRITICAL') "
+        "OR status NOT IN ('SCHEDULED', 'IN_PROGRESS') "
+        "OR (scheduled_start IS NOT NULL AND scheduled_end IS NOT NULL)",
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, condition in _CONSTRAINTS:
+        op.execute(f'ALTER TABLE change_requests ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID')
+        op.execute(f'ALTER TABLE change_requests VALIDATE CONSTRAINT {name}')
+
+
+def downgrade() -> None:
+    for name, _ in reversed(_CONSTRAINTS):
+        op.execute(f'ALTER TABLE change_requests DROP CONSTRAINT IF EXISTS {name}')
@@ -0,0 +1,43 @@
+"""Partial keyset index over open change requests
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-16 03:10:00.000000
+
+The open change request list (open_only without a risk filter) pages by
+(created_at, id) over open statuses. idx_change_open leads with
+risk_level, so without a risk filter it cannot return rows in keyset
+order. idx_change_open_keyset indexes just the open rows in that order:
+it stays small however much terminal history accumulates, and each page
+is a short index range scan.
+
+This stands in for partitioning change_requests by requested_at and
+status. A partitioned table's unique constraints must include the
+partition key, which would give up the global uniqueness of id and
+change_key (and the foreign keys that reference id). Every status
+transition would also move the row between partitions.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_change_open_keyset '
+            'ON change_requests (created_at, id) '
+            "WHERE status IN ('DRAFT', 'SUBMITTED', 'UNDER_REVIEW', 'PENDING_APPROVAL', "
+            "'APPROVED', 'SCHEDULED', 'IN_PROGRESS')"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_change_open_keyset')
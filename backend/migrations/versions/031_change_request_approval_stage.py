@@ -0,0 +1,46 @@
+"""Generated approval_stage column on change_requests
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-16 03:40:00.000000
+
+Approval queues ("everything needing multi-stage approval") filtered on
+risk_level IN (...). approval_stage stores the number of approval stages
+a change needs (0 = auto, 1 = single, 2 = dual, 3 = committee) as a
+STORED generated column over risk_level, so it is kept in step by every
+write path, and is indexed for range filters such as approval_stage >= 1.
+
+Adding a STORED generated column rewrites change_requests.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('change_requests', sa.Column(
+        'approval_stage', sa.SmallInteger(),
+        sa.Computed(
+            "CASE risk_level WHEN 'LOW' THEN 0 WHEN 'MEDIUM' THEN 1 "
+            "WHEN 'HIGH' THEN 2 WHEN 'CRITICAL' THEN 3 END",
+            persisted=True,
+        ),
+    ))
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_change_requests_approval_stage '
+            'ON change_requests (approval_stage)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_change_requests_approval_stage')
+    op.drop_column('change_requests', 'approval_stage')
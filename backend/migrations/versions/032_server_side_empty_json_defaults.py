@@ -0,0 +1,65 @@
+"""Server-side empty defaults for JSONB and array columns
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-16 04:10:00.000000
+
+JSONB/array columns defaulted to default=dict / default=list: a fresh
+Python container per INSERT, encoded and sent as a bind parameter. The
+models now use server defaults ('{}'::jsonb, '[]'::jsonb, '{}'), so an
+omitted column costs nothing on the client and the ORM fetches the
+value through INSERT ... RETURNING. This adds the defaults those
+INSERTs rely on (control_policies.policy_metadata and
+capabilities.allowed_environments already had theirs, 013 / 006).
+
+audit_events is unchanged: its context and metadata are part of the
+event hash and are always sent explicitly.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+_EMPTY_OBJECT = "'{}'::jsonb"
+_EMPTY_LIST = "'[]'::jsonb"
+_EMPTY_ARRAY = "'{}'"
+
+_DEFAULTS = (
+    ('workflows', 'metadata', _EMPTY_OBJECT),
+    ('capabilities', 'metadata', _EMPTY_OBJECT),
+    ('connectors', 'config', _EMPTY_OBJECT),
+    ('control_policies', 'approval_required_for', _EMPTY_LIST),
+    ('control_policies', 'approver_roles', _EMPTY_LIST),
+    ('control_policies', 'conditions', _EMPTY_OBJECT),
+    ('control_policies', 'auto_deny_conditions', _EMPTY_OBJECT),
+    ('kill_switches', 'metadata', _EMPTY_OBJECT),
+    ('break_glass', 'metadata', _EMPTY_OBJECT),
+    ('tenants', 'settings', _EMPTY_OBJECT),
+    ('enforcement_gates', 'control_policy_ids', _EMPTY_ARRAY),
+    ('enforcement_gates', 'metadata', _EMPTY_OBJECT),
+    ('gate_executions', 'controls_evaluated', _EMPTY_LIST),
+    ('gate_executions', 'kill_switches_checked', _EMPTY_LIST),
+    ('gate_executions', 'captured_evidence', _EMPTY_OBJECT),
+    ('gate_executions', 'errors', _EMPTY_LIST),
+    ('change_requests', 'change_details', _EMPTY_OBJECT),
+    ('change_requests', 'impact_assessment', _EMPTY_OBJECT),
+    ('change_requests', 'testing_evidence', _EMPTY_OBJECT),
+    ('change_requests', 'verification_criteria', _EMPTY_LIST),
+    ('change_requests', 'rollback_procedure', _EMPTY_OBJECT),
+    ('change_requests', 'metadata', _EMPTY_OBJECT),
+)
+
+
+def upgrade() -> None:
+    for table, column, default in _DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, _ in _DEFAULTS:
+        op.alter_column(table, column, server_default=None)
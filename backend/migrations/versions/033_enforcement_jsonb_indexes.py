@@ -0,0 +1,55 @@
+"""JSONB indexes on enforcement gates and gate executions
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-16 04:40:00.000000
+
+Lookups such as "gates tagged HIPAA" or "executions in which policy X
+failed" scanned the whole table:
+- enforcement_gates.metadata: GIN (jsonb_path_ops) for containment
+  filters (EnforcementGate.with_compliance_tag)
+- enforcement_gates (metadata ->> 'risk_level'): b-tree expression index
+  for equality on gate criticality
+- gate_executions.controls_evaluated: GIN (jsonb_path_ops) for
+  GateExecution.failed_policy
+
+gate_executions.kill_switches_checked and captured_evidence are not
+indexed: nothing filters on them, and every GIN index is paid for on
+each insert into the highest-volume enforcement table. The small
+configuration tables (kill_switches, tenants, workflows) are cheaper to
+scan than to index.
+
+Indexes are built CONCURRENTLY so gate executions keep being recorded.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gate_metadata_gin '
+            'ON enforcement_gates USING GIN (metadata jsonb_path_ops)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gate_risk_level '
+            "ON enforcement_gates ((metadata ->> 'risk_level'))"
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gate_exec_controls_gin '
+            'ON gate_executions USING GIN (controls_evaluated jsonb_path_ops)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_gate_exec_controls_gin')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_gate_risk_level')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_gate_metadata_gin')
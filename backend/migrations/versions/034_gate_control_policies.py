@@ -0,0 +1,81 @@
+"""Move enforcement_gates.control_policy_ids into an association table
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-16 05:10:00.000000
+
+control_policy_ids was a UUID[]: it could not be foreign-keyed (gates
+kept pointing at deleted policies), "which gates evaluate policy X" was
+a sequential scan over ANY(array), and adding or removing one policy
+rewrote the whole array. gate_control_policies holds one row per link:
+- PRIMARY KEY (gate_id, policy_id), both foreign keys ON DELETE CASCADE
+- position: identity column giving the evaluation order
+- idx_gate_control_policies_policy for lookups by policy
+
+Existing arrays are copied in array order; references to policies that
+no longer exist are dropped, since the foreign key cannot hold them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '034'
+down_revision = '033'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'gate_control_policies',
+        sa.Column(
+            'gate_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('enforcement_gates.id', ondelete='CASCADE'), primary_key=True,
+        ),
+        sa.Column(
+            'policy_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('control_policies.id', ondelete='CASCADE'), primary_key=True,
+        ),
+        sa.Column('position', sa.Integer(), sa.Identity(), nullable=False),
+    )
+    op.create_index('idx_gate_control_policies_policy', 'gate_control_policies', ['policy_id'])
+
+    # Explicit positions keep each gate's array order; the identity sequence
+    # is then moved past them so later links sort after existing ones
+    op.execute("""
+        INSERT INTO gate_control_policies (gate_id, policy_id, position)
+        OVERRIDING SYSTEM VALUE
+        SELECT g.id, link.policy_id, link.position
+        FROM enforcement_gates g
+        CROSS JOIN LATERAL unnest(g.control_policy_ids) WITH ORDINALITY AS link(policy_id, position)
+        WHERE EXISTS (SELECT 1 FROM control_policies p WHERE p.id = link.policy_id)
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("""
+        SELECT setval(
+            pg_get_serial_sequence('gate_control_policies', 'position'),
+            COALESCE((SELECT max(position) FROM gate_control_policies), 0) + 1,
+            false
+        )
+    """)
+    op.drop_column('enforcement_gates', 'control_policy_ids')
+
+
+def downgrade() -> None:
+    op.add_column('enforcement_gates', sa.Column(
+        'control_policy_ids', postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+        nullable=False, server_default='{}',
+    ))
+    op.execute("""
+        UPDATE enforcement_gates g
+        SET control_policy_ids = links.ids
+        FROM (
+            SELECT gate_id, array_agg(policy_id ORDER BY position) AS ids
+            FROM gate_control_policies
+            GROUP BY gate_id
+        ) links
+        WHERE links.gate_id = g.id
+    """)
+    op.drop_table('gate_control_policies')
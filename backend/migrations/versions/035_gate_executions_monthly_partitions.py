@@ -0,0 +1,158 @@
+"""Partition gate_executions by month
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-16 05:40:00.000000
+
+gate_executions gets one row per gate firing and is the highest-volume
+enforcement table. Like audit_events (016), it becomes
+PARTITION BY RANGE (executed_at) with one child per calendar month:
+- retention is `DROP TABLE gate_executions_YYYY_MM`, not DELETE + vacuum
+- analytics bounded on executed_at are pruned to the months they touch
+- executed_at gets a BRIN index (tiny, and exact enough for append-only
+  time order) in place of its b-tree
+
+The primary key becomes (id, executed_at), since unique constraints on
+a partitioned table must include the partition key, and new ids come
+from uuid_generate_v7() (021) so they are time-ordered too. Single-column
+indexes already covered by a composite (gate_id, actor_id, outcome) and
+the duplicate request_id index are not recreated.
+
+gate_executions_ensure_partitions(months_ahead) creates missing months;
+the application calls it with audit_events_ensure_partitions on startup
+and then daily (app.services.partition_maintainer). There is no DEFAULT
+partition (see 016).
+
+The migration rebuilds the table and copies existing rows, holding an
+exclusive lock on gate_executions for the duration.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '035'
+down_revision = '034'
+branch_labels = None
+depends_on = None
+
+# Indexes recreated on the partitioned parent (cascading to each partition)
+_INDEXES = (
+    'CREATE INDEX ix_gate_executions_gate_key ON gate_executions (gate_key)',
+    'CREATE INDEX ix_gate_executions_execution_id ON gate_executions (execution_id)',
+    'CREATE INDEX idx_gate_exec_gate_time ON gate_executions (gate_id, executed_at)',
+    'CREATE INDEX idx_gate_exec_outcome_time ON gate_executions (outcome, executed_at)',
+    'CREATE INDEX idx_gate_exec_actor ON gate_executions (actor_id, executed_at)',
+    'CREATE INDEX idx_gate_exec_request ON gate_executions (request_id)',
+    'CREATE INDEX idx_gate_exec_controls_gin ON gate_executions USING GIN (controls_evaluated jsonb_path_ops)',
+    'CREATE INDEX idx_gate_exec_executed_brin ON gate_executions USING BRIN (executed_at) WITH (pages_per_range = 32)',
+)
+
+# Indexes of the original heap table (downgrade)
+_HEAP_INDEXES = (
+    'CREATE INDEX ix_gate_executions_gate_id ON gate_executions (gate_id)',
+    'CREATE INDEX ix_gate_executions_gate_key ON gate_executions (gate_key)',
+    'CREATE INDEX ix_gate_executions_execution_id ON gate_executions (execution_id)',
+    'CREATE INDEX ix_gate_executions_request_id ON gate_executions (request_id)',
+    'CREATE INDEX ix_gate_executions_actor_id ON gate_executions (actor_id)',
+    'CREATE INDEX ix_gate_executions_outcome ON gate_executions (outcome)',
+    'CREATE INDEX ix_gate_executions_executed_at ON gate_executions (executed_at)',
+    'CREATE INDEX idx_gate_exec_gate_time ON gate_executions (gate_id, executed_at)',
+    'CREATE INDEX idx_gate_exec_outcome_time ON gate_executions (outcome, executed_at)',
+    'CREATE INDEX idx_gate_exec_actor ON gate_executions (actor_id, executed_at)',
+    'CREATE INDEX idx_gate_exec_request ON gate_executions (request_id)',
+    'CREATE INDEX idx_gate_exec_controls_gin ON gate_executions USING GIN (controls_evaluated jsonb_path_ops)',
+)
+
+_GATE_FK = (
+    'ALTER TABLE gate_executions ADD CONSTRAINT gate_executions_gate_id_fkey '
+    'FOREIGN KEY (gate_id) REFERENCES enforcement_gates (id) ON DELETE CASCADE'
+)
+
+
+def upgrade() -> None:
+    op.execute('LOCK TABLE gate_executions IN ACCESS EXCLUSIVE MODE')
+
+    op.execute(
+        'CREATE TABLE gate_executions_partitioned '
+        '(LIKE gate_executions INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) '
+        'PARTITION BY RANGE (executed_at)'
+    )
+    op.execute('ALTER TABLE gate_executions_partitioned ALTER COLUMN id SET DEFAULT uuid_generate_v7()')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gate_executions_create_partition(parent regclass, month date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            start_date date := date_trunc('month', month);
+            child text := format('gate_executions_%s', to_char(start_date, 'YYYY_MM'));
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                child, parent, start_date, start_date + interval '1 month'
+            );
+        END;
+        $$
+    """)
+
+    # Children for every month already recorded, through next month
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min(executed_at) FROM gate_executions), now())),
+                    date_trunc('month', now()) + interval '1 month',
+                    interval '1 month'
+                )::date
+            LOOP
+                PERFORM gate_executions_create_partition('gate_executions_partitioned', month);
+            END LOOP;
+        END;
+        $$
+    """)
+
+    op.execute('INSERT INTO gate_executions_partitioned SELECT * FROM gate_executions')
+    op.execute('DROP TABLE gate_executions')
+    op.execute('ALTER TABLE gate_executions_partitioned RENAME TO gate_executions')
+
+    op.execute('ALTER TABLE gate_executions ADD PRIMARY KEY (id, executed_at)')
+    op.execute(_GATE_FK)
+    for statement in _INDEXES:
+        op.execute(statement)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gate_executions_ensure_partitions(months_ahead integer DEFAULT 2)
+        RETURNS void LANGUAGE plpgsql AS $$
+        BEGIN
+            FOR i IN 0..months_ahead LOOP
+                PERFORM gate_executions_create_partition(
+                    'gate_executions', (date_trunc('month', now()) + make_interval(months => i))::date
+                );
+            END LOOP;
+        END;
+        $$
+    """)
+    op.execute('SELECT gate_executions_ensure_partitions(2)')
+
+
+def downgrade() -> None:
+    op.execute('LOCK TABLE gate_executions IN ACCESS EXCLUSIVE MODE')
+
+    op.execute(
+        'CREATE TABLE gate_executions_heap '
+        '(LIKE gate_executions INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)'
+    )
+    op.execute('ALTER TABLE gate_executions_heap ALTER COLUMN id SET DEFAULT gen_random_uuid()')
+    op.execute('INSERT INTO gate_executions_heap SELECT * FROM gate_executions')
+    op.execute('DROP TABLE gate_executions CASCADE')
+    op.execute('ALTER TABLE gate_executions_heap RENAME TO gate_executions')
+
+    op.execute('ALTER TABLE gate_executions ADD PRIMARY KEY (id)')
+    op.execute(_GATE_FK)
+    for statement in _HEAP_INDEXES:
+        op.execute(statement)
+
+    op.execute('DROP FUNCTION IF EXISTS gate_executions_ensure_partitions(integer)')
+    op.execute('DROP FUNCTION IF EXISTS gate_executions_create_partition(regclass, date)')
@@ -0,0 +1,54 @@
+"""Partial covering indexes for active gate and kill switch lookups
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-16 06:20:00.000000
+
+Gate evaluation runs two lookups on every request, and both only care
+about rows that are switched on:
+- idx_gate_active_partial: active gates by (gate_type, workflow_id),
+  INCLUDE (id, enforcement_mode); replaces idx_gate_active
+  (is_active, gate_type), which also indexed every inactive gate
+- idx_kill_switch_live: engaged kill switches by workflow_id,
+  INCLUDE (mode, auto_deactivate_at). Global switches have a NULL
+  workflow_id, which b-tree indexes too, so "for workflow X or global"
+  is served by this one index (KillSwitch.live_for_workflow)
+
+The INCLUDE columns let both be answered by index-only scans.
+
+Indexes are built CONCURRENTLY so gates and kill switches stay writable.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '036'
+down_revision = '035'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gate_active_partial '
+            'ON enforcement_gates (gate_type, workflow_id) INCLUDE (id, enforcement_mode) '
+            'WHERE is_active'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_gate_active')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_kill_switch_live '
+            'ON kill_switches (workflow_id) INCLUDE (mode, auto_deactivate_at) '
+            'WHERE is_active'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_kill_switch_live')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gate_active '
+            'ON enforcement_gates (is_active, gate_type)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_gate_active_partial')
@@ -0,0 +1,36 @@
+"""Partial index for the kill switch auto-release sweep
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-16 07:00:00.000000
+
+KillSwitchSweeper releases expired switches every few seconds with one
+UPDATE ... WHERE is_active AND auto_deactivate_at <= now(). This index
+holds only engaged switches that have a deadline, so each sweep is an
+index range scan over a handful of entries.
+
+Built CONCURRENTLY so kill switches stay writable.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '037'
+down_revision = '036'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_kill_switch_auto_deactivate '
+            'ON kill_switches (auto_deactivate_at) '
+            'WHERE is_active AND auto_deactivate_at IS NOT NULL'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_kill_switch_auto_deactivate')
@@ -0,0 +1,45 @@
+"""NOTIFY kill_switch_changed on every kill switch write
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-10-16 07:30:00.000000
+
+Workers keep engaged kill switches in memory (KillSwitchState) so gate
+checks do not query kill_switches. This trigger tells them what changed:
+after each INSERT, UPDATE or DELETE it sends the row's id on channel
+kill_switch_changed, and each listener re-reads just that switch.
+NOTIFY is transactional, so listeners only hear about committed changes.
+
+kill_switches is written rarely (activate, release, sweep), so a row
+trigger costs nothing measurable; gate_executions stays trigger-free.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '038'
+down_revision = '037'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION kill_switches_notify_change()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('kill_switch_changed', COALESCE(NEW.id, OLD.id)::text);
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute(
+        'CREATE TRIGGER kill_switches_notify_change '
+        'AFTER INSERT OR UPDATE OR DELETE ON kill_switches '
+        'FOR EACH ROW EXECUTE FUNCTION kill_switches_notify_change()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS kill_switches_notify_change ON kill_switches')
+    op.execute('DROP FUNCTION IF EXISTS kill_switches_notify_change()')
@@ -0,0 +1,271 @@
+"""Unit tests for AuditEventBuffer
+
+The buffer writes with a Core INSERT on the table, so its parameters
+must be keyed by column key ('metadata'), not by the AuditEventRow
+field (event_metadata). A batch the database rejects must not hold up
+the events behind it. These tests run without a database: a recording
+session stands in for AsyncSession.
+"""
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.audit_event import AuditEvent
+from app.services import audit_buffer
+from app.services.audit_buffer import _INSERT_QUERY, AuditEventBuffer
+
+
+class _Result:
+    """Stands in for a Result: no chain tail yet."""
+
+    def first(self):
+        return None
+
+
+class _RecordingSession:
+    """Records execute() calls; every result is empty."""
+
+    def __init__(self):
+        self.executed = []
+        self.committed = False
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return _Result()
+
+    async def commit(self):
+        self.committed = True
+
+
+class _Database:
+    """Session factory over a fake table that enforces valid_actor_type.
+
+    A batch holding an actor_type of 'INVALID' is rejected whole, as the
+    CHECK constraint would roll back the multi-row INSERT; the first
+    `disconnects` writes lose their connection instead.
+    """
+
+    def __init__(self, disconnects=0):
+        self.disconnects = disconnects
+        self.rows = []
+        self.attempts = 0
+
+    def __call__(self):
+        return _DatabaseSession(self)
+
+
+class _Tail:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def first(self):
+        if not self._rows:
+            return None
+        return self._rows[-1]["sequence_number"], self._rows[-1]["event_hash"]
+
+
+class _DatabaseSession:
+    def __init__(self, database):
+        self.database = database
+        self.pending = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        if params is None:
+            # Advisory lock, then the chain tail
+            return _Tail(self.database.rows)
+        self.database.attempts += 1
+        if self.database.disconnects:
+            self.database.disconnects -= 1
+            raise ConnectionResetError("connection reset by peer")
+        if any(row["actor_type"] == "INVALID" for row in params):
+            raise IntegrityError("INSERT", params, Exception("violates check constraint valid_actor_type"))
+        self.pending = params
+
+    async def commit(self):
+        self.database.rows.extend(self.pending)
+
+
+def _row(metadata=None, action="Created workflow"):
+    return AuditEvent.create_row(
+        event_type="WORKFLOW_CREATED",
+        action=action,
+        actor_id=uuid.uuid4(),
+        actor_type="USER",
+        outcome="SUCCESS",
+        context={"source": "test"},
+        metadata=metadata,
+    )
+
+
+@pytest.mark.unit
+class TestAuditEventRow:
+    """Test suite for AuditEventRow.insert_params."""
+
+    def test_insert_params_use_column_keys(self):
+        """event_metadata is sent as the 'metadata' column."""
+        params = _row({"ticket": "CHG-1"}).insert_params()
+
+        assert params["metadata"] == {"ticket": "CHG-1"}
+        assert "event_metadata" not in params
+        assert set(params) <= set(AuditEvent.__table__.c.keys())
+
+    def test_create_row_rejects_constraint_violations(self):
+        """Values the CHECK constraints would reject never reach the queue."""
+        with pytest.raises(ValueError):
+            AuditEvent.create_row(
+                event_type="X", action="x", actor_id=uuid.uuid4(),
+                actor_type="ROBOT", outcome="SUCCESS", context={},
+            )
+        with pytest.raises(ValueError):
+            AuditEvent.create_row(
+                event_type="X", action="x", actor_id=uuid.uuid4(),
+                actor_type="USER", outcome="DONE", context={},
+            )
+
+    def test_create_row_rejects_unhashable_context(self):
+        """Context the v2 hash cannot encode (non-string keys) is rejected."""
+        with pytest.raises(ValueError):
+            AuditEvent.create_row(
+                event_type="X", action="x", actor_id=uuid.uuid4(),
+                actor_type="USER", outcome="SUCCESS", context={1: "one"},
+            )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuditEventBufferWrite:
+    """Test suite for the batch INSERT."""
+
+    async def test_write_batch_sends_metadata(self):
+        """Every buffered row carries its metadata into the INSERT."""
+        db = _RecordingSession()
+        batch = [_row({"n": 1}), _row({"n": 2})]
+
+        await AuditEventBuffer._write_batch(db, batch)
+
+        statement, rows = db.executed[-1]
+        assert statement is _INSERT_QUERY
+        assert [row["metadata"] for row in rows] == [{"n": 1}, {"n": 2}]
+        assert db.committed
+
+    async def test_write_batch_chains_rows(self):
+        """Sequence numbers and hashes link each row to the one before."""
+        db = _RecordingSession()
+
+        await AuditEventBuffer._write_batch(db, [_row(), _row()])
+
+        _, rows = db.executed[-1]
+        assert [row["sequence_number"] for row in rows] == [1, 2]
+        assert rows[0]["previous_hash"] is None
+        assert rows[1]["previous_hash"] == rows[0]["event_hash"]
+
+    async def test_compiled_insert_binds_metadata(self):
+        """The compiled executemany statement binds the metadata column."""
+        db = _RecordingSession()
+        await AuditEventBuffer._write_batch(db, [_row({"n": 1})])
+        _, rows = db.executed[-1]
+
+        compiled = _INSERT_QUERY.compile(dialect=postgresql.dialect(), column_keys=list(rows[0]))
+
+        assert "metadata" in compiled.params
+        assert "metadata" in str(compiled)
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(audit_buffer, "_RETRY_DELAY_SECONDS", 0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuditEventBufferFailures:
+    """Test suite for rejected batches and lost connections."""
+
+    async def test_poisoned_row_does_not_block_later_rows(self, no_retry_delay):
+        """A rejected row is isolated and dropped; the rest are written in order."""
+        database = _Database()
+        buffer = AuditEventBuffer(session_maker=database, max_size=8, flush_interval=0.01)
+        rows = [_row(action=f"event {n}") for n in range(7)]
+        rows[3] = rows[3]._replace(actor_type="INVALID")
+        for row in rows:
+            await buffer.enqueue(row)
+        buffer.start()
+
+        later = _row(action="later")
+        await buffer.enqueue(later, wait=True)
+        await buffer.stop()
+
+        written = [params["action"] for params in database.rows]
+        assert written == [f"event {n}" for n in (0, 1, 2, 4, 5, 6)] + ["later"]
+        assert [params["sequence_number"] for params in database.rows] == [1, 2, 3, 4, 5, 6, 7]
+
+    async def test_rejected_waiter_is_told(self, no_retry_delay):
+        """A wait=True caller whose event is dropped gets the error."""
+        buffer = AuditEventBuffer(session_maker=_Database(), flush_interval=0.01)
+        buffer.start()
+
+        with pytest.raises(IntegrityError):
+            await buffer.enqueue(_row()._replace(actor_type="INVALID"), wait=True)
+        await buffer.stop()
+
+    async def test_lost_connection_is_retried_whole(self, no_retry_delay):
+        """Disconnects do not count as rejections: nothing is split or dropped."""
+        database = _Database(disconnects=AUDIT_ATTEMPTS + 2)
+        buffer = AuditEventBuffer(session_maker=database, flush_interval=0.01)
+        buffer.start()
+
+        await buffer.enqueue(_row(action="a"))
+        await buffer.enqueue(_row(action="b"), wait=True)
+        await buffer.stop()
+
+        assert [params["action"] for params in database.rows] == ["a", "b"]
+        assert database.attempts == AUDIT_ATTEMPTS + 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuditEventBufferBackPressure:
+    """Test suite for the high-water mark on the non-blocking path."""
+
+    async def test_blocks_past_high_water(self):
+        """Callers without wait=True block at 80% full; wait=True callers do not."""
+        buffer = AuditEventBuffer(session_maker=_Database(), queue_size=10)
+        for _ in range(8):
+            await asyncio.wait_for(buffer.enqueue(_row()), 0.1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(buffer.enqueue(_row()), 0.05)
+        critical = asyncio.create_task(buffer.enqueue(_row(), wait=True))
+        await asyncio.sleep(0)
+
+        assert buffer._queue.qsize() == 9
+        critical.cancel()
+
+    async def test_rejected_row_releases_blocked_callers(self, no_retry_delay):
+        """Callers blocked behind a rejected row resume once it is dropped."""
+        database = _Database()
+        buffer = AuditEventBuffer(session_maker=database, max_size=4, flush_interval=0.01, queue_size=10)
+        for n in range(8):
+            row = _row(action=f"event {n}")
+            await buffer.enqueue(row._replace(actor_type="INVALID") if n == 0 else row)
+        blocked = asyncio.create_task(buffer.enqueue(_row(action="blocked")))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        buffer.start()
+        await asyncio.wait_for(blocked, 1)
+        await buffer.stop()
+
+        assert [params["action"] for params in database.rows] == [f"event {n}" for n in range(1, 8)] + ["blocked"]
+
+
+AUDIT_ATTEMPTS = audit_buffer.AUDIT_TRAIL_MAX_WRITE_ATTEMPTS
@@ -0,0 +1,95 @@
+"""API tests for change request JSONB document validation
+
+Change requests are written with Core INSERT/UPDATE statements, which
+bypass the model's @validates hook, so impact_assessment and
+verification_criteria are checked by the request schemas. An invalid
+document must be refused with 422 before any SQL runs: the database
+session used here fails on first use.
+"""
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.change_requests import ChangeRequestCreate
+from app.db.database import get_db
+from app.main import app
+
+
+class _UnusedSession:
+    """Fails the test if the handler gets as far as the database."""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("invalid document reached the database")
+
+
+async def _unused_db():
+    yield _UnusedSession()
+
+
+@pytest.fixture
+def api_client():
+    app.dependency_overrides[get_db] = _unused_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _payload(**documents):
+    return {
+        "change_key": "chg-1",
+        "change_type": "WORKFLOW_DEPLOYMENT",
+        "risk_level": "LOW",
+        "title": "Deploy workflow",
+        "description": "Deploy the new version",
+        "rationale": "Bug fix",
+        "requested_by": str(uuid.uuid4()),
+        "requested_by_email": "requester@example.com",
+        **documents,
+    }
+
+
+IMPACT_ASSESSMENT = {
+    "affected_systems": ["api"],
+    "downtime_required": False,
+    "estimated_duration": 15,
+    "rollback_time": 5,
+    "data_impact": "none",
+    "compliance_impact": "none",
+}
+
+
+@pytest.mark.api
+class TestChangeRequestDocuments:
+    """Test suite for schema-bound documents on the write endpoints."""
+
+    def test_create_rejects_invalid_impact_assessment(self, api_client):
+        """A malformed impact assessment is a 422, not a stored row."""
+        invalid = {**IMPACT_ASSESSMENT, "downtime_required": "sometimes"}
+
+        response = api_client.post("/api/change-requests/", json=_payload(impact_assessment=invalid))
+
+        assert response.status_code == 422
+        [error] = response.json()["detail"]
+        assert error["loc"] == ["body", "impact_assessment", "downtime_required"]
+
+    def test_update_rejects_invalid_verification_criteria(self, api_client):
+        """The update body is checked the same way."""
+        response = api_client.put(
+            f"/api/change-requests/{uuid.uuid4()}",
+            json={"verification_criteria": [{"criterion": "error rate below 1%"}]},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:3] == ["body", "verification_criteria", 0]
+
+    def test_draft_documents_may_be_empty(self):
+        """A DRAFT may leave its documents empty, as the model allows."""
+        assert ChangeRequestCreate(**_payload()).impact_assessment == {}
+
+    def test_valid_documents_are_kept_as_given(self):
+        """Valid documents pass through unchanged (extra keys included)."""
+        impact = {**IMPACT_ASSESSMENT, "owner": "platform"}
+
+        body = ChangeRequestCreate(**_payload(impact_assessment=impact))
+
+        assert body.impact_assessment == impact
@@ -0,0 +1,140 @@
+"""Unit tests for change request transitions
+
+Each transition is one guarded UPDATE ... RETURNING (_guarded_update).
+A recording session captures the statement, which is compiled for
+PostgreSQL: compilation fails on any value that is not a ChangeRequest
+column. No database is needed.
+"""
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api import change_requests as api
+from app.db.models.change_request import ChangeStatus
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class _RecordingSession:
+    """Records execute() calls; the UPDATE returns `row`, scalar() returns `status`."""
+
+    def __init__(self, row=None, status=None):
+        self.row = row
+        self.status = status
+        self.executed = []
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, statement):
+        self.executed.append(statement)
+        return _Result(self.row)
+
+    async def scalar(self, statement):
+        return self.status
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def _compiled(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestChangeRequestTransitions:
+    """Test suite for the transition endpoints."""
+
+    async def test_submit(self):
+        """DRAFT moves to PENDING_APPROVAL, guarded on DRAFT."""
+        db = _RecordingSession(row=object())
+
+        await api.submit_for_approval(uuid.uuid4(), db=db)
+
+        compiled = _compiled(db.executed[0])
+        assert compiled.params["status"] is ChangeStatus.PENDING_APPROVAL
+        assert ChangeStatus.DRAFT in compiled.params.values()
+        assert db.committed
+
+    async def test_approve_sets_approver_columns(self):
+        """Approval records approver_id/approver_email and stamps approved_at."""
+        db = _RecordingSession(row=object())
+        approver = uuid.uuid4()
+        body = api.ChangeRequestApproval(approver_id=approver, approver_email="cab@example.com", approval_notes="ok")
+
+        await api.approve_change_request(uuid.uuid4(), body, db=db)
+
+        compiled = _compiled(db.executed[0])
+        sql = str(compiled)
+        assert compiled.params["approver_id"] == approver
+        assert compiled.params["status"] is ChangeStatus.APPROVED
+        assert "approved_at=now()" in sql
+        assert "approved_by" not in sql
+
+    async def test_reject(self):
+        """Rejection records the reason and stamps rejected_at."""
+        db = _RecordingSession(row=object())
+        body = api.ChangeRequestRejection(rejection_reason="too risky", rejected_by=uuid.uuid4())
+
+        await api.reject_change_request(uuid.uuid4(), body, db=db)
+
+        compiled = _compiled(db.executed[0])
+        assert compiled.params["status"] is ChangeStatus.REJECTED
+        assert "rejected_at=now()" in str(compiled)
+
+    async def test_implement_stamps_execution_window(self):
+        """Implementation completes the change in UTC on the execution columns."""
+        db = _RecordingSession(row=object())
+
+        await api.mark_implemented(uuid.uuid4(), db=db)
+
+        compiled = _compiled(db.executed[0])
+        sql = str(compiled)
+        assert compiled.params["status"] is ChangeStatus.COMPLETED
+        assert "execution_completed_at=timezone(" in sql
+        assert "execution_started_at=coalesce(change_requests.execution_started_at" in sql
+
+    @pytest.mark.parametrize("passed, outcome", [(True, ChangeStatus.COMPLETED), (False, ChangeStatus.FAILED)])
+    async def test_validate_records_verification(self, passed, outcome):
+        """Verification is recorded once, on a COMPLETED change."""
+        db = _RecordingSession(row=object())
+        body = api.ChangeRequestValidation(verification_passed=passed, verification_results={"smoke": passed})
+
+        await api.mark_validated(uuid.uuid4(), body, db=db)
+
+        compiled = _compiled(db.executed[0])
+        assert compiled.params["status"] is outcome
+        assert compiled.params["verification_completed"] is True
+        assert compiled.params["verification_passed"] is passed
+        assert "change_requests.verification_completed IS false" in str(compiled)
+
+    async def test_missing_request_is_404(self):
+        """No row and no status: the request does not exist."""
+        db = _RecordingSession(row=None, status=None)
+
+        with pytest.raises(HTTPException) as excinfo:
+            await api.submit_for_approval(uuid.uuid4(), db=db)
+
+        assert excinfo.value.status_code == 404
+        assert db.rolled_back
+
+    async def test_wrong_status_is_400(self):
+        """No row but a status: the guard rejected the transition."""
+        db = _RecordingSession(row=None, status=ChangeStatus.APPROVED)
+
+        with pytest.raises(HTTPException) as excinfo:
+            await api.submit_for_approval(uuid.uuid4(), db=db)
+
+        assert excinfo.value.status_code == 400
+        assert not db.committed
@@ -0,0 +1,187 @@
+"""Unit tests for gate evaluation
+
+evaluate_gate resolves kill switches either in SQL (the kill LATERAL,
+KillSwitch.live_for_workflow) or from KillSwitchState. Both paths must
+treat a switch past auto_deactivate_at as released. The query is checked
+compiled for PostgreSQL, and evaluate_gate runs against a scripted
+session, so no database is needed.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api import gates
+from app.db.models.enforcement_gate import GateOutcome
+from app.db.models.kill_switch import KillSwitch, KillSwitchMode
+from app.services import gate_evaluation
+from app.services.gate_evaluation import GateEvaluation, _evaluation_query, evaluate_gate
+from app.services.kill_switch_state import KillSwitchSnapshot, KillSwitchState
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _Session:
+    """Returns the scripted rows for the evaluation query."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    async def execute(self, statement):
+        self.executed.append(statement)
+        return _Result(self.rows)
+
+
+class _Policy:
+    def __init__(self, applies=True, blocking=False):
+        self.id = uuid.uuid4()
+        self.applies = applies
+        self.is_blocking = blocking
+
+    def evaluate_conditions(self, context):
+        return self.applies
+
+
+def _sql(element) -> str:
+    return str(element.compile(dialect=postgresql.dialect()))
+
+
+def _row(policy=None, kill_switch_id=None, kill_switch_mode=None, enforcement_mode="BLOCKING", require_all_pass=True):
+    return ("gate.deploy", uuid.uuid4(), True, enforcement_mode, require_all_pass, kill_switch_id, kill_switch_mode, policy)
+
+
+@pytest.fixture
+def offline_state(monkeypatch):
+    """A KillSwitchState that is not live: kill switches resolve in SQL."""
+    state = KillSwitchState()
+    monkeypatch.setattr(gate_evaluation, "get_kill_switch_state", lambda: state)
+    return state
+
+
+@pytest.mark.unit
+class TestKillSwitchExpiry:
+    """Test suite for the shared auto_deactivate_at rule."""
+
+    def test_live_for_workflow_excludes_expired(self):
+        """The SQL predicate drops switches past auto_deactivate_at."""
+        sql = _sql(KillSwitch.live_for_workflow(uuid.uuid4()))
+
+        assert "kill_switches.auto_deactivate_at IS NULL" in sql
+        assert "kill_switches.auto_deactivate_at > timezone(" in sql
+
+    def test_evaluation_query_applies_expiry(self):
+        """The kill LATERAL in the evaluation query uses the same rule."""
+        sql = _sql(_evaluation_query(uuid.uuid4(), {}))
+
+        assert "kill_switches.auto_deactivate_at > timezone(" in sql
+
+    def test_memory_lookup_applies_expiry(self):
+        """KillSwitchState.lookup skips the same expired switch."""
+        state = KillSwitchState()
+        state._store(KillSwitchSnapshot(
+            uuid.uuid4(), None, KillSwitchMode.HARD_STOP, datetime.utcnow() - timedelta(minutes=1),
+        ))
+
+        assert state.lookup(uuid.uuid4()) is None
+
+    def test_memory_path_leaves_kill_out_of_sql(self):
+        """With the state live, the query carries no kill LATERAL."""
+        sql = _sql(_evaluation_query(uuid.uuid4(), {}, kill_switch_in_sql=False))
+
+        assert "LATERAL" not in sql
+        assert "FROM kill_switches" not in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEvaluateGate:
+    """Test suite for evaluate_gate outcomes."""
+
+    async def test_missing_gate(self, offline_state):
+        """An unknown or inactive gate evaluates to None."""
+        assert await evaluate_gate(_Session([]), uuid.uuid4(), {}) is None
+
+    async def test_hard_stop(self, offline_state):
+        """An engaged HARD_STOP switch stops the gate."""
+        switch_id = uuid.uuid4()
+        db = _Session([_row(kill_switch_id=switch_id, kill_switch_mode=KillSwitchMode.HARD_STOP)])
+
+        evaluation = await evaluate_gate(db, uuid.uuid4(), {})
+
+        assert evaluation == GateEvaluation("gate.deploy", GateOutcome.HARD_STOP, switch_id, [], [])
+
+    async def test_other_mode_degrades(self, offline_state):
+        """Any other engaged mode degrades the gate."""
+        db = _Session([_row(kill_switch_id=uuid.uuid4(), kill_switch_mode=KillSwitchMode.READ_ONLY)])
+
+        evaluation = await evaluate_gate(db, uuid.uuid4(), {})
+
+        assert evaluation.outcome is GateOutcome.DEGRADE
+
+    async def test_blocking_policy(self, offline_state):
+        """A failing blocking policy blocks a BLOCKING gate."""
+        policy = _Policy(blocking=True)
+        db = _Session([_row(policy), _row(_Policy())])
+
+        evaluation = await evaluate_gate(db, uuid.uuid4(), {})
+
+        assert evaluation.outcome is GateOutcome.BLOCK
+        assert evaluation.failed_policy_ids == [policy.id]
+
+    async def test_monitoring_mode_warns(self, offline_state):
+        """The same failure only warns in MONITORING mode."""
+        db = _Session([_row(_Policy(blocking=True), enforcement_mode="MONITORING")])
+
+        evaluation = await evaluate_gate(db, uuid.uuid4(), {})
+
+        assert evaluation.outcome is GateOutcome.WARNING
+
+    async def test_live_state_resolves_switch(self, monkeypatch):
+        """With the state live, the switch comes from memory."""
+        state = KillSwitchState()
+        state._live = True
+        switch = KillSwitchSnapshot(uuid.uuid4(), None, KillSwitchMode.HARD_STOP, None)
+        state._store(switch)
+        monkeypatch.setattr(gate_evaluation, "get_kill_switch_state", lambda: state)
+
+        evaluation = await evaluate_gate(_Session([_row()]), uuid.uuid4(), {})
+
+        assert evaluation.outcome is GateOutcome.HARD_STOP
+        assert evaluation.kill_switch_id == switch.id
+
+
+class _Buffer:
+    def __init__(self):
+        self.rows = []
+
+    async def enqueue(self, row):
+        self.rows.append(row)
+
+
+@pytest.mark.api
+@pytest.mark.asyncio
+class TestEvaluateEndpoint:
+    """Test suite for POST /gates/{gate_id}/evaluate."""
+
+    async def test_records_execution(self, offline_state):
+        """The evaluation is returned and its execution queued."""
+        gate_id = uuid.uuid4()
+        policy = _Policy()
+        buffer = _Buffer()
+        body = gates.GateEvaluationRequest(execution_id=uuid.uuid4(), actor_id=uuid.uuid4(), actor_type="AGENT")
+
+        response = await gates.evaluate(gate_id, body, db=_Session([_row(policy)]), buffer=buffer)
+
+        assert response.outcome is GateOutcome.ALLOW
+        assert response.applicable_policy_ids == [policy.id]
+        [row] = buffer.rows
+        assert (row.gate_id, row.gate_key, row.outcome) == (gate_id, "gate.deploy", GateOutcome.ALLOW)
+        assert row.controls_evaluated == [{"policy_id": str(policy.id), "result": "PASS"}]
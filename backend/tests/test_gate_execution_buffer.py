@@ -0,0 +1,163 @@
+"""Unit tests for GateExecutionBuffer
+
+A recording session_maker stands in for async_session_maker, so batching,
+the INSERT parameters, bounded retries after a failed write and the
+drain on stop() run without a database.
+"""
+import asyncio
+import uuid
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.enforcement_gate import GateExecution, GateExecutionRow, GateOutcome
+from app.services import gate_execution_buffer
+from app.services.gate_execution_buffer import _INSERT_QUERY, GateExecutionBuffer
+
+
+class _Session:
+    def __init__(self, maker):
+        self._maker = maker
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        if self._maker.failures:
+            self._maker.failures -= 1
+            raise ConnectionError("connection lost")
+        if params is not None:
+            if any(row["actor_type"] == "INVALID" for row in params):
+                raise IntegrityError("INSERT", params, Exception("violates check constraint"))
+            self._maker.batches.append((statement, params))
+
+    async def commit(self):
+        pass
+
+
+class _SessionMaker:
+    """Records each batch INSERT; the first `failures` executes raise."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    def __call__(self):
+        return _Session(self)
+
+
+def _row(n=0):
+    return GateExecutionRow(
+        gate_id=uuid.uuid4(),
+        gate_key=f"gate.{n}",
+        execution_id=uuid.uuid4(),
+        actor_id=uuid.uuid4(),
+        actor_type="AGENT",
+        outcome=GateOutcome.ALLOW,
+        executed_at=datetime.utcnow(),
+    )
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(gate_execution_buffer, "_RETRY_DELAY_SECONDS", 0)
+
+
+@pytest.mark.unit
+class TestGateExecutionRow:
+    """Test suite for the row shape."""
+
+    def test_fields_are_column_keys(self):
+        """Every row field is a gate_executions column key, as the Core INSERT needs."""
+        assert set(GateExecutionRow._fields) <= set(GateExecution.__table__.c.keys())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGateExecutionBuffer:
+    """Test suite for batching, retry and shutdown."""
+
+    async def test_rows_written_in_batches(self):
+        """Queued rows go out max_size at a time, one INSERT per batch."""
+        maker = _SessionMaker()
+        buffer = GateExecutionBuffer(session_maker=maker, max_size=2, flush_interval=0.01)
+        rows = [_row(n) for n in range(5)]
+        for row in rows:
+            await buffer.enqueue(row)
+
+        buffer.start()
+        await buffer.stop()
+
+        assert [len(params) for _, params in maker.batches] == [2, 2, 1]
+        assert all(statement is _INSERT_QUERY for statement, _ in maker.batches)
+        written = [params["gate_key"] for _, batch in maker.batches for params in batch]
+        assert written == [row.gate_key for row in rows]
+
+    async def test_flush_interval_sends_partial_batch(self):
+        """A batch that does not fill is written once flush_interval passes."""
+        maker = _SessionMaker()
+        buffer = GateExecutionBuffer(session_maker=maker, max_size=100, flush_interval=0.01)
+        buffer.start()
+
+        await buffer.enqueue(_row())
+        for _ in range(50):
+            if maker.batches:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(maker.batches) == 1
+        await buffer.stop()
+
+    async def test_failed_batch_is_retried(self, no_retry_delay):
+        """A write that fails and then succeeds keeps the whole batch."""
+        maker = _SessionMaker(failures=1)
+        buffer = GateExecutionBuffer(session_maker=maker, max_size=10)
+
+        await buffer._write([_row(1), _row(2)])
+
+        assert [params["gate_key"] for params in maker.batches[0][1]] == ["gate.1", "gate.2"]
+
+    async def test_rejected_row_is_dropped_alone(self, no_retry_delay):
+        """A row the database rejects is isolated; the rows around it are written."""
+        maker = _SessionMaker()
+        buffer = GateExecutionBuffer(session_maker=maker, max_size=10, flush_interval=0.01)
+        rows = [_row(n) for n in range(5)]
+        rows[2] = rows[2]._replace(actor_type="INVALID")
+        for row in rows:
+            await buffer.enqueue(row)
+
+        buffer.start()
+        await buffer.enqueue(_row(9))
+        await buffer.stop()
+
+        written = [params["gate_key"] for _, batch in maker.batches for params in batch]
+        assert written == ["gate.0", "gate.1", "gate.3", "gate.4", "gate.9"]
+
+    async def test_unreachable_database_drops_batch(self, no_retry_delay):
+        """After the last attempt an unreachable batch is dropped, not requeued."""
+        attempts = gate_execution_buffer.GATE_EXECUTION_MAX_WRITE_ATTEMPTS
+        maker = _SessionMaker(failures=attempts)
+        buffer = GateExecutionBuffer(session_maker=maker, max_size=10, flush_interval=0.01)
+        buffer.start()
+
+        await buffer.enqueue(_row(1))
+        await buffer.enqueue(_row(2))
+        for _ in range(50):
+            if maker.failures == 0:
+                break
+            await asyncio.sleep(0.01)
+        await buffer.enqueue(_row(3))
+        await buffer.stop()
+
+        assert [params["gate_key"] for _, batch in maker.batches for params in batch] == ["gate.3"]
+
+    async def test_stop_without_start(self):
+        """stop() on a buffer that never started is a no-op."""
+        buffer = GateExecutionBuffer(session_maker=_SessionMaker())
+
+        await buffer.stop()
@@ -0,0 +1,182 @@
+"""Unit tests for KillSwitchState
+
+The engine is replaced with an in-memory fake, so lookups, refresh
+ordering and the LISTEN connection lifecycle run without PostgreSQL.
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.models.kill_switch import KillSwitchMode
+from app.services import kill_switch_state as module
+from app.services.kill_switch_state import KillSwitchSnapshot, KillSwitchState
+
+
+class _Result(list):
+    def first(self):
+        return self[0] if self else None
+
+
+class _FakeRaw:
+    """The asyncpg side of the LISTEN connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.termination_listeners = []
+        self.listeners = []
+
+    def is_closed(self):
+        return self.closed
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners.append(callback)
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.remove(callback)
+
+    def terminate(self):
+        self.closed = True
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        return await self._engine.reads.pop(0)()
+
+    async def commit(self):
+        pass
+
+    async def get_raw_connection(self):
+        return type("Fairy", (), {"driver_connection": self._engine.raw})()
+
+
+class _FakeEngine:
+    """engine.connect() stand-in; each execute() awaits the next scripted read."""
+
+    def __init__(self, reads=()):
+        self.reads = list(reads)
+        self.raw = _FakeRaw()
+
+    def connect(self):
+        return _FakeConnection(self)
+
+
+def _read(*rows, gate=None):
+    async def read():
+        if gate is not None:
+            await gate.wait()
+        return _Result(rows)
+    return read
+
+
+def _switch(workflow_id=None, mode=KillSwitchMode.HARD_STOP, auto_deactivate_at=None):
+    return KillSwitchSnapshot(uuid.uuid4(), workflow_id, mode, auto_deactivate_at)
+
+
+@pytest.mark.unit
+class TestKillSwitchStateLookup:
+    """Test suite for KillSwitchState.lookup."""
+
+    def test_workflow_and_global_scopes(self):
+        """A workflow sees its own switches and global ones."""
+        workflow_id = uuid.uuid4()
+        state = KillSwitchState()
+        own = _switch(workflow_id, KillSwitchMode.READ_ONLY)
+        state._store(own)
+
+        assert state.lookup(workflow_id) == own
+        assert state.lookup(uuid.uuid4()) is None
+
+    def test_hard_stop_first(self):
+        """A HARD_STOP wins over any other engaged mode."""
+        workflow_id = uuid.uuid4()
+        state = KillSwitchState()
+        state._store(_switch(workflow_id, KillSwitchMode.SOFT_STOP))
+        hard_stop = _switch(None, KillSwitchMode.HARD_STOP)
+        state._store(hard_stop)
+
+        assert state.lookup(workflow_id) == hard_stop
+
+    def test_expired_switch_is_released(self):
+        """A switch past auto_deactivate_at no longer applies."""
+        state = KillSwitchState()
+        state._store(_switch(None, auto_deactivate_at=datetime.utcnow() - timedelta(seconds=1)))
+
+        assert state.lookup(None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKillSwitchStateRefresh:
+    """Test suite for notification refreshes."""
+
+    async def test_refreshes_apply_in_order(self, monkeypatch):
+        """A slow earlier read cannot overwrite a later one for the same switch."""
+        switch = _switch(None)
+        gate = asyncio.Event()
+        # First notification reads the switch engaged (slowly); the second reads it released
+        monkeypatch.setattr(module, "engine", _FakeEngine([_read(tuple(switch), gate=gate), _read()]))
+        state = KillSwitchState()
+
+        first = asyncio.create_task(state._refresh(switch.id))
+        second = asyncio.create_task(state._refresh(switch.id))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, second)
+
+        assert state.lookup(None) is None
+
+    async def test_failed_refresh_falls_back_to_database(self, monkeypatch):
+        """A refresh that cannot read clears is_live."""
+        async def fail():
+            raise ConnectionError("gone")
+        monkeypatch.setattr(module, "engine", _FakeEngine([fail]))
+        state = KillSwitchState()
+        state._live = True
+
+        await state._refresh(uuid.uuid4())
+
+        assert not state.is_live
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKillSwitchStateListener:
+    """Test suite for the LISTEN connection lifecycle."""
+
+    async def test_termination_clears_live_immediately(self, monkeypatch):
+        """Losing the LISTEN connection stops memory lookups before the next resync."""
+        switch = _switch(None)
+        fake = _FakeEngine([_read(tuple(switch))])
+        monkeypatch.setattr(module, "engine", fake)
+        state = KillSwitchState(resync_interval=3600)
+
+        task = asyncio.create_task(state._listen())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert state.is_live
+        assert state.lookup(None) == switch
+
+        fake.raw.terminate()
+        assert not state.is_live
+
+        await asyncio.wait_for(task, 1)
+        assert not state.is_live
@@ -0,0 +1,91 @@
+"""Unit tests for PartitionMaintainer
+
+ensure_partitions (or the engine under it) is replaced with a recorder,
+so the schedule runs without PostgreSQL.
+"""
+import asyncio
+
+import pytest
+
+from app.db import database
+from app.services import partition_maintainer
+from app.services.partition_maintainer import PartitionMaintainer
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPartitionMaintainer:
+    """Test suite for the periodic partition run."""
+
+    async def test_runs_every_interval(self, monkeypatch):
+        """Partitions are ensured again on every tick, not only at startup."""
+        calls = []
+
+        async def ensure(months_ahead):
+            calls.append(months_ahead)
+        monkeypatch.setattr(partition_maintainer, "ensure_partitions", ensure)
+        maintainer = PartitionMaintainer(interval=0.01, months_ahead=3)
+
+        maintainer.start()
+        await asyncio.sleep(0.05)
+        await maintainer.stop()
+
+        assert len(calls) >= 2
+        assert set(calls) == {3}
+
+    async def test_failure_does_not_stop_the_loop(self, monkeypatch):
+        """A failed run is logged and retried on the next tick."""
+        calls = []
+
+        async def ensure(months_ahead):
+            calls.append(months_ahead)
+            if len(calls) == 1:
+                raise ConnectionError("database unavailable")
+        monkeypatch.setattr(partition_maintainer, "ensure_partitions", ensure)
+        maintainer = PartitionMaintainer(interval=0.01)
+
+        maintainer.start()
+        await asyncio.sleep(0.05)
+        await maintainer.stop()
+
+        assert len(calls) >= 2
+
+
+class _Connection:
+    def __init__(self, executed):
+        self.executed = executed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+
+
+class _Engine:
+    def __init__(self):
+        self.executed = []
+
+    def begin(self):
+        return _Connection(self.executed)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPartitionTables:
+    """Test suite for the tables a maintenance run covers."""
+
+    async def test_maintains_audit_and_gate_partitions(self, monkeypatch):
+        """One run ensures partitions for both partitioned tables."""
+        engine = _Engine()
+        monkeypatch.setattr(database, "engine", engine)
+
+        await PartitionMaintainer(months_ahead=2).maintain()
+
+        assert engine.executed == [
+            ("SELECT audit_events_ensure_partitions(:months_ahead)", {"months_ahead": 2}),
+            ("SELECT gate_executions_ensure_partitions(:months_ahead)", {"months_ahead": 2}),
+        ]
@@ -0,0 +1,121 @@
+"""Unit tests for QueryCache invalidation
+
+A list page is read from the database, then rendered or streamed, then
+stored. The namespace generation makes sure a write that invalidates in
+between is not overwritten by that stale page. Redis is replaced with a
+small in-memory fake whose script mirrors _SET_IF_GENERATION.
+"""
+import fnmatch
+
+import pytest
+
+from app.services.cache import QueryCache
+
+
+class _FakeScript:
+    """Python twin of the _SET_IF_GENERATION Lua script."""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __call__(self, keys, args):
+        key, generation_key = keys
+        generation, etag, body, ttl = args
+        if self.redis.data.get(generation_key, b"0") != str(generation).encode():
+            return 0
+        self.redis.data[key] = {b"etag": etag.encode(), b"body": body}
+        return 1
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def register_script(self, script):
+        return _FakeScript(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    async def hgetall(self, key):
+        return self.data.get(key, {})
+
+    async def scan_iter(self, match, count):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def unlink(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.fixture
+def cache():
+    cache = QueryCache()
+    cache.client = _FakeRedis()
+    cache._set_if_generation = cache.client.register_script(None)
+    return cache
+
+
+NAMESPACE = "cap:list"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestQueryCacheGeneration:
+    """Test suite for generation-guarded writes."""
+
+    async def test_store_and_hit(self, cache):
+        """Without an intervening write the page is cached."""
+        key = cache.make_key(NAMESPACE, {"limit": 100})
+        generation = await cache.generation(NAMESPACE)
+
+        await cache.set(key, '"etag"', b"[]", generation=generation)
+
+        assert await cache.get(key) == ('"etag"', b"[]")
+
+    async def test_invalidate_during_render_drops_stale_page(self, cache):
+        """A page read before a write is not stored after its invalidation."""
+        key = cache.make_key(NAMESPACE, {"limit": 100})
+        generation = await cache.generation(NAMESPACE)
+        # ... database read, then a concurrent write commits and invalidates ...
+        await cache.invalidate(NAMESPACE)
+
+        await cache.set(key, '"stale"', b"[]", generation=generation)
+
+        assert await cache.get(key) is None
+
+    async def test_invalidate_clears_entries(self, cache):
+        """Entries under the namespace are removed; the counter survives."""
+        key = cache.make_key(NAMESPACE, {"limit": 100})
+        await cache.set(key, '"etag"', b"[]", generation=await cache.generation(NAMESPACE))
+
+        await cache.invalidate(NAMESPACE)
+
+        assert await cache.get(key) is None
+        assert await cache.generation(NAMESPACE) == 1
+
+    async def test_namespaces_are_independent(self, cache):
+        """Invalidating one namespace does not block writes in another."""
+        key = cache.make_key("conn:list", {"limit": 100})
+        generation = await cache.generation("conn:list")
+        await cache.invalidate(NAMESPACE)
+
+        await cache.set(key, '"etag"', b"[]", generation=generation)
+
+        assert await cache.get(key) is not None
+
+    async def test_without_redis(self):
+        """With no REDIS_URL every call is a no-op and nothing is cached."""
+        cache = QueryCache(redis_url=None)
+        cache.client = None
+
+        assert await cache.generation(NAMESPACE) is None
+        await cache.set("cap:list:x", '"etag"', b"[]", generation=None)
+        assert await cache.get("cap:list:x") is None
@@ -0,0 +1,71 @@
+"""Unit tests for response_select and json_projection
+
+Several models map a column stored as "metadata" to a renamed attribute
+(capability_metadata, change_metadata, ...). The projections must select
+those columns under the attribute key the response schema reads.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.capabilities import CapabilityResponse
+from app.api.response_cache import ResponseCache, json_projection, response_select
+from app.db.models.capability import Capability, RiskLevel
+
+
+def _sql(element) -> str:
+    return str(element.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestResponseSelect:
+    """Test suite for response_select."""
+
+    def test_selects_renamed_metadata_column(self):
+        """The 'metadata' column comes back labelled capability_metadata."""
+        query = response_select(Capability, CapabilityResponse)
+
+        assert "capability_metadata" in query.selected_columns.keys()
+        assert "capabilities.metadata AS capability_metadata" in _sql(query)
+
+    def test_includes_id_and_updated_at(self):
+        """The response cache key columns are always selected."""
+        keys = response_select(Capability, CapabilityResponse).selected_columns.keys()
+
+        assert "id" in keys
+        assert "updated_at" in keys
+
+    def test_row_serializes_metadata(self):
+        """A row shaped like the SELECT serializes metadata under its JSON key."""
+        query = response_select(Capability, CapabilityResponse)
+        values = {key: None for key in query.selected_columns.keys()}
+        values.update(
+            id=uuid.uuid4(),
+            name="export",
+            risk_level=RiskLevel.LOW,
+            requires_approval=False,
+            allowed_environments=["dev"],
+            constraints={},
+            capability_metadata={"owner": "ops"},
+            is_active=True,
+            updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        row = type("Row", (), values)()
+
+        data = ResponseCache(CapabilityResponse).serialize(row)
+
+        assert data["metadata"] == {"owner": "ops"}
+
+
+@pytest.mark.unit
+class TestJsonProjection:
+    """Test suite for json_projection."""
+
+    def test_keys_by_serialization_alias(self):
+        """Renamed attributes are emitted under the schema's JSON key."""
+        sql = _sql(json_projection(Capability, CapabilityResponse))
+
+        assert "'metadata', capabilities.metadata" in sql
+        assert "'capability_metadata'" not in sql